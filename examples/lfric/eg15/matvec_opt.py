@@ -35,31 +35,36 @@
 # Modified: S. Siso, STFC Daresbury Lab.
 
 '''An example PSyclone transformation script to demonstrate
-optimisations to the matrix vector kernel to improve its performance
+optimisations to the matrix vector kernels to improve their performance
 on CPUs.
 
 The matrix vector kernel has been hand optimised for CPUs. This script
 will automate these optimisations.
 
 Optimising matvec in PSyclone is work in progress. At the moment the
-only automated optimisations possible are the replacement of the
-matmul intrinsic with inline code and the kernel constant
-transformation (see eg13). The latter transformation does little to
-matvec as it stands so the only optimisation included in this script
-is the former transformation.
+following optimisations are applied to the matrix vector kernels
+('matrix_vector_code' and 'dg_matrix_vector_code'):
+
+1) replace the matmul intrinsic with inline code
+2) for perfectly-nested (df1, df2, k) loops, interchange the loops so
+   that the vertical k loop (which has stride-1 accesses to the matrix,
+   as the first index of the matrix is the fastest varying) is innermost
+3) tile the (df1, df2, k) loop nest and mark the innermost (k) loop of
+   the tile as vectorisable with an OpenMP simd directive
+4) loop fuse the scatter loop with the matmul loop
+5) remove the gather and scatter by replacing the local copies of the
+   field data with direct (indirectly-addressed) accesses to the fields
+
+6) specialise each call of a matrix vector kernel for the function
+   spaces of its operator (when these are known, see OPERATOR_SPACES) by
+   making ndf1 and ndf2 constants in the kernel. As the kernel is then
+   modified, PSyclone writes a separate copy of it for every call.
 
 Below is a list of things that will be implemented to improve
 performance but are not yet supported as transformations in PSyclone.
 
-1) loop fuse gather and matmul loop
-2) move indexing lookup before scatter loop
-3) loop fuse scatter loop and matmul loop
-4) remove scatter and gather
-5) interchange k loop to make it inner
-6) re-order data-layout for matrix
-7) replicate kernel to support specific function spaces (psy-layer
-   optimisation)
-8) add kernel constants for nlayers, ndf2, ndf1 (existing transformation)
+1) move indexing lookup before scatter loop
+2) add a kernel constant for nlayers (existing transformation)
 
 This script can be applied via the '-s' option when running PSyclone:
 
@@ -68,43 +73,325 @@ $ psyclone -api lfric -s ./matvec_opt.py \
 -oalg /dev/null -opsy /dev/null
 
 '''
-import sys
-from psyclone.psyir.nodes import IntrinsicCall
-from psyclone.psyir.transformations import Matmul2CodeTrans
+from psyclone.psyir.nodes import (
+    ArrayReference, Assignment, IntrinsicCall, Loop, Reference, Routine)
+from psyclone.psyir.transformations import (
+    LoopFuseTrans, LoopSwapTrans, LoopTilingTrans, Matmul2CodeTrans,
+    OMPSimdTrans, TransformationError)
 from psyclone.psyir.backend.fortran import FortranWriter
+from psyclone.transformations import LFRicKernelConstTrans
+
+# The names of the matrix vector kernels to optimise
+MATVEC_KERNELS = ["matrix_vector_code", "dg_matrix_vector_code"]
+
+# The tile sizes for the (df1, df2, k) loops, outermost loop first
+TILE_SIZES = [8, 8, 64]
+
+# The polynomial order of the elements (in both the horizontal and the
+# vertical) used by the model.
+ELEMENT_ORDER = 0
+
+# The (to, from) function spaces of the operators passed to the matrix
+# vector kernels, as the kernel metadata only specifies generic function
+# spaces. The other operators in this example depend on the configuration
+# of the model (e.g. the buoyancy space), so their kernels are not
+# specialised.
+OPERATOR_SPACES = {"div": ("w3", "w2"),
+                   "m3_inv": ("w3", "w3")}
+
+# The options for the simd directive of the innermost loop of a tile. The
+# matrix is not declared as aligned as the LFRic infrastructure does not
+# guarantee the alignment of its data.
+SIMD_OPTIONS = {"safelen": 8}
+
+
+def nest_depth(loop):
+    '''
+    :param loop: the outermost loop of a loop nest.
+    :type loop: :py:class:`psyclone.psyir.nodes.Loop`
+
+    :returns: the number of perfectly-nested loops starting at loop.
+    :rtype: int
+
+    '''
+    depth = 1
+    while (len(loop.loop_body.children) == 1 and
+           isinstance(loop.loop_body[0], Loop)):
+        loop = loop.loop_body[0]
+        depth += 1
+    return depth
+
+
+def sink_vertical_loop(loop):
+    '''Interchange the loops of a perfectly-nested loop nest so that the
+    vertical 'k' loop becomes the innermost loop.
+
+    :param loop: the outermost loop of the loop nest.
+    :type loop: :py:class:`psyclone.psyir.nodes.Loop`
+
+    :returns: the outermost loop of the (possibly interchanged) loop nest.
+    :rtype: :py:class:`psyclone.psyir.nodes.Loop`
+
+    '''
+    parent = loop.parent
+    position = loop.position
+    k_loops = [inner for inner in loop.walk(Loop)
+               if inner.variable.name.lower() == "k"]
+    if not k_loops:
+        return loop
+    k_loop = k_loops[0]
+    try:
+        while nest_depth(k_loop) > 1:
+            LoopSwapTrans().apply(k_loop)
+    except TransformationError as err:
+        print(f"Could not move the k loop innermost: {err.value}")
+    return parent.children[position]
+
+
+def local_copy_array(loop):
+    '''
+    :param loop: a candidate gather or scatter loop.
+    :type loop: :py:class:`psyclone.psyir.nodes.Loop`
+
+    :returns: the assignment if the loop body is a single assignment that
+        copies into (gather) or out of (scatter) a local array indexed by
+        the loop variable, otherwise None.
+    :rtype: Optional[:py:class:`psyclone.psyir.nodes.Assignment`]
+
+    '''
+    if (len(loop.loop_body.children) != 1 or
+            not isinstance(loop.loop_body[0], Assignment)):
+        return None
+    assign = loop.loop_body[0]
+    for array in (assign.lhs, assign.rhs):
+        if (isinstance(array, ArrayReference) and
+                array.symbol.is_automatic and len(array.indices) == 1 and
+                isinstance(array.indices[0], Reference) and
+                array.indices[0].symbol is loop.variable):
+            return assign
+    return None
+
+
+def only_accessed_in(symbol, node):
+    '''
+    :param symbol: a local symbol of a kernel.
+    :type symbol: :py:class:`psyclone.psyir.symbols.DataSymbol`
+    :param node: the node within the kernel to search.
+    :type node: :py:class:`psyclone.psyir.nodes.Node`
+
+    :returns: whether all references to symbol in the kernel are within node.
+    :rtype: bool
+
+    '''
+    routine = node.ancestor(Routine, include_self=True)
+    all_refs = [ref for ref in routine.walk(Reference)
+                if ref.symbol is symbol]
+    refs = [ref for ref in node.walk(Reference) if ref.symbol is symbol]
+    return len(all_refs) == len(refs)
+
+
+def remove_unused_symbol(symbol, routine):
+    '''Remove symbol from the symbol table of routine if it is no longer
+    referenced.
+
+    :param symbol: a local symbol of the kernel.
+    :type symbol: :py:class:`psyclone.psyir.symbols.DataSymbol`
+    :param routine: the kernel.
+    :type routine: :py:class:`psyclone.psyir.nodes.Routine`
+
+    '''
+    if not any(ref.symbol is symbol for ref in routine.walk(Reference)):
+        routine.symbol_table.remove(symbol)
+
+
+def fuse_scatter(loop):
+    '''Loop fuse loop with the scatter loop that follows it (if any) and
+    then replace the local array in the fused loop with a direct access to
+    the field being scattered into, removing the scatter. For example::
+
+        do i = 1, ndf1
+          lhs_e(i) = ...
+        end do
+        do df = 1, ndf1
+          lhs(map1(df)+k) = lhs_e(df)
+        end do
+
+    becomes::
+
+        do i = 1, ndf1
+          lhs(map1(i)+k) = ...
+        end do
+
+    :param loop: the candidate loop to fuse with the scatter loop.
+    :type loop: :py:class:`psyclone.psyir.nodes.Loop`
+
+    '''
+    scatter_loop = loop.parent.children[loop.position + 1] \
+        if loop.position + 1 < len(loop.parent.children) else None
+    if not isinstance(scatter_loop, Loop):
+        return
+    scatter = local_copy_array(scatter_loop)
+    if not scatter or not isinstance(scatter.rhs, ArrayReference):
+        return
+    local = scatter.rhs.symbol
+    routine = loop.ancestor(Routine)
+    try:
+        LoopFuseTrans().apply(loop, scatter_loop)
+    except TransformationError as err:
+        print(f"Could not fuse the scatter loop in '{routine.name}': "
+              f"{err.value}")
+        return
+    scatter = loop.loop_body[-1]
+    # Every access to the local array must be at the loop index
+    refs = [ref for ref in loop.walk(Reference) if ref.symbol is local]
+    if not (only_accessed_in(local, loop) and
+            all(isinstance(ref, ArrayReference) and
+                ref.indices[0].symbol is loop.variable for ref in refs)):
+        return
+    for ref in refs:
+        if ref is not scatter.rhs:
+            ref.replace_with(scatter.lhs.copy())
+    scatter.detach()
+    remove_unused_symbol(local, routine)
+
+
+def remove_gather(loop):
+    '''Remove a gather loop by replacing each access to the local array
+    that it writes with the gathered expression. For example::
+
+        do df = 1, ndf2
+          x_e(df) = x(map2(df)+k)
+        end do
+        ... x_e(j) ...
+
+    becomes::
+
+        ... x(map2(j)+k) ...
+
+    :param loop: the candidate gather loop.
+    :type loop: :py:class:`psyclone.psyir.nodes.Loop`
+
+    '''
+    gather = local_copy_array(loop)
+    if not gather or not isinstance(gather.lhs, ArrayReference):
+        return
+    local = gather.lhs.symbol
+    routine = loop.ancestor(Routine)
+    # The local array must only be read after the gather loop (and within
+    # the same loop body) and the gathered values must not be modified
+    # in the meantime.
+    following = loop.parent.children[loop.position + 1:]
+    reads = [ref for node in following for ref in node.walk(Reference)
+             if ref.symbol is local]
+    gathered = {ref.symbol for ref in gather.rhs.walk(Reference)}
+    written = {assign.lhs.symbol for node in following
+               for assign in node.walk(Assignment)}
+    if (len(reads) + 1 != len([ref for ref in routine.walk(Reference)
+                               if ref.symbol is local]) or
+            gathered & written or
+            any(ref.is_write or not isinstance(ref, ArrayReference)
+                for ref in reads)):
+        return
+    for ref in reads:
+        expr = gather.rhs.copy()
+        for index_ref in expr.walk(Reference):
+            if index_ref.symbol is loop.variable:
+                index_ref.replace_with(ref.indices[0].copy())
+        ref.replace_with(expr)
+    loop.detach()
+    remove_unused_symbol(local, routine)
+
+
+def specialise_kernel(kernel):
+    '''Make the number of dofs of the function spaces of the operator
+    argument of the supplied kernel call constants in the kernel, using the
+    concrete function spaces in OPERATOR_SPACES.
+
+    :param kernel: the matrix vector kernel call.
+    :type kernel: :py:class:`psyclone.domain.lfric.LFRicKern`
+
+    '''
+    for arg in kernel.arguments.args:
+        if arg.argument_type == "gh_operator":
+            operator = arg
+            break
+    else:
+        return
+    if operator.name.lower() not in OPERATOR_SPACES:
+        return
+    to_space, from_space = OPERATOR_SPACES[operator.name.lower()]
+    function_spaces = {operator.function_space_to.orig_name: to_space,
+                       operator.function_space_from.orig_name: from_space}
+    print(f"Specialising '{kernel.name}' for operator '{operator.name}' "
+          f"({to_space} <- {from_space}):")
+    try:
+        LFRicKernelConstTrans().apply(
+            kernel, {"element_order_h": ELEMENT_ORDER,
+                     "element_order_v": ELEMENT_ORDER,
+                     "function_spaces": function_spaces})
+    except TransformationError as err:
+        print(f"Could not specialise '{kernel.name}': {err.value}")
 
 
 def trans(psyir):
     '''PSyclone transformation script for the LFRic API to optimise
-    the matvec kernel for many-core CPUs. For the moment simply find
-    the first matvec kernel in the example, transform the matmul
-    intrinsic to equivalant inline code and then print out its PSyIR
-    representation and output it as Fortran using the PSyIR Fortran
-    back-end.
+    the matvec kernels for many-core CPUs. For each matrix vector kernel,
+    transform the matmul intrinsic to equivalent inline code, make the
+    vertical loop the innermost loop, tile the resulting loop nest and
+    vectorise the innermost loop of the tile. Where the function spaces of
+    the operator are known, the kernel is also specialised for them.
+    Any gather and scatter loops are removed by fusing them with the
+    matmul loop.
+    The result is output as Fortran using the PSyIR Fortran back-end.
 
     :param psyir: the PSyIR of the PSy-layer.
     :type psyir: :py:class:`psyclone.psyir.nodes.FileContainer`
 
     '''
     matmul2code_trans = Matmul2CodeTrans()
+    tiling_trans = LoopTilingTrans()
+    simd_trans = OMPSimdTrans()
     fortran_writer = FortranWriter()
+    printed = set()
 
     for kernel in psyir.coded_kernels():
-        if kernel.name.lower() == "matrix_vector_kernel_code":
-            kernel_schedules = kernel.get_callees()
-            # For simplicity, ASSUME that the kernel is not polymorphic and
-            # thus only has one schedule.
-            kernel_schedule = kernel_schedules[0]
-            # Replace matmul with inline code
-            for icall in kernel_schedule.walk(IntrinsicCall):
-                if icall.intrinsic is IntrinsicCall.Intrinsic.MATMUL:
-                    matmul2code_trans.apply(icall)
-            # Future optimisations will go here.
-            print(kernel_schedule.view())
-            result = fortran_writer(kernel_schedule)
-            print(result)
-            # Abort after the first matrix vector kernel for the
-            # time being.
-            print("Aborting to view the modifications to the matrix "
-                  "vector kernel")
-            sys.exit()
+        if kernel.name.lower() not in MATVEC_KERNELS:
+            continue
+        specialise_kernel(kernel)
+        kernel_schedules = kernel.get_callees()
+        # For simplicity, ASSUME that the kernel is not polymorphic and
+        # thus only has one schedule.
+        kernel_schedule = kernel_schedules[0]
+        # Replace matmul with inline code
+        for icall in kernel_schedule.walk(IntrinsicCall):
+            if icall.intrinsic is IntrinsicCall.Intrinsic.MATMUL:
+                matmul2code_trans.apply(icall)
+        # Fuse the scatter with the matmul and remove the gather
+        for loop in kernel_schedule.walk(Loop):
+            if loop.parent and local_copy_array(loop) is None:
+                fuse_scatter(loop)
+        for loop in kernel_schedule.walk(Loop):
+            if loop.parent:
+                remove_gather(loop)
+        # Move the vertical loop innermost and tile the loop nest
+        for loop in kernel_schedule.walk(Loop, stop_type=Loop):
+            if nest_depth(loop) != len(TILE_SIZES):
+                continue
+            loop = sink_vertical_loop(loop)
+            parent = loop.parent
+            position = loop.position
+            try:
+                tiling_trans.apply(loop, tiledims=TILE_SIZES)
+            except TransformationError as err:
+                print(f"Could not tile the loop nest in "
+                      f"'{kernel_schedule.name}': {err.value}")
+                continue
+            inner_loop = parent.children[position].walk(Loop)[-1]
+            try:
+                simd_trans.apply(inner_loop, options=SIMD_OPTIONS)
+            except TransformationError as err:
+                print(f"Could not vectorise the inner loop in "
+                      f"'{kernel_schedule.name}': {err.value}")
+        if kernel.name.lower() not in printed:
+            printed.add(kernel.name.lower())
+            print(fortran_writer(kernel_schedule))
@@ -59,6 +59,18 @@ RESOLVE_IMPORTS = NEMO_MODULES_TO_IMPORT
 # array privatisation is disabled.
 NEMOV4 = os.environ.get('NEMOV4', False)
 
+# The number of nested loops that each OpenMP loop directive attempts to
+# collapse.
+COLLAPSE = 2
+
+# An environment variable can request OpenMP (5.1) tiling of perfectly-nested
+# loops, by providing the tile sizes as a comma-separated list, outermost
+# loop first (e.g. TILE_SIZES="8,32,32" for jk, jj, ji in NEMO). Tiling is
+# disabled by default since many compilers do not support the tile directive.
+TILE_SIZES = os.environ.get('TILE_SIZES', None)
+if TILE_SIZES:
+    TILE_SIZES = tuple(int(size) for size in TILE_SIZES.split(","))
+
 # List of all files that psyclone will skip processing
 FILES_TO_SKIP = []
 
@@ -85,6 +97,12 @@ def trans(psyir):
     omp_loop_trans = OMPLoopTrans(omp_schedule="static")
     omp_loop_trans.omp_directive = "paralleldo"
 
+    # These options only depend on the file being processed, so compute them
+    # once rather than for every subroutine in it.
+    loopify_array_intrinsics = psyir.name != "getincom.f90"  # See #3022
+    parallelise = psyir.name not in PARALLELISATION_ISSUES
+    privatise_arrays = not NEMOV4 and psyir.name not in PRIVATISATION_ISSUES
+
     for subroutine in psyir.walk(Routine):
         print(f"Adding OpenMP threading to subroutine: {subroutine.name}")
 
@@ -97,19 +115,18 @@ def trans(psyir):
                 subroutine,
                 hoist_local_arrays=False,
                 convert_array_notation=True,
-                # See issue #3022
-                loopify_array_intrinsics=psyir.name != "getincom.f90",
+                loopify_array_intrinsics=loopify_array_intrinsics,
                 convert_range_loops=True,
                 hoist_expressions=False,
                 scalarise_loops=False
         )
 
-        if psyir.name not in PARALLELISATION_ISSUES:
+        if parallelise:
             insert_explicit_loop_parallelism(
                     subroutine,
                     region_directive_trans=omp_parallel_trans,
                     loop_directive_trans=omp_loop_trans,
-                    collapse=False,
-                    privatise_arrays=(not NEMOV4 and
-                                      psyir.name not in PRIVATISATION_ISSUES)
+                    collapse=COLLAPSE,
+                    privatise_arrays=privatise_arrays,
+                    tile_sizes=TILE_SIZES
             )
@@ -35,7 +35,7 @@
 
 ''' Utilities file to parallelise Nemo code. '''
 
-from typing import List, Union
+from typing import List, Optional, Tuple, Union
 
 from psyclone.domain.common.transformations import KernelModuleInlineTrans
 from psyclone.psyir.nodes import (
@@ -47,7 +47,7 @@ from psyclone.psyir.symbols import (
 from psyclone.psyir.transformations import (
     ArrayAssignment2LoopsTrans, HoistLoopBoundExprTrans, HoistLocalArraysTrans,
     HoistTrans, InlineTrans, Maxval2LoopTrans, OMPMinimiseSyncTrans,
-    ProfileTrans, Reference2ArrayRangeTrans, ScalarisationTrans)
+    OMPTileTrans, ProfileTrans, Reference2ArrayRangeTrans, ScalarisationTrans)
 from psyclone.transformations import TransformationError
 
 # USE statements to chase to gather additional symbol information.
@@ -413,10 +413,11 @@ def insert_explicit_loop_parallelism(
         schedule,
         region_directive_trans=None,
         loop_directive_trans=None,
-        collapse: bool = True,
+        collapse: Union[bool, int] = True,
         privatise_arrays: bool = False,
         asynchronous_parallelism: bool = False,
         uniform_intrinsics_only: bool = False,
+        tile_sizes: Optional[Tuple[int, ...]] = None,
         ):
     ''' For each loop in the schedule that doesn't already have a Directive
     as an ancestor, attempt to insert the given region and loop directives.
@@ -432,13 +433,18 @@ def insert_explicit_loop_parallelism(
     :type loop_directive_trans: \
         :py:class:`psyclone.transformation.Transformation`
     :param collapse: whether to attempt to insert the collapse clause to as
-        many nested loops as possible.
+        many nested loops as possible, or the maximum number of loops to
+        collapse.
     :param privatise_arrays: whether to attempt to privatise arrays that cause
         write-write race conditions.
     :param asynchronous_parallelism: whether to attempt to add asynchronocity
     to the parallel sections.
     :param uniform_intrinsics_only: if True it prevent offloading loops
         with non-reproducible device intrinsics.
+    :param tile_sizes: if provided, attempt to add an OpenMP tile directive
+        with these sizes (outermost loop first) to each parallelised loop
+        nest. The loops over the tiles are then the ones parallelised (and
+        collapsed) by the loop directive.
 
     '''
     if schedule.name == "ts_wgt":
@@ -507,6 +513,16 @@ def insert_explicit_loop_parallelism(
             # associted to the loop in the generated output.
             continue
 
+        if tile_sizes:
+            try:
+                # Only perfectly-nested loops without dependencies can be
+                # tiled, otherwise keep the untiled parallel loop.
+                OMPTileTrans().apply(loop, options={"tile_sizes": tile_sizes})
+            except TransformationError:
+                # This loop nest cannot be tiled, keep the untiled parallel
+                # loop and proceed to next loop.
+                continue
+
     # If we are adding asynchronous parallelism then we now try to minimise
     # the number of barriers.
     if asynchronous_parallelism:
@@ -38,6 +38,9 @@
 
 '''This module provides management of variable access information.'''
 
+from functools import lru_cache
+import sys
+
 from psyclone.errors import InternalError
 from psyclone.psyir.symbols import DataSymbol, INTEGER_TYPE
 
@@ -63,24 +66,84 @@ class Signature:
     :type sub_sig: :py:class:`psyclone.core.Signature`
 
     '''
+    # A signature is immutable and stored as the single string of its
+    # components joined by '%'. This string is interned, so that the
+    # (cached) string hash and comparisons are cheap, and it is also the
+    # string representation of the signature. The tuple of components is
+    # only created when it is required.
+    __slots__ = ("_joined", "_components")
+
     def __init__(self, variable, sub_sig=None):
+        # Dispatch on the concrete type of the argument, which avoids a
+        # chain of isinstance tests for the common cases.
+        try:
+            to_joined = _TO_JOINED[type(variable)]
+        except KeyError:
+            # Fall back to isinstance to support subclasses.
+            for var_type, to_joined in _TO_JOINED.items():
+                if isinstance(variable, var_type):
+                    break
+            else:
+                raise InternalError(f"Got unexpected type "
+                                    f"'{type(variable).__name__}' in "
+                                    f"Signature constructor")
+        joined = to_joined(variable)
         if sub_sig:
-            sub_tuple = sub_sig._signature
-        else:
-            # null-tuple
-            sub_tuple = ()
-        if isinstance(variable, str):
-            self._signature = tuple(variable.split("%")) + sub_tuple
-        elif isinstance(variable, tuple):
-            self._signature = variable + sub_tuple
-        elif isinstance(variable, list):
-            self._signature = tuple(variable) + sub_tuple
+            joined = (f"{joined}%{sub_sig._joined}" if joined
+                      else sub_sig._joined)
+            components = None
         elif isinstance(variable, Signature):
-            self._signature = variable._signature + sub_tuple
+            components = variable._components
+        elif isinstance(variable, (tuple, list)):
+            # The components are already available at no extra cost.
+            components = (variable if isinstance(variable, tuple)
+                          else tuple(variable))
         else:
-            raise InternalError(f"Got unexpected type "
-                                f"'{type(variable).__name__}' in Signature "
-                                f"constructor")
+            components = None
+        self._joined = sys.intern(joined)
+        self._components = _checked_components(joined, components)
+
+    # ------------------------------------------------------------------------
+    @classmethod
+    def from_components(cls, components):
+        '''Creates a Signature from all of its components in one step.
+        This avoids building the signature of a structure access one
+        level at a time using the `sub_sig` argument of the constructor.
+
+        :param components: the components of the signature.
+        :type components: Iterable[str]
+
+        :returns: the new signature.
+        :rtype: :py:class:`psyclone.core.Signature`
+
+        '''
+        sig = cls.__new__(cls)
+        components = tuple(components)
+        sig._joined = sys.intern("%".join(components))
+        sig._components = _checked_components(sig._joined, components)
+        return sig
+
+    # ------------------------------------------------------------------------
+    @classmethod
+    def intern(cls, variable, sub_sig=None):
+        '''Returns a canonical Signature instance for the given arguments,
+        so that identical accesses share a single (immutable) object.
+        The arguments are the same as for the constructor.
+
+        :param variable: the variable that is accessed.
+        :type variable: str or tuple of str or list of str
+        :param sub_sig: a signature that is to be added to this signature.
+        :type sub_sig: Optional[:py:class:`psyclone.core.Signature`]
+
+        :returns: the shared signature instance, which is a
+            ScalarSignature for the name of a (non-structure) variable.
+        :rtype: :py:class:`psyclone.core.Signature`
+
+        '''
+        if isinstance(variable, list):
+            # Lists are not hashable and so cannot be used as a cache key.
+            variable = tuple(variable)
+        return _intern(variable, sub_sig)
 
     # ------------------------------------------------------------------------
     @property
@@ -88,23 +151,33 @@ class Signature:
         ''':returns: True if this signature represents a structure.
         :rtype: bool
         '''
-        return len(self._signature) > 1
+        return "%" in self._joined
+
+    # ------------------------------------------------------------------------
+    @property
+    def components(self):
+        ''':returns: the components of this signature.
+        :rtype: tuple of str
+        '''
+        if self._components is None:
+            self._components = tuple(self._joined.split("%"))
+        return self._components
 
     # ------------------------------------------------------------------------
     def __len__(self):
         ''':returns: the number of components of this signature.
         :rtype: int'''
-        return len(self._signature)
+        return len(self.components)
 
     # ------------------------------------------------------------------------
     def __getitem__(self, indx):
         if isinstance(indx, slice):
-            return Signature(self._signature[indx])
-        return self._signature[indx]
+            return Signature(self.components[indx])
+        return self.components[indx]
 
     # ------------------------------------------------------------------------
     def __str__(self):
-        return "%".join(self._signature)
+        return self._joined
 
     # ------------------------------------------------------------------------
     def to_language(self, component_indices=None, language_writer=None):
@@ -140,7 +213,7 @@ class Signature:
 
         # Check if number of components between self and component_indices
         # is consistent:
-        if len(self._signature) != len(component_indices):
+        if len(self) != len(component_indices):
             raise InternalError(f"Signature '{self}' has {len(self)} "
                                 f"components, but component_indices "
                                 f"{component_indices} has "
@@ -158,7 +231,7 @@ class Signature:
         # out_list collects the string representation of the components
         # including indices
         out_list = []
-        for i, component in enumerate(self._signature):
+        for i, component in enumerate(self.components):
             indices = component_indices[i]
             if not indices:
                 out_list.append(component)
@@ -191,31 +264,28 @@ class Signature:
 
     # ------------------------------------------------------------------------
     def __repr__(self):
-        return f"Signature({str(self)})"
+        return f"Signature({self._joined})"
 
     # ------------------------------------------------------------------------
     def __hash__(self):
         '''This returns a hash value that is independent of the instance.
         I.e. two instances with the same signature will have the same
-        hash key.
+        hash key. Python caches the hash of the joined string.
         '''
-        return hash(self._signature)
+        return hash(self._joined)
 
     # ------------------------------------------------------------------------
     def __eq__(self, other):
         '''Required in order to use a Signature instance as a key.
-        Compares two objects (one of which might not be a Signature).'''
-        if not hasattr(other, "_signature"):
-            return False
-        return self._signature == other._signature
-
-    # ------------------------------------------------------------------------
-    def __ne__(self, other):
-        '''Required for != comparisons of Signatures with python2.
-        Compares two objects (one of which might not be a Signature).'''
-        if not hasattr(other, "_signature"):
+        Compares two objects (one of which might not be a Signature).
+        This is a single comparison of the joined strings (which, being
+        interned, are usually the same object if equal).
+        Python derives `!=` from this method.'''
+        if self is other:
             return True
-        return self._signature != other._signature
+        if not isinstance(other, Signature):
+            return NotImplemented
+        return self._joined == other._joined
 
     # ------------------------------------------------------------------------
     def __lt__(self, other):
@@ -223,7 +293,7 @@ class Signature:
         if not isinstance(other, Signature):
             raise TypeError(f"'<' not supported between instances of "
                             f"'Signature' and '{type(other).__name__}'.")
-        return self._signature < other._signature
+        return self.components < other.components
 
     # ------------------------------------------------------------------------
     def __le__(self, other):
@@ -231,7 +301,7 @@ class Signature:
         if not isinstance(other, Signature):
             raise TypeError(f"'<=' not supported between instances of "
                             f"'Signature' and '{type(other).__name__}'.")
-        return self._signature <= other._signature
+        return self.components <= other.components
 
     # ------------------------------------------------------------------------
     def __gt__(self, other):
@@ -239,7 +309,7 @@ class Signature:
         if not isinstance(other, Signature):
             raise TypeError(f"'>' not supported between instances of "
                             f"'Signature' and '{type(other).__name__}'.")
-        return self._signature > other._signature
+        return self.components > other.components
 
     # ------------------------------------------------------------------------
     def __ge__(self, other):
@@ -247,7 +317,7 @@ class Signature:
         if not isinstance(other, Signature):
             raise TypeError(f"'>=' not supported between instances of "
                             f"'Signature' and '{type(other).__name__}'.")
-        return self._signature >= other._signature
+        return self.components >= other.components
 
     # ------------------------------------------------------------------------
     @property
@@ -256,10 +326,113 @@ class Signature:
             the signature.
         :rtype: str
         '''
-        return self._signature[0]
+        return self._joined.partition("%")[0]
+
+
+# =============================================================================
+class ScalarSignature(Signature):
+    '''The signature of an access to a variable that is not a structure,
+    i.e. that has a single component. This is by far the most common
+    kind of signature, so the component-related methods are implemented
+    without splitting the joined string. A ScalarSignature compares
+    (and hashes) equal to a Signature with the same single component.
+
+    :param str name: the name of the variable that is accessed.
+
+    :raises InternalError: if the name is empty or contains a '%', i.e.
+        it is not the name of a single variable.
+
+    '''
+    __slots__ = ()
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, name):
+        name = str(name)
+        if not name or "%" in name:
+            raise InternalError(f"A ScalarSignature requires the name of a "
+                                f"single variable, but got '{name}'.")
+        self._joined = sys.intern(name)
+        self._components = None
+
+    # ------------------------------------------------------------------------
+    @property
+    def is_structure(self):
+        ''':returns: False, a scalar signature is never a structure.
+        :rtype: bool
+        '''
+        return False
+
+    # ------------------------------------------------------------------------
+    def __len__(self):
+        ''':returns: the number of components of this signature (1).
+        :rtype: int'''
+        return 1
+
+    # ------------------------------------------------------------------------
+    @property
+    def var_name(self):
+        ''':returns: the actual variable name.
+        :rtype: str
+        '''
+        return self._joined
+
+
+# Maps the supported types of the `variable` argument of the Signature
+# constructor to a function converting it into the '%'-joined string of
+# its components.
+_TO_JOINED = {
+    str: str,
+    tuple: "%".join,
+    list: "%".join,
+    Signature: lambda variable: variable._joined,
+}
+
+
+def _checked_components(joined, components):
+    '''Checks that the given components of a signature are the same as
+    the components obtained by splitting its joined string. This is not
+    the case if a component contains a '%' (e.g. a tuple ``("a%b",)``),
+    in which case the components are created by splitting the joined
+    string when required, as for a string argument.
+
+    :param str joined: the '%'-joined string of all components.
+    :param components: the components of the signature, if known.
+    :type components: Optional[Tuple[str, ...]]
+
+    :returns: the components if they are consistent with the joined
+        string, an empty tuple if the signature is empty, or None.
+    :rtype: Optional[Tuple[str, ...]]
+
+    '''
+    if not joined:
+        # An empty signature has no components.
+        return ()
+    if components is not None and len(components) != joined.count("%") + 1:
+        return None
+    return components
+
+
+@lru_cache(maxsize=4096)
+def _intern(variable, sub_sig):
+    '''Creates the Signature instance that is shared by all callers of
+    `Signature.intern` with the same arguments.
+
+    :param variable: the variable that is accessed.
+    :type variable: str or tuple of str
+    :param sub_sig: a signature that is to be added to this signature.
+    :type sub_sig: Optional[:py:class:`psyclone.core.Signature`]
+
+    :returns: a new signature instance.
+    :rtype: :py:class:`psyclone.core.Signature`
+
+    '''
+    if (sub_sig is None and isinstance(variable, str) and variable and
+            "%" not in variable):
+        return ScalarSignature(variable)
+    return Signature(variable, sub_sig)
 
 
 # ---------- Documentation utils -------------------------------------------- #
 # The list of module members that we wish AutoAPI to generate
 # documentation for.
-__all__ = ["Signature"]
+__all__ = ["ScalarSignature", "Signature"]
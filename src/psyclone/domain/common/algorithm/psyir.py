@@ -46,6 +46,9 @@ from psyclone.psyir.nodes import (Call, Reference, DataNode,
                                   Routine, Container, FileContainer)
 from psyclone.psyir.symbols import DataTypeSymbol
 
+# A valid (language-level) routine name
+_ROUTINE_NAME_PATTERN = re.compile(r"^[a-zA-Z]\w*$", re.ASCII)
+
 
 class AlgorithmInvokeCall(Call):
     '''An invoke call in a PSyclone Algorithm layer.
@@ -100,6 +103,9 @@ class AlgorithmInvokeCall(Call):
         self.psylayer_routine_root_name = None
         self.psylayer_container_root_name = None
         self._name = name
+        # The routine root name derived from the name of this invoke call
+        # (and the name it was derived from), see _def_routine_root_name.
+        self._root_name_cache = None
 
     @classmethod
     def create(cls, routine, arguments, index, name=None):
@@ -158,7 +164,9 @@ class AlgorithmInvokeCall(Call):
         '''
         if position == 0:
             return isinstance(child, Reference)
-        return isinstance(child, KernelFunctor)
+        # Check the exact type first as this is the common case.
+        # pylint: disable-next=unidiomatic-typecheck
+        return type(child) is KernelFunctor or isinstance(child, KernelFunctor)
 
     def node_str(self, colour=True):
         '''Construct a text representation of this node, optionally
@@ -185,17 +193,17 @@ class AlgorithmInvokeCall(Call):
 
         '''
         if self._name:
-            routine_root_name = self._name.lower().strip()
-            if routine_root_name[0] == '"' and routine_root_name[-1] == '"' \
-               or \
-               routine_root_name[0] == "'" and routine_root_name[-1] == "'":
-                # fparser2 (issue #295) currently includes quotes as
-                # part of a string, so strip them out.
-                routine_root_name = routine_root_name[1:-1].strip()
-            routine_root_name = routine_root_name.replace(" ", "_")
+            # The processed name only depends on the name of the invoke
+            # call, so it can be re-used for as long as that is unchanged.
+            if self._root_name_cache and \
+                    self._root_name_cache[0] is self._name:
+                return self._root_name_cache[1]
+            # fparser2 (issue #295) currently includes quotes as part of a
+            # string, so strip them out.
+            routine_root_name = self._name.lower().strip().strip("\"'")
+            routine_root_name = routine_root_name.strip().replace(" ", "_")
             # Check that the name is a valid routine name
-            pattern = re.compile(r"^[a-zA-Z]\w*$", re.ASCII)
-            if not pattern.match(routine_root_name):
+            if not _ROUTINE_NAME_PATTERN.match(routine_root_name):
                 raise TypeError(
                     f"AlgorithmInvokeCall:_def_routine_root_name() the "
                     f"(optional) name of an invoke must be a string "
@@ -203,6 +211,7 @@ class AlgorithmInvokeCall(Call):
                     f"underscores) but found '{routine_root_name}'.")
             if not routine_root_name.startswith("invoke"):
                 routine_root_name = f"invoke_{routine_root_name}"
+            self._root_name_cache = (self._name, routine_root_name)
         else:
             routine_root_name = f"invoke_{self._index}"
             if len(self.arguments) == 1:
@@ -234,8 +243,11 @@ class AlgorithmInvokeCall(Call):
             # parse tree and uses that name for the container name. Here
             # we temporarily replicate this functionality. Eventually we
             # will merge. Note, a better future solution could be to use
-            # the closest ancestor routine instead.
-            for node in self.root.walk((Routine, Container)):
+            # the closest ancestor routine instead. There is no need to
+            # search within Routines as any Routine precedes its
+            # descendants in the walk.
+            for node in self.root.walk((Routine, Container),
+                                       stop_type=Routine):
                 if not isinstance(node, FileContainer):
                     self.psylayer_container_root_name = \
                         self._def_container_root_name(node)
@@ -298,7 +310,10 @@ class KernelFunctor(Reference):
                 f"but found '{type(arguments).__name__}'.")
 
         call = cls(symbol)
-        call.children = arguments
+        # The new functor has no children so extend its (empty) list of
+        # children rather than replacing it. This validates the arguments
+        # without first removing and recreating the children list.
+        call.children.extend(arguments)
         return call
 
     @staticmethod
@@ -312,7 +327,10 @@ class KernelFunctor(Reference):
         :rtype: bool
 
         '''
-        return isinstance(child, DataNode)
+        # Check the exact type first as arguments are most often plain
+        # References.
+        # pylint: disable-next=unidiomatic-typecheck
+        return type(child) is Reference or isinstance(child, DataNode)
 
 
 __all__ = [
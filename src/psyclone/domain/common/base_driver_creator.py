@@ -38,9 +38,9 @@
 implementations.
 '''
 
-from typing import List, Tuple
+import re
+from typing import Dict, List, Tuple
 
-from psyclone.parse import ModuleManager
 from psyclone.psyir.nodes import (
     Call, Literal, Reference, ExtractNode, Routine, Node)
 from psyclone.psyir.symbols import (
@@ -71,6 +71,24 @@ class BaseDriverCreator:
         :param name: name of the subroutine to call.
         :param args: list of all arguments for the call.
 
+        :raises TypeError: if there is a symbol with the
+            specified name defined that is not a RoutineSymbol.
+        '''
+        routine_symbol = BaseDriverCreator._get_routine_symbol(program, name)
+        call = Call.create(routine_symbol, args)
+        program.addchild(call)
+
+    @staticmethod
+    def _get_routine_symbol(program: Routine, name: str) -> RoutineSymbol:
+        '''Returns the RoutineSymbol with the given name from the symbol
+        table of the program. If there is no such symbol, a new RoutineSymbol
+        is added to the symbol table.
+
+        :param program: the PSyIR Routine whose symbol table is used.
+        :param name: name of the subroutine.
+
+        :returns: the symbol of the subroutine.
+
         :raises TypeError: if there is a symbol with the
             specified name defined that is not a RoutineSymbol.
         '''
@@ -84,12 +102,12 @@ class BaseDriverCreator:
         else:
             routine_symbol = RoutineSymbol(name)
             program.symbol_table.add(routine_symbol)
-        call = Call.create(routine_symbol, args)
-        program.addchild(call)
+        return routine_symbol
 
     @staticmethod
     def add_read_call(program: Routine, name_lit: Literal, sym: DataSymbol,
-                      read_var: str):
+                      read_var: str,
+                      routine_symbols: Dict[str, RoutineSymbol] = None):
         '''This function creates a call to the subroutine that read fields
         from the data file.
 
@@ -97,6 +115,10 @@ class BaseDriverCreator:
         :param name_lit: the name of the field in the data file.
         :param sym: the symbol to store the read data.
         :param str read_var: the method name to read the data.
+        :param routine_symbols: an optional dictionary used to store the
+            RoutineSymbols of the read methods, indexed by name. When
+            creating many read calls, this avoids looking up the same
+            method in the symbol table for each call.
         '''
         # TODO #2898: the test for array can be removed if
         # `is_allocatable` is supported for non-arrays.
@@ -104,13 +126,22 @@ class BaseDriverCreator:
             # In case of a non-allocatable array (e.g. a constant
             # size array from a module), call the ReadVariable
             # function that does not require an allocatable field
-            BaseDriverCreator.add_call(program, read_var+"NonAlloc",
-                                       [name_lit, Reference(sym)])
+            name = read_var + "NonAlloc"
         else:
             # In case of an allocatable array, call the ReadVariable
             # function that will also allocate this array.
-            BaseDriverCreator.add_call(program, read_var,
+            name = read_var
+        if routine_symbols is None:
+            BaseDriverCreator.add_call(program, name,
                                        [name_lit, Reference(sym)])
+            return
+        routine_symbol = routine_symbols.get(name)
+        if routine_symbol is None:
+            routine_symbol = BaseDriverCreator._get_routine_symbol(program,
+                                                                   name)
+            routine_symbols[name] = routine_symbol
+        program.addchild(Call.create(routine_symbol,
+                                     [name_lit, Reference(sym)]))
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -151,7 +182,10 @@ class BaseDriverCreator:
     @staticmethod
     def _create_output_var_code(
         name: str, program: Routine, read_var: str,
-        postfix: str, module_name: str = None
+        postfix: str, module_name: str = None,
+        sym_index: Dict[str, Symbol] = None,
+        tag_index: Dict[str, Symbol] = None,
+        routine_symbols: Dict[str, RoutineSymbol] = None
     ) -> Tuple[Symbol, Symbol]:
         '''
         This function creates all code required for an output variable:
@@ -172,6 +206,18 @@ class BaseDriverCreator:
         :param module_name: if the variable is part of an external module,
             this contains the module name from which it is imported.
             Otherwise, this must either not be specified or an empty string.
+        :param sym_index: an optional snapshot of the symbols in the
+            symbol table of the program, indexed by (lower-case) name. It
+            is used to avoid a symbol table lookup when called for many
+            variables. The symbol table is searched if the name is not found.
+            It is also used to check if the name of the post variable is
+            unused, so it must contain all symbols in scope. The new post
+            symbol is added to it.
+        :param tag_index: an optional snapshot of the tagged symbols in the
+            symbol table of the program, indexed by tag. Used in the same
+            way as sym_index.
+        :param routine_symbols: an optional dictionary of the RoutineSymbols
+            of the read methods, see :py:meth:`add_read_call`.
 
         :returns: a 2-tuple containing the output Symbol after the kernel,
              and the expected output read from the file.
@@ -184,22 +230,43 @@ class BaseDriverCreator:
             # is imported from an external module. The name of the module will
             # be appended to the tag used in the extracted kernel file, e.g.
             # `dummy_var2@dummy_mod`.
-            sym = symbol_table.lookup_with_tag(f"{name}@{module_name}")
+            tag = f"{name}@{module_name}"
+            sym = tag_index.get(tag) if tag_index else None
+            if sym is None:
+                sym = symbol_table.lookup_with_tag(tag)
         else:
-            sym = symbol_table.lookup(name)
+            sym = sym_index.get(name.lower()) if sym_index else None
+            if sym is None:
+                sym = symbol_table.lookup(name)
 
         # For each variable, we declare a new variable that stores the expected
         # value with the same datatype and with the given postfix
         post_name = sym.name + postfix
-        post_sym = symbol_table.new_symbol(post_name,
-                                           symbol_type=DataSymbol,
-                                           datatype=sym.datatype.copy())
-        if isinstance(post_sym.datatype, UnsupportedFortranType):
-            # Manually update symbol name from Unsupported declarations
+        datatype = sym.datatype
+        if isinstance(datatype, UnsupportedFortranType):
+            # Manually update symbol name from Unsupported declarations. Only
+            # whole words are replaced so that e.g. a kind parameter that
+            # contains the name is not modified.
             # pylint: disable=protected-access
-            post_sym.datatype = post_sym.datatype.copy()
-            post_sym.datatype._declaration = \
-                post_sym.datatype._declaration.replace(sym.name, post_name)
+            datatype = datatype.copy()
+            datatype._declaration = re.sub(
+                rf"\b{re.escape(sym.name)}\b", post_name,
+                datatype._declaration)
+        # Other datatypes are not modified by the driver, so they can be
+        # shared with the original symbol rather than copied.
+        if sym_index is not None and post_name.lower() not in sym_index:
+            # The snapshot contains all names in scope, so the name is
+            # known to be unused. This avoids next_available_name, which
+            # collects all names in scope each time it is called.
+            post_sym = DataSymbol(post_name, datatype)
+            symbol_table.add(post_sym)
+        else:
+            post_sym = symbol_table.new_symbol(post_name,
+                                               symbol_type=DataSymbol,
+                                               datatype=datatype)
+        if sym_index is not None:
+            # Keep the snapshot up to date for the next output variable.
+            sym_index[post_sym.name.lower()] = post_sym
 
         # Add a psydata read call with the proper name_tag
         if module_name:
@@ -207,7 +274,8 @@ class BaseDriverCreator:
         else:
             post_tag = f"{name}{postfix}"
         name_lit = Literal(post_tag, CHARACTER_TYPE)
-        BaseDriverCreator.add_read_call(program, name_lit, post_sym, read_var)
+        BaseDriverCreator.add_read_call(program, name_lit, post_sym, read_var,
+                                        routine_symbols)
 
         return (sym, post_sym)
 
@@ -241,53 +309,66 @@ class BaseDriverCreator:
         '''
         symbol_table = program.scope.symbol_table
         read_var = f"{psy_data.name}%ReadVariable"
+        # The RoutineSymbols of the read methods, shared by all read calls:
+        routine_symbols = {}
 
         # First handle the input local variables that are read (local variables
         # do not have a module_name and are guaranteed to be in the symtab when
         # doing lookups, external variables are handled below). Note that at
         # the moment we consider all read and/or written as input variables.
-        read_stmts = []
+        # The list of used variables is created and sorted each time it is
+        # accessed, so split it into local and external variables once.
+        local_vars = []
+        external_vars = []
         for module_name, signature in read_write_info.all_used_vars_list:
-            if not module_name:
-                orig_sym = original_symtab.lookup(signature[0])
-                sym = orig_sym.copy()
-                sym.interface = AutomaticInterface()
-                symbol_table.add(sym)
-                name_lit = Literal(str(signature), CHARACTER_TYPE)
-                read_stmts.append((name_lit, sym))
+            if module_name:
+                external_vars.append((module_name, signature))
+            else:
+                local_vars.append(signature)
+
+        read_stmts = []
+        for signature in local_vars:
+            orig_sym = original_symtab.lookup(signature[0])
+            sym = orig_sym.copy()
+            sym.interface = AutomaticInterface()
+            symbol_table.add(sym)
+            name_lit = Literal(str(signature), CHARACTER_TYPE)
+            read_stmts.append((name_lit, sym))
 
         # Now do the input external variables. This are done after the locals
-        # so that they match the literal tags of the extracting psy-layer
+        # so that they match the literal tags of the extracting psy-layer.
+        # This also resolves the symbols in their modules using the
+        # ModuleManager, so they do not need to be looked up again here.
         ExtractNode.bring_external_symbols(read_write_info, symbol_table)
-        mod_man = ModuleManager.get()
-        for module_name, signature in read_write_info.all_used_vars_list:
-            if module_name:
-                mod_info = mod_man.get_module_info(module_name)
-                orig_sym = mod_info.get_symbol(signature[0])
-                tag = f"{signature[0]}@{module_name}"
-                sym = symbol_table.lookup_with_tag(tag)
-                name_lit = Literal(tag, CHARACTER_TYPE)
-                read_stmts.append((name_lit, sym))
+        for module_name, signature in external_vars:
+            tag = f"{signature[0]}@{module_name}"
+            sym = symbol_table.lookup_with_tag(tag)
+            name_lit = Literal(tag, CHARACTER_TYPE)
+            read_stmts.append((name_lit, sym))
 
         for name_lit, sym in read_stmts:
-            self.add_read_call(program, name_lit, sym, read_var)
+            self.add_read_call(program, name_lit, sym, read_var,
+                               routine_symbols)
 
         # Finally handle the output variables (these are the ones compared
         # to a stored _post variable)
+        # Each symbol table lookup creates a dictionary of all symbols (or
+        # tags) in scope, so take a snapshot of them once for all of the
+        # output variables. The post symbols added for each output variable
+        # are never looked up (nor tagged), and _create_output_var_code adds
+        # them to the symbol snapshot, so the snapshots remain valid.
+        sym_index = symbol_table.get_symbols()
+        tag_index = symbol_table.get_tags()
         output_symbols = []
         for module_name, signature in read_write_info.write_list:
-            # Find the right symbol for the variable. Note that all variables
-            # in the input and output list have been detected as being used
-            # when the variable accesses were analysed. Therefore, these
-            # variables will already have been declared in the symbol table.
-            if module_name:
-                orig_sym = mod_man.get_module_info(module_name).get_symbol(
-                    signature[0])
-            else:
-                orig_sym = symbol_table.lookup(signature[0])
+            # Note that all variables in the input and output list have been
+            # detected as being used when the variable accesses were
+            # analysed. Therefore, these variables will already have been
+            # declared in the symbol table.
             sym_tuple = self._create_output_var_code(
                 str(signature), program, read_var, postfix,
-                module_name=module_name)
+                module_name=module_name, sym_index=sym_index,
+                tag_index=tag_index, routine_symbols=routine_symbols)
             output_symbols.append(sym_tuple)
 
         return output_symbols
@@ -307,7 +388,7 @@ class BaseDriverCreator:
         return name.replace("-", "")[:63]
 
     @staticmethod
-    def import_modules(program: Routine):
+    def import_modules(program: Routine, calls: List[Call] = None):
         '''This function adds all the import statements required for the
         actual kernel calls. It finds all calls in the PSyIR tree and
         checks for calls with a ImportInterface. Any such call will
@@ -315,11 +396,22 @@ class BaseDriverCreator:
         with an import interface pointing to this module.
 
         :param program: the PSyIR Routine to which any code must be added.
+        :param calls: an optional list of the calls to handle. This allows
+            a caller that has already walked the tree to avoid walking it
+            again. If not specified, all calls in the program are handled.
 
         '''
         symtab = program.scope.symbol_table
-        for call in program.walk(Call):
+        if calls is None:
+            calls = program.walk(Call)
+        # The same routine is often called many times, so each routine
+        # symbol only needs to be handled once.
+        seen_routines = set()
+        for call in calls:
             routine = call.routine.symbol
+            if routine in seen_routines:
+                continue
+            seen_routines.add(routine)
             if not isinstance(routine.interface, ImportInterface):
                 continue
             if routine.name in symtab:
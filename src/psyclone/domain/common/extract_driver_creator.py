@@ -43,7 +43,7 @@ the output data contained in the input file.
 
 from psyclone.domain.common import BaseDriverCreator
 from psyclone.psyir.backend.fortran import FortranWriter
-from psyclone.psyir.nodes import FileContainer, Literal, Routine
+from psyclone.psyir.nodes import Call, FileContainer, Literal, Routine
 from psyclone.psyir.symbols import (CHARACTER_TYPE,
                                     ContainerSymbol, DataSymbol,
                                     DataTypeSymbol, UnresolvedType,
@@ -148,10 +148,13 @@ class ExtractDriverCreator(BaseDriverCreator):
 
         # Copy the nodes that are part of the extraction
         extract_region = nodes[0].copy()
+        # Only the extracted calls can be imported, so there is no need to
+        # walk the code created by the driver itself.
+        calls = extract_region.walk(Call)
         program.children.extend(extract_region.pop_all_children())
 
         # Find all imported modules and add them to the symbol table
-        self.import_modules(program)
+        self.import_modules(program, calls)
 
         self.replace_precisions(program)
 
@@ -222,7 +225,7 @@ class ExtractDriverCreator(BaseDriverCreator):
         '''This function uses the `get_driver_as_string()` function to get a
         a stand-alone driver, and then writes this source code to a file. The
         file name is derived from the region name:
-        "driver-"+module_name+"_"+region_name+".f90"
+        "driver-"+module_name+"-"+local_name+".f90"
 
         :param nodes: a list of nodes.
         :type nodes: list[:py:class:`psyclone.psyir.nodes.Node`]
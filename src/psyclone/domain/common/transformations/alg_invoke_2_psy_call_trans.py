@@ -104,7 +104,22 @@ class AlgInvoke2PSyCallTrans(Transformation, abc.ABC):
         '''
 
     @staticmethod
-    def _add_arg(arg, arguments):
+    def _arg_key(arg):
+        '''
+        :param arg: an algorithm-layer kernel argument.
+        :type arg: :py:class:`psyclone.psyir.nodes.Reference`
+
+        :returns: the (case-insensitive) signature of the variable accessed
+            by the argument, ignoring any indices. Two arguments can only
+            be equivalent if they have the same key.
+        :rtype: str
+
+        '''
+        signature, _ = arg.get_signature_and_indices()
+        return str(signature).lower()
+
+    @staticmethod
+    def _add_arg(arg, arguments, arg_keys=None):
         '''Utility method to add argument arg to the arguments list as long as
         it conforms to the expected constraints.
 
@@ -113,6 +128,12 @@ class AlgInvoke2PSyCallTrans(Transformation, abc.ABC):
         :param arguments: the arguments list that the argument might \
             be added to.
         :type arguments: List[:py:class:`psyclone.psyir.nodes.Reference`]
+        :param arg_keys: optional index of the References already in the
+            arguments list, keyed on their _arg_key(). If supplied, it is
+            used (and updated) instead of searching the arguments list and
+            must only be modified by this method.
+        :type arg_keys: Optional[
+            Dict[str, List[:py:class:`psyclone.psyir.nodes.Reference`]]]
 
         :raises TypeError: if the arg argument is an unexpected type.
 
@@ -126,11 +147,28 @@ class AlgInvoke2PSyCallTrans(Transformation, abc.ABC):
             # Literals are not passed by argument.
             pass
         elif isinstance(arg, Reference):
-            for existing_arg in arguments:
-                if sym_maths.equal(arg, existing_arg):
+            # Only a reference to the same variable (or structure
+            # component) can be equivalent, so avoid the (costly) symbolic
+            # comparison with any other argument. Most duplicates are also
+            # identical, which is cheaper to check than symbolic
+            # equivalence.
+            key = AlgInvoke2PSyCallTrans._arg_key(arg)
+            if arg_keys is None:
+                candidates = [
+                    existing_arg for existing_arg in arguments
+                    if isinstance(existing_arg, Reference) and
+                    AlgInvoke2PSyCallTrans._arg_key(existing_arg) == key]
+            else:
+                candidates = arg_keys.setdefault(key, [])
+            for existing_arg in candidates:
+                if (existing_arg == arg or
+                        sym_maths.equal(arg, existing_arg)):
                     break
             else:
-                arguments.append(arg.copy())
+                new_arg = arg.copy()
+                arguments.append(new_arg)
+                if arg_keys is not None:
+                    candidates.append(new_arg)
         elif isinstance(arg, CodeBlock):
             arguments.append(arg.copy())
         else:
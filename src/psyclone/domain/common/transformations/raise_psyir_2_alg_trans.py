@@ -53,6 +53,11 @@ from psyclone.psyGen import Transformation
 from psyclone.psyir.transformations import TransformationError
 from psyclone.psyir.frontend.fparser2 import Fparser2Reader
 
+# A single fparser2 frontend used to convert kernel arguments to PSyIR.
+# It holds no state between calls so there is no need to create a new
+# one (and its handler table) for every kernel in every invoke.
+_FPARSER2_READER = Fparser2Reader()
+
 
 class RaisePSyIR2AlgTrans(Transformation):
     '''Transform a generic PSyIR representation of an Algorithm-layer
@@ -82,19 +87,18 @@ class RaisePSyIR2AlgTrans(Transformation):
         '''
         dummy_call = Call(parent=code_block.parent)
         dummy_call.addchild(Reference(RoutineSymbol("dummy")))
-        fparser2 = Fparser2Reader()
         for arg in fp2_node.children[1].children:
-            fparser2.process_nodes(dummy_call, [arg])
+            _FPARSER2_READER.process_nodes(dummy_call, [arg])
         # Return the list of detached arguments
         return dummy_call.pop_all_children()[1:]
 
     @staticmethod
-    def _get_symbol(call, fp2_node):
+    def _get_symbol(symbol_table, fp2_node):
         '''Return the name of a Structure Constructor stored as a CodeBlock
         containing an fparser2 ast.
 
-        :param code_block: the CodeBlock containing a StructureConstructor.
-        :type code_block: :py:class:`psyclone.psyir.nodes.CodeBlock`
+        :param symbol_table: the symbol table in scope of the invoke call.
+        :type symbol_table: :py:class:`psyclone.psyir.symbols.SymbolTable`
         :param fp2_node: the fparser2 Structure Constructor node.
         :type fp2_node: \
             :py:class:`fparser.two.Fortran2003.Structure_Constructor`
@@ -105,10 +109,8 @@ class RaisePSyIR2AlgTrans(Transformation):
 
         '''
         name = fp2_node.children[0].string
-        symbol_table = call.scope.symbol_table
-        try:
-            type_symbol = symbol_table.lookup(name)
-        except KeyError:
+        type_symbol = symbol_table.lookup(name, otherwise=None)
+        if type_symbol is None:
             type_symbol = DataTypeSymbol(name, StructureType())
             symbol_table.add(type_symbol)
         return type_symbol
@@ -139,7 +141,11 @@ class RaisePSyIR2AlgTrans(Transformation):
             expected type.
 
         '''
-        if not isinstance(fp2_node, Structure_Constructor):
+        # fparser2 creates exact Structure_Constructor instances so check
+        # for those before falling back to the more general isinstance.
+        # pylint: disable-next=unidiomatic-typecheck
+        if (type(fp2_node) is not Structure_Constructor and
+                not isinstance(fp2_node, Structure_Constructor)):
             raise TransformationError(
                 f"Error in {self.name} transformation. Expecting an algorithm "
                 f"invoke codeblock to contain a Structure-Constructor, but "
@@ -179,15 +185,18 @@ class RaisePSyIR2AlgTrans(Transformation):
                 f"Error in {self.name} transformation. The supplied call "
                 f"argument should be a `Call` node with name 'invoke' but "
                 f"found '{node.routine.name}'.")
-        names = [name for name in node.argument_names if name]
+        # The argument names are re-computed on every access so only
+        # query them once.
+        argument_names = node.argument_names
+        names = [name for name in argument_names if name]
         if len(names) > 1:
             raise TransformationError(
                 f"Error in {self.name} transformation. There should be at "
                 f"most one named argument in an invoke, but there are "
                 f"{len(names)} in '{node.debug_string()}'.")
-        for idx, arg in enumerate(node.arguments):
-            if node.argument_names[idx]:
-                if (not node.argument_names[idx].lower() == "name"
+        for arg, arg_name in zip(node.arguments, argument_names):
+            if arg_name:
+                if (not arg_name.lower() == "name"
                     or not (isinstance(arg, Literal) and
                             isinstance(arg.datatype, ScalarType) and
                             arg.datatype.intrinsic ==
@@ -201,8 +210,6 @@ class RaisePSyIR2AlgTrans(Transformation):
                 except (TypeError, ValueError) as err:
                     raise TransformationError(
                         f"Problem with invoke name: {err}") from err
-            if node.argument_names[idx]:
-                pass
             elif isinstance(arg, ArrayReference):
                 pass
             elif isinstance(arg, CodeBlock):
@@ -240,11 +247,15 @@ class RaisePSyIR2AlgTrans(Transformation):
 
         call_name = None
         calls = []
-        for idx, call_arg in enumerate(call.arguments):
+        symbol_table = call.scope.symbol_table
+        # Kernel type symbols found so far in this invoke, indexed by their
+        # lower-cased name, as the same kernel is often called repeatedly.
+        type_symbols = {}
+        for call_arg, arg_name in zip(call.arguments, call.argument_names):
 
             # pylint: disable=protected-access
             arg_info = []
-            if call.argument_names[idx]:
+            if arg_name:
                 call_name = f"{call_arg.value}"
                 continue
             elif isinstance(call_arg, ArrayReference):
@@ -257,7 +268,11 @@ class RaisePSyIR2AlgTrans(Transformation):
                 # a StructureConstructor fparser2 node inside
                 for fp2_node in call_arg.get_ast_nodes:
                     # This child is a kernel
-                    type_symbol = self._get_symbol(call, fp2_node)
+                    name = fp2_node.children[0].string.lower()
+                    type_symbol = type_symbols.get(name)
+                    if type_symbol is None:
+                        type_symbol = self._get_symbol(symbol_table, fp2_node)
+                        type_symbols[name] = type_symbol
                     args = self._parse_args(call_arg, fp2_node)
                     arg_info.append((type_symbol, args))
 
@@ -69,7 +69,8 @@ class GOceanAlgInvoke2PSyCallTrans(AlgInvoke2PSyCallTrans):
 
         '''
         arguments = []
+        arg_keys = {}
         for kern in node.arguments:
             for arg in kern.children:
-                self._add_arg(arg, arguments)
+                self._add_arg(arg, arguments, arg_keys)
         return arguments
@@ -93,26 +93,25 @@ class LFRicBuiltinFunctor(LFRicFunctor):
         # the symbol that is found is not of the correct type and we want to
         # allow for the case where an unresolved Symbol of the right name
         # has already been added to the table.
-        try:
-            sym = table.lookup(cls._builtin_name)
-            # pylint: disable=unidiomatic-typecheck
-            if type(sym) is Symbol:
-                if not sym.is_unresolved:
-                    raise InternalError(
-                        f"A symbol with the same name as builtin '{sym.name}' "
-                        f"exists but has an interface of '{sym.interface}' "
-                        f"instead of being unresolved.")
-                sym.specialise(DataTypeSymbol)
-                sym.datatype = StructureType()
-            elif not isinstance(sym, DataTypeSymbol):
-                raise InternalError(
-                    f"A symbol with the same name as builtin '{sym.name}' "
-                    f"exists but it is a '{type(sym).__name__}' and not a "
-                    f"DataTypeSymbol.")
-        except KeyError:
+        sym = table.lookup(cls._builtin_name, otherwise=None)
+        if sym is None:
             sym = table.new_symbol(cls._builtin_name,
                                    symbol_type=DataTypeSymbol,
                                    datatype=StructureType())
+        # pylint: disable-next=unidiomatic-typecheck
+        elif type(sym) is Symbol:
+            if not sym.is_unresolved:
+                raise InternalError(
+                    f"A symbol with the same name as builtin '{sym.name}' "
+                    f"exists but has an interface of '{sym.interface}' "
+                    f"instead of being unresolved.")
+            sym.specialise(DataTypeSymbol)
+            sym.datatype = StructureType()
+        elif not isinstance(sym, DataTypeSymbol):
+            raise InternalError(
+                f"A symbol with the same name as builtin '{sym.name}' "
+                f"exists but it is a '{type(sym).__name__}' and not a "
+                f"DataTypeSymbol.")
 
         return super().create(sym, arguments)
 
@@ -125,17 +124,15 @@ class LFRicBuiltinFunctor(LFRicFunctor):
 
         '''
         table = self.scope.symbol_table
-        try:
-            sym = table.lookup(self._builtin_name)
+        sym = table.lookup(self._builtin_name, otherwise=None)
+        # If there is no symbol then it has already been removed by a
+        # previous lowering of the same builtin.
+        if sym is not None:
             table = sym.find_symbol_table(self)
             # TODO #898 SymbolTable.remove() does not yet support
             # DataTypeSymbols.
             # pylint: disable=protected-access
             del table._symbols[self._builtin_name]
-        except KeyError:
-            # The symbol has already been removed by a previous lowering
-            # of the same builtin.
-            pass
         return self
 
 
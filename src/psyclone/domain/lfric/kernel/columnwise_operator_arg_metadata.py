@@ -47,6 +47,8 @@ class ColumnwiseOperatorArgMetadata(OperatorArgMetadata):
     operator argument.
 
     '''
+    __slots__ = ()
+
     # The name used to specify a columnwise operator argument in LFRic
     # metadata.
     form = "gh_columnwise_operator"
@@ -45,6 +45,7 @@ from psyclone.domain.lfric.kernel.common_metadata import CommonMetadata
 
 class CommonArgMetadata(CommonMetadata):
     '''Class to capture common LFRic kernel argument metadata.'''
+    __slots__ = ()
 
     # The fparser2 class that captures this metadata.
     fparser2_class = Fortran2003.Part_Ref
@@ -130,6 +131,21 @@ class CommonArgMetadata(CommonMetadata):
         '''
         return len(fparser2_tree.children[1].children)
 
+    @staticmethod
+    def _extract_args(fparser2_tree):
+        '''Returns the string form of all of the metadata arguments found
+        in the fparser2 tree.
+
+        :param fparser2_tree: fparser2 tree capturing the required metadata.
+        :type fparser2_tree: :py:class:`fparser.two.Fortran2003.Part_Ref`
+
+        :returns: the metadata arguments extracted from the fparser2 tree.
+        :rtype: Tuple[str, ...]
+
+        '''
+        return tuple(child.tostr()
+                     for child in fparser2_tree.children[1].children)
+
     @staticmethod
     def get_arg(fparser2_tree, index):
         '''Retrieves the metadata value found at the position specified by the
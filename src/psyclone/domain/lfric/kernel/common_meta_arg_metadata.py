@@ -40,8 +40,10 @@ such an argument.
 
 '''
 from abc import ABC, abstractmethod
+import sys
 
 from psyclone.domain.lfric.kernel.common_arg_metadata import CommonArgMetadata
+from psyclone.domain.lfric.kernel.common_metadata import MetadataValueError
 from psyclone.errors import InternalError
 
 
@@ -53,6 +55,8 @@ class CommonMetaArgMetadata(CommonArgMetadata, ABC):
         argument.
 
     '''
+    __slots__ = ("_datatype", "_access")
+
     # Whether the class captures vector metadata.
     vector = False
     # Dummy values to keep pylint happy for the class methods.
@@ -62,8 +66,32 @@ class CommonMetaArgMetadata(CommonArgMetadata, ABC):
     access_arg_index = 2
     function_space_arg_index = 3
     form = ""
+    # Lower-case version of 'form', set by __init_subclass__.
+    _form_lower = ""
     check_name = ""
     nargs = 1
+    # Maps the name of a metadata property, as recorded in the
+    # MetadataValueError raised by the constructor, to the class
+    # attribute holding the index of the associated metadata argument
+    # (see check_remaining_args).
+    _NAME_TO_INDEX_ATTR = {
+        "datatype descriptor": "datatype_arg_index",
+        "access descriptor": "access_arg_index",
+        "function space": "function_space_arg_index",
+        "mesh_arg": "mesh_arg_index",
+        "function_space_to": "function_space_to_arg_index",
+        "function_space_from": "function_space_from_arg_index",
+        "stencil": "stencil_arg_index",
+        "vector length": "vector_length_arg_index"}
+
+    def __init_subclass__(cls, **kwargs):
+        '''Store the lower-case form of the 'form' class attribute when a
+        subclass is created so that it is not re-computed each time the
+        first metadata argument is checked.
+
+        '''
+        super().__init_subclass__(**kwargs)
+        cls._form_lower = cls.form.lower()
 
     def __init__(self, datatype, access):
         super().__init__()
@@ -92,8 +120,7 @@ class CommonMetaArgMetadata(CommonArgMetadata, ABC):
 
         '''
         args = cls._get_metadata(fparser2_tree)
-        cls.check_remaining_args(fparser2_tree, *args)
-        return cls(*args)
+        return cls.check_remaining_args(fparser2_tree, *args)
 
     @classmethod
     def check_first_arg(cls, fparser2_tree):
@@ -111,9 +138,9 @@ class CommonMetaArgMetadata(CommonArgMetadata, ABC):
         form = cls.get_arg(fparser2_tree, idx)
         word = "as"
         if cls.vector:
-            form = form.split("*")[0].strip()
+            form = form.partition("*")[0].strip()
             word = "in"
-        if not form.lower() == cls.form.lower():
+        if not form.lower() == cls._form_lower:
             raise ValueError(
                 f"Metadata for '{cls.check_name}' kernel arguments should "
                 f"have '{cls.form}' {word} the first metadata "
@@ -125,7 +152,9 @@ class CommonMetaArgMetadata(CommonArgMetadata, ABC):
         expected value. If they do not then re-raise the exception
         from the class constructor, adding in positional information
         and the metadata arguments to make it clearer where the
-        exception occured.
+        exception occured. The instance created when checking the
+        arguments is returned so that the caller does not need to create
+        another one.
 
         :param fparser2_tree: the metadata encoded in an fparser2_tree.
         :type fparser2_tree: :py:class:`fparser.two.Fortran2003.Part_Ref` or \
@@ -135,31 +164,27 @@ class CommonMetaArgMetadata(CommonArgMetadata, ABC):
             argument.
         :type metadata_args: unwrapped dict
 
+        :returns: an instance of the class created from the metadata \
+            arguments.
+        :rtype: subclass of \
+            :py:class:`psyclone.domain.lfric.kernel.CommonMetaArgMetadata`
+
         :raises ValueError: if the metadata has an incorrect value.
-        :raises InternalError: if an unrecognised exception message is found.
+        :raises InternalError: if the invalid metadata property is not \
+            recognised.
 
         '''
         try:
-            _ = cls(*metadata_args)
-        except ValueError as info:
-            message = str(info)
-            if "datatype descriptor" in message:
-                index = cls.datatype_arg_index
-            elif "access descriptor" in message:
-                index = cls.access_arg_index
-            elif "function space" in message:
-                index = cls.function_space_arg_index
-            elif "mesh_arg" in message:
-                index = cls.mesh_arg_index
-            elif "function_space_to" in message:
-                index = cls.function_space_to_arg_index
-            elif "function_space_from" in message:
-                index = cls.function_space_from_arg_index
-            else:
+            return cls(*metadata_args)
+        except MetadataValueError as info:
+            index_attr = cls._NAME_TO_INDEX_ATTR.get(info.name)
+            if index_attr is None:
                 raise InternalError(
-                    f"Unexpected error message found '{message}'") from info
+                    f"Unexpected metadata property '{info.name}' found in "
+                    f"error '{info}'") from info
+            index = getattr(cls, index_attr)
             raise ValueError(f"At argument index '{index}' for metadata "
-                             f"'{str(fparser2_tree)}'. {message}") from info
+                             f"'{str(fparser2_tree)}'. {info}") from info
 
     # pylint: disable=arguments-differ
     @classmethod
@@ -192,13 +217,12 @@ class CommonMetaArgMetadata(CommonArgMetadata, ABC):
         '''
         vector_datatype = CommonArgMetadata.get_arg(
             fparser2_tree, cls.vector_length_arg_index)
-        components = vector_datatype.split("*")
-        if len(components) != 2:
+        _, separator, vector_length = vector_datatype.partition("*")
+        if not separator or "*" in vector_length:
             raise TypeError(
                 f"The vector length metadata should be in the form "
                 f"'form*vector_length' but found '{vector_datatype}'.")
-        vector_length = components[1].strip()
-        return vector_length
+        return vector_length.strip()
 
     @property
     def datatype(self):
@@ -220,7 +244,9 @@ class CommonMetaArgMetadata(CommonArgMetadata, ABC):
             specified value.
         '''
         self.check_datatype(value)
-        self._datatype = value.lower()
+        # Datatypes come from a small set of values so intern them to
+        # share the string between instances.
+        self._datatype = sys.intern(value.lower())
 
     @staticmethod
     @abstractmethod
@@ -243,7 +269,9 @@ class CommonMetaArgMetadata(CommonArgMetadata, ABC):
 
         '''
         self.check_access(value)
-        self._access = value.lower()
+        # Access descriptors come from a small set of values so intern
+        # them to share the string between instances.
+        self._access = sys.intern(value.lower())
 
 
 __all__ = ["CommonMetaArgMetadata"]
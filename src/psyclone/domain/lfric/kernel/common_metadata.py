@@ -38,18 +38,43 @@ common functionality for LFRic kernel metadata.
 
 '''
 from abc import ABC, abstractmethod
+import functools
 
 from fparser.common.readfortran import FortranStringReader
+from fparser.two import Fortran2003
 from fparser.two.parser import ParserFactory
 from fparser.two.utils import NoMatchError, FortranSyntaxError
 
 from psyclone.configuration import Config
 
+# The Fortran standard and the fparser2 class hierarchy that
+# create_fparser2 last set up, see CommonMetadata._setup_fparser2.
+_FPARSER2_SETUP = (None, None)
+
+
+class MetadataValueError(ValueError):
+    '''Raised when the value of a metadata property is invalid. Records
+    the name of the property so that callers can tell which property
+    was invalid without having to inspect the error message.
+
+    :param str message: the error message.
+    :param str name: the name of the metadata property being checked.
+
+    '''
+    def __init__(self, message, name):
+        super().__init__(message)
+        self.name = name
+
 
 # TODO issue #1886. This class and its subclasses may have
 # commonalities with the GOcean metadata processing.
 class CommonMetadata(ABC):
     '''Abstract class to capture common LFRic kernel metadata.'''
+    # The metadata classes declare their instance attributes in
+    # __slots__ as many instances can be created when processing
+    # kernels. Subclasses must also declare __slots__ for this to
+    # have any effect.
+    __slots__ = ()
 
     # The fparser2 class that captures this metadata.
     fparser2_class = None
@@ -85,18 +110,36 @@ class CommonMetadata(ABC):
         :param str name: the name of the metadata being checked
 
         :raises TypeError: if the value is not a string.
-        :raises ValueError: if the supplied value is not one of the \
-            values in the valid_values list.
+        :raises MetadataValueError: if the supplied value is not one of \
+            the values in the valid_values list.
 
         '''
         if not isinstance(value, str):
             raise TypeError(f"The '{name}' value should be of type str, but "
                             f"found '{type(value).__name__}'.")
         if value.lower() not in valid_values:
-            raise ValueError(
+            raise MetadataValueError(
                 f"The '{name}' metadata should be a recognised "
                 f"value (one of {valid_values}) "
-                f"but found '{value}'.")
+                f"but found '{value}'.", name)
+
+    @staticmethod
+    def _setup_fparser2(std):
+        '''Sets up the fparser2 class hierarchy for the supplied Fortran
+        standard, unless it is already in place. Creating the parser is
+        expensive and create_fparser2 is called for every metadata
+        argument. Any other parser creation replaces the hierarchy (the
+        Base.subclasses dictionary), in which case it is set up again.
+
+        :param str std: the Fortran standard to set up the parser for.
+
+        '''
+        # pylint: disable=global-statement
+        global _FPARSER2_SETUP
+        if (_FPARSER2_SETUP[0] != std or
+                _FPARSER2_SETUP[1] is not Fortran2003.Base.subclasses):
+            _ = ParserFactory().create(std=std)
+            _FPARSER2_SETUP = (std, Fortran2003.Base.subclasses)
 
     @staticmethod
     def create_fparser2(fortran_string, encoding):
@@ -122,8 +165,7 @@ class CommonMetadata(ABC):
             expected form.
 
         '''
-        std = Config.get().fortran_standard
-        _ = ParserFactory().create(std=std)
+        CommonMetadata._setup_fparser2(Config.get().fortran_standard)
         reader = FortranStringReader(fortran_string)
         match = True
         try:
@@ -136,6 +178,31 @@ class CommonMetadata(ABC):
                 f"{encoding.__name__}, but found '{fortran_string}'.")
         return fparser2_tree
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _create_fparser2_cached(fortran_string, encoding, std):
+        '''Memoised version of create_fparser2, as the same metadata strings
+        (e.g. "arg_type(GH_FIELD, GH_REAL, GH_READ, W0)") occur in many
+        kernels. The returned tree is shared between callers so must not be
+        modified. Use the cache_clear() method of this function to empty
+        the cache.
+
+        :param str fortran_string: a string containing the metadata in \
+           Fortran.
+        :param encoding: the parent class with which we will encode the \
+            Fortran string.
+        :type encoding: subclass of :py:class:`fparser.two.Fortran2003.Base`
+        :param str std: the Fortran standard with which to parse the
+            string. This is only used as part of the cache key.
+
+        :returns: an fparser2 tree containing a metadata \
+            argument.
+        :rtype: subclass of :py:class:`fparser.two.Fortran2003.Base`
+
+        '''
+        # pylint: disable=unused-argument
+        return CommonMetadata.create_fparser2(fortran_string, encoding)
+
     @classmethod
     def create_from_fortran_string(cls, fortran_string):
         '''Create an instance of this class from Fortran.
@@ -148,7 +215,11 @@ class CommonMetadata(ABC):
             :py:class:`python.domain.lfric.kernel.CommonMetadata`
 
         '''
-        fparser2_tree = cls.create_fparser2(fortran_string, cls.fparser2_class)
+        # The tree is only read when creating the instance so it is safe to
+        # use a cached one.
+        fparser2_tree = cls._create_fparser2_cached(
+            fortran_string, cls.fparser2_class,
+            Config.get().fortran_standard)
         return cls.create_from_fparser2(fparser2_tree)
 
     @staticmethod
@@ -159,4 +230,4 @@ class CommonMetadata(ABC):
         '''
 
 
-__all__ = ["CommonMetadata"]
+__all__ = ["CommonMetadata", "MetadataValueError"]
@@ -55,6 +55,8 @@ class FieldArgMetadata(ScalarArgMetadata):
         kernel when accessing this field.
 
     '''
+    __slots__ = ("_function_space", "_stencil")
+
     # The name used to specify a field argument in LFRic metadata.
     form = "gh_field"
     # The relative positions of LFRic metadata. Metadata for a field
@@ -38,6 +38,8 @@ associated with a field vector argument. Supports the creation, modification
 and Fortran output of a Field Vector argument.
 
 '''
+from psyclone.domain.lfric.kernel.common_metadata import \
+    MetadataValueError
 from psyclone.domain.lfric.kernel.field_arg_metadata import FieldArgMetadata
 
 
@@ -54,6 +56,8 @@ class FieldVectorArgMetadata(FieldArgMetadata):
         kernel when accessing this field.
 
     '''
+    __slots__ = ("_vector_length",)
+
     # The relative position of LFRic vector length metadata. Metadata
     # for a field vector argument is provided in the following format
     # 'arg_type(form*vector_length, datatype, access,
@@ -120,9 +124,10 @@ class FieldVectorArgMetadata(FieldArgMetadata):
             value.
 
         :raises TypeError: if the provided value is not of type str.
-        :raises ValueError: if the provided value is not a string \
-            containing an integer.
-        :raises ValueError: if the provided value is not greater than 1.
+        :raises MetadataValueError: if the provided value is not a \
+            string containing an integer.
+        :raises MetadataValueError: if the provided value is not greater \
+            than 1.
 
         '''
         if not isinstance(value, str):
@@ -131,13 +136,14 @@ class FieldVectorArgMetadata(FieldArgMetadata):
         try:
             int_value = int(value)
         except ValueError as info:
-            raise ValueError(
+            raise MetadataValueError(
                 f"The vector size should be a string containing an integer, "
-                f"but found '{value}'.") from info
+                f"but found '{value}'.", "vector length") from info
 
         if int_value <= 1:
-            raise ValueError(f"The vector size should be an integer greater "
-                             f"than 1 but found {value}.")
+            raise MetadataValueError(
+                f"The vector size should be an integer greater than 1 but "
+                f"found {value}.", "vector length")
         self._vector_length = value
 
 
@@ -60,6 +60,8 @@ class InterGridArgMetadata(FieldArgMetadata):
         kernel when accessing this InterGrid arg.
 
     '''
+    __slots__ = ("_mesh_arg",)
+
     # The relative position of LFRic mesh metadata. Metadata for an
     # inter-grid argument is provided in the following format
     # 'arg_type(form, datatype, access, function_space, [stencil],
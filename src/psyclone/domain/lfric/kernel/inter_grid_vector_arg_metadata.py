@@ -39,6 +39,8 @@ creation, modification and Fortran output of an InterGridVector
 argument.
 
 '''
+from psyclone.domain.lfric.kernel.common_metadata import \
+    MetadataValueError
 from psyclone.domain.lfric.kernel.inter_grid_arg_metadata import \
     InterGridArgMetadata
 
@@ -60,6 +62,8 @@ class InterGridVectorArgMetadata(InterGridArgMetadata):
         kernel when accessing this InterGrid arg.
 
     '''
+    __slots__ = ("_vector_length",)
+
     # The relative position of LFRic vector length metadata. Metadata
     # for an inter-grid vector argument is provided in the following
     # format 'arg_type(form*vector_length, datatype, access,
@@ -131,9 +135,10 @@ class InterGridVectorArgMetadata(InterGridArgMetadata):
             value.
 
         :raises TypeError: if the provided value is not of type str.
-        :raises ValueError: if the provided value is not a string \
-            containing an integer.
-        :raises ValueError: if the provided value is not greater than 1.
+        :raises MetadataValueError: if the provided value is not a \
+            string containing an integer.
+        :raises MetadataValueError: if the provided value is not greater \
+            than 1.
 
         '''
         if not isinstance(value, str):
@@ -142,13 +147,14 @@ class InterGridVectorArgMetadata(InterGridArgMetadata):
         try:
             int_value = int(value)
         except ValueError as info:
-            raise ValueError(
+            raise MetadataValueError(
                 f"The vector size should be a string containing an integer, "
-                f"but found '{value}'.") from info
+                f"but found '{value}'.", "vector length") from info
 
         if int_value <= 1:
-            raise ValueError(f"The vector size should be an integer greater "
-                             f"than 1 but found {value}.")
+            raise MetadataValueError(
+                f"The vector size should be an integer greater than 1 but "
+                f"found {value}.", "vector length")
         self._vector_length = value
 
 
@@ -53,6 +53,8 @@ class MetaFuncsArgMetadata(CommonArgMetadata):
         function is required. Defaults to False.
 
     '''
+    __slots__ = ("_function_space", "_basis_function", "_diff_basis_function")
+
     def __init__(self, function_space, basis_function=False,
                  diff_basis_function=False):
         super().__init__()
@@ -91,11 +93,12 @@ class MetaFuncsArgMetadata(CommonArgMetadata):
                 f"There must be at most 3 arguments: function_space, "
                 f"basis_function and diff_basis_function, but found "
                 f"'{nargs}'.")
-        function_space = MetaFuncsArgMetadata.get_arg(fparser2_tree, 0)
+        args = MetaFuncsArgMetadata._extract_args(fparser2_tree)
+        function_space = args[0]
 
         basis_function = False
         diff_basis_function = False
-        arg1 = MetaFuncsArgMetadata.get_arg(fparser2_tree, 1)
+        arg1 = args[1]
         MetaFuncsArgMetadata.validate_scalar_value(
             arg1, ["gh_basis", "gh_diff_basis"],
             "basis or differential basis")
@@ -106,7 +109,7 @@ class MetaFuncsArgMetadata(CommonArgMetadata):
 
         arg2 = None
         if nargs == 3:
-            arg2 = MetaFuncsArgMetadata.get_arg(fparser2_tree, 2)
+            arg2 = args[2]
             MetaFuncsArgMetadata.validate_scalar_value(
                 arg2, ["gh_basis", "gh_diff_basis"],
                 "basis or differential basis")
@@ -49,6 +49,8 @@ class MetaMeshArgMetadata(CommonArgMetadata):
     :param str mesh: the name of the mesh property.
 
     '''
+    __slots__ = ("_mesh",)
+
     def __init__(self, mesh):
         super().__init__()
         self.mesh = mesh
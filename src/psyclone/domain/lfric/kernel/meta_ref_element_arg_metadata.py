@@ -50,6 +50,8 @@ class MetaRefElementArgMetadata(CommonArgMetadata):
     :param str reference_element: the name of the reference_element property.
 
     '''
+    __slots__ = ("_reference_element",)
+
     def __init__(self, reference_element):
         super().__init__()
         self.reference_element = reference_element
@@ -55,6 +55,8 @@ class OperatorArgMetadata(ScalarArgMetadata):
         operator maps from (W0, ...).
 
     '''
+    __slots__ = ("_function_space_to", "_function_space_from")
+
     # The name used to specify an operator argument in LFRic metadata.
     form = "gh_operator"
     # The relative positions of LFRic function-space-to and
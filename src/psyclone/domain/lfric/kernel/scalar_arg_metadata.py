@@ -48,6 +48,8 @@ class ScalarArgMetadata(CommonMetaArgMetadata):
     argument.
 
     '''
+    __slots__ = ()
+
     # The name used to specify a scalar argument in LFRic metadata.
     form = "gh_scalar"
     # The relative positions of LFRic metadata. Metadata for a scalar
@@ -97,9 +99,8 @@ class ScalarArgMetadata(CommonMetaArgMetadata):
         cls.check_fparser2_arg(fparser2_tree, "arg_type")
         cls.check_nargs(fparser2_tree)
         cls.check_first_arg(fparser2_tree)
-        datatype = cls.get_arg(fparser2_tree, cls.datatype_arg_index)
-        access = cls.get_arg(fparser2_tree, cls.access_arg_index)
-        return (datatype, access)
+        args = cls._extract_args(fparser2_tree)
+        return (args[cls.datatype_arg_index], args[cls.access_arg_index])
 
     def fortran_string(self):
         '''
@@ -55,6 +55,8 @@ class ScalarArrayArgMetadata(ScalarArgMetadata):
                             ScalarArray.
 
     '''
+    __slots__ = ("_array_ndims",)
+
     # The name used to specify a ScalarArray argument in LFRic metadata.
     form = "gh_scalar_array"
     # The relative positions of LFRic metadata. Metadata for a ScalarArray
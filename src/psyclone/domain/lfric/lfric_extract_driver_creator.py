@@ -45,6 +45,9 @@ the output data contained in the input file.
 # creation implementation should make this file much smaller.
 # pylint: disable=too-many-lines
 
+import os
+from typing import Dict, List, Optional, Set, Tuple
+
 from psyclone.configuration import Config
 from psyclone.domain.common import BaseDriverCreator
 from psyclone.domain.lfric import LFRicConstants
@@ -53,13 +56,13 @@ from psyclone.parse import ModuleManager
 from psyclone.psyGen import InvokeSchedule
 from psyclone.psyir.backend.fortran import FortranWriter
 from psyclone.psyir.frontend.fortran import FortranReader
-from psyclone.psyir.nodes import (Call, FileContainer,
+from psyclone.psyir.nodes import (Call, FileContainer, Literal, Reference,
                                   Routine, StructureReference)
 from psyclone.psyir.symbols import (
-                                    ContainerSymbol, DataSymbol,
-                                    DataTypeSymbol, UnresolvedType,
+                                    CHARACTER_TYPE, ContainerSymbol,
+                                    DataSymbol, DataTypeSymbol, UnresolvedType,
                                     ImportInterface, INTEGER_TYPE,
-                                    UnsupportedFortranType)
+                                    IntrinsicSymbol, UnsupportedFortranType)
 
 
 class LFRicExtractDriverCreator(BaseDriverCreator):
@@ -161,16 +164,40 @@ class LFRicExtractDriverCreator(BaseDriverCreator):
        will then be compared with ``f_post``.
 
     :param region_name: the suggested region_name.
+    :param share_common: whether the required modules are written to a
+        common file shared by all drivers instead of being inlined (see
+        ``write_driver()``).
+    :param emitted_modules: for each (absolute path of a) common file, the
+        names of the modules that have already been written to it. Drivers
+        sharing a common file must share this dictionary. If it is not
+        provided, a new dictionary is used.
     '''
-    def __init__(self, region_name: str = None):
+    # Parsed statements added to each driver, see _parse_statement. Parsing
+    # this code is comparatively expensive, and the names used in it are
+    # nearly always the same, so each driver gets a copy of the cached tree
+    # instead. The cached trees are never modified.
+    _statement_cache = {}
+
+    # The name of the file that stores the modules shared between drivers
+    # if drivers are written with `share_common` (see `write_driver()`).
+    _COMMON_FILE_NAME = "driver-common.F90"
+
+    # TODO #2069: check if this set can be taken from LFRicConstants
+    # TODO #2018: once r_field is defined in the LFRic infrastructure,
+    #             it should be added to this set.
+    _ALL_FIELD_TYPES = frozenset(["integer_field_type", "field_type",
+                                  "r_bl_field", "r_solver_field_type",
+                                  "r_tran_field_type"])
+
+    def __init__(self, region_name: str = None, share_common: bool = False,
+                 emitted_modules: Optional[Dict[str, Set[str]]] = None):
         super().__init__()
-        # TODO #2069: check if this list can be taken from LFRicConstants
-        # TODO #2018: once r_field is defined in the LFRic infrastructure,
-        #             it should be added to this list.
         self._region_name = region_name
-        self._all_field_types = ["integer_field_type", "field_type",
-                                 "r_bl_field", "r_solver_field_type",
-                                 "r_tran_field_type"]
+        self._all_field_types = self._ALL_FIELD_TYPES
+        self._share_common = share_common
+        if emitted_modules is None:
+            emitted_modules = {}
+        self._emitted_modules = emitted_modules
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -250,40 +277,95 @@ class LFRicExtractDriverCreator(BaseDriverCreator):
             program_symbol_table.find_or_create("psydata_i",
                                                 symbol_type=DataSymbol,
                                                 datatype=INTEGER_TYPE).name
+
         # We can only parse one statement at a time, so start with the
-        # command line handling:
-        code = f"""
-        do {psydata_i}=1,command_argument_count()
-           call get_command_argument({psydata_i}, length={psydata_len})
-           allocate(character({psydata_len})::{psydata_arg})
-           call get_command_argument({psydata_i}, {psydata_arg}, &
-                                     length={psydata_len})
-           if ({psydata_arg} == "--update") then
-              ! For later to allow marking fields as being updated
-           else
-              allocate(character({psydata_len})::{psydata_filename})
-              {psydata_filename} = {psydata_arg}
-           endif
-           deallocate({psydata_arg})
-        enddo
-        """
-        command_line = \
-            FortranReader().psyir_from_statement(code, program_symbol_table)
+        # command line handling. The source code is only created if the
+        # parsed statement is not cached yet.
+        def command_line_code():
+            return f"""
+            do {psydata_i}=1,command_argument_count()
+               call get_command_argument({psydata_i}, length={psydata_len})
+               allocate(character({psydata_len})::{psydata_arg})
+               call get_command_argument({psydata_i}, {psydata_arg}, &
+                                         length={psydata_len})
+               if ({psydata_arg} == "--update") then
+                  ! For later to allow marking fields as being updated
+               else
+                  allocate(character({psydata_len})::{psydata_filename})
+                  {psydata_filename} = {psydata_arg}
+               endif
+               deallocate({psydata_arg})
+            enddo
+            """
+        command_line = self._parse_statement(
+            ("command_line", psydata_i, psydata_len, psydata_arg,
+             psydata_filename),
+            command_line_code, program_symbol_table)
         program.children.insert(0, command_line)
 
-        # Now add the handling of the filename parameter
-        code = f"""
-        if (allocated({psydata_filename})) then
-           call {psy_data_var.name}%OpenReadFileName({psydata_filename})
-        else
-           call {psy_data_var.name}%OpenReadModuleRegion('{module_name}', &
-                                                         '{region_name}')
-        endif
-        """
-        filename_test = \
-            FortranReader().psyir_from_statement(code, program_symbol_table)
+        # Now add the handling of the filename parameter. The module and
+        # region names are not part of the cache key, they are set below.
+        def filename_test_code():
+            return f"""
+            if (allocated({psydata_filename})) then
+               call {psy_data_var.name}%OpenReadFileName({psydata_filename})
+            else
+               call {psy_data_var.name}%OpenReadModuleRegion('{module_name}', &
+                                                             '{region_name}')
+            endif
+            """
+        filename_test = self._parse_statement(
+            ("filename_test", psydata_filename, psy_data_var.name),
+            filename_test_code, program_symbol_table)
+        open_region = filename_test.else_body[0]
+        open_region.arguments[0].replace_with(Literal(module_name,
+                                                      CHARACTER_TYPE))
+        open_region.arguments[1].replace_with(Literal(region_name,
+                                                      CHARACTER_TYPE))
         program.children.insert(1, filename_test)
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _parse_statement(key, create_code, symbol_table):
+        '''Returns the PSyIR of a Fortran statement, which is parsed using
+        the supplied symbol table. The parsed statement is cached using the
+        supplied key, which must contain all names used in the statement.
+        If the statement is already cached, a copy is returned, which uses
+        the symbols from the supplied symbol table (any symbol that the
+        parser would have added, e.g. 'get_command_argument', is added).
+        Note that CodeBlocks only store the names, which is why the key
+        must contain them.
+
+        :param key: the key for the cached statement.
+        :type key: Tuple[str, ...]
+        :param create_code: a function that returns the Fortran source code
+            of the statement. It is only called if the statement is not
+            cached.
+        :type create_code: Callable[[], str]
+        :param symbol_table: the symbol table to use.
+        :type symbol_table: :py:class:`psyclone.psyir.symbols.SymbolTable`
+
+        :returns: the PSyIR of the statement.
+        :rtype: :py:class:`psyclone.psyir.nodes.Statement`
+
+        '''
+        cache = LFRicExtractDriverCreator._statement_cache
+        cached = cache.get(key)
+        if cached is None:
+            statement = FortranReader().psyir_from_statement(create_code(),
+                                                             symbol_table)
+            cache[key] = statement.copy()
+            return statement
+
+        statement = cached.copy()
+        for ref in statement.walk(Reference):
+            sym = ref.symbol
+            if (not isinstance(sym, IntrinsicSymbol) and
+                    sym.name not in symbol_table):
+                symbol_table.add(sym.copy())
+        statement.replace_symbols_using(symbol_table)
+        return statement
+
     # -------------------------------------------------------------------------
     def create(self, nodes, read_write_info, prefix, postfix, region_name):
         # pylint: disable=too-many-arguments
@@ -343,9 +425,14 @@ class LFRicExtractDriverCreator(BaseDriverCreator):
                                                    datatype=psy_data_type)
 
         extract_region = nodes[0].copy()
+        # Walk the tree once to find both the StructureReferences and the
+        # calls, which are needed to find the imported modules below.
+        all_nodes = extract_region.walk((StructureReference, Call))
         # StructureReference must have been flattened before creating the
         # driver, or are method calls. In both cases they are not allowed.
-        for sref in extract_region.walk(StructureReference):
+        for sref in all_nodes:
+            if not isinstance(sref, StructureReference):
+                continue
             dm_methods = ("set_dirty", "set_clean")
             if (isinstance(sref.parent, Call) and
                     sref.member.name in dm_methods):
@@ -356,6 +443,9 @@ class LFRicExtractDriverCreator(BaseDriverCreator):
                 raise ValueError(f"The provided PSyIR should not have "
                                  f"StructureReferences, but found: "
                                  f"{sref.debug_string()}")
+        # Ignore the calls that have been removed above:
+        calls = [call for call in all_nodes
+                 if isinstance(call, Call) and call.root is extract_region]
 
         # Add cmd line hander, read in, and result comparison for the code
         self._add_command_line_handler(program, psy_data, module_name,
@@ -367,20 +457,24 @@ class LFRicExtractDriverCreator(BaseDriverCreator):
         # Copy the nodes that are part of the extraction
         program.children.extend(extract_region.pop_all_children())
 
-        # Find all imported modules and add them to the symbol table
-        self.import_modules(program)
+        # Find all imported modules and add them to the symbol table. Only
+        # the extracted calls can be imported, the calls added by the driver
+        # itself use the PSyData object or are intrinsics.
+        self.import_modules(program, calls)
         self._add_precision_symbols(program.scope.symbol_table)
 
         BaseDriverCreator.add_result_tests(program, output_symbols)
 
-        # Replace pointers with allocatables
+        # Replace pointers with allocatables. The datatype is only copied
+        # if the declaration needs to be changed.
         for symbol in program_symbol_table.datasymbols:
             if isinstance(symbol.datatype, UnsupportedFortranType):
-                symbol.datatype = symbol.datatype.copy()
-                newt = symbol.datatype._declaration
-                newt = newt.replace('pointer', 'allocatable')
+                old_decl = symbol.datatype._declaration
+                newt = old_decl.replace('pointer', 'allocatable')
                 newt = newt.replace('=> null()', '')
-                symbol.datatype._declaration = newt
+                if newt != old_decl:
+                    symbol.datatype = symbol.datatype.copy()
+                    symbol.datatype._declaration = newt
 
         return file_container
 
@@ -451,6 +545,30 @@ class LFRicExtractDriverCreator(BaseDriverCreator):
         :returns: the driver in the selected language.
         :rtype: str
 
+        '''
+        parts = self._get_driver_parts(nodes, read_write_info, prefix,
+                                       postfix, region_name, writer)
+        return "\n".join(code for _, code in parts)
+
+    # -------------------------------------------------------------------------
+    def _get_driver_parts(
+            self, nodes, read_write_info, prefix, postfix, region_name,
+            writer) -> List[Tuple[Optional[str], str]]:
+        # pylint: disable=too-many-arguments
+        '''This function creates the stand-alone driver and returns the
+        source code of all required modules in the correct order, followed
+        by the driver program itself. The parameters are the same as for
+        ``get_driver_as_string()``.
+
+        The source code of the modules is cached by the module manager, so
+        returning the parts separately allows the caller to avoid creating
+        a copy of all of them in one (potentially very large) string.
+
+        :returns: the source code of the driver, in parts that need to be
+            joined using a newline. Each part is a pair of the name of the
+            inlined module (or None for the driver program) and its source.
+        :rtype: List[Tuple[Optional[str], str]]
+
         '''
         file_container = self.create(nodes, read_write_info, prefix,
                                      postfix, region_name)
@@ -471,20 +589,30 @@ class LFRicExtractDriverCreator(BaseDriverCreator):
             # Note that all modules in `sorted_modules` are known to be in
             # the module manager, so we can always get the module info here.
             mod_info = mod_manager.get_module_info(module)
-            out.append(mod_info.get_source_code())
+            out.append((module, mod_info.get_source_code()))
 
-        out.append(writer(file_container))
+        out.append((None, writer(file_container)))
 
-        return "\n".join(out)
+        return out
 
     # -------------------------------------------------------------------------
     def write_driver(self, nodes, read_write_info, prefix, postfix,
                      region_name, writer=FortranWriter()):
         # pylint: disable=too-many-arguments
-        '''This function uses the ``get_driver_as_string()`` function to get a
-        a stand-alone driver, and then writes this source code to a file. The
-        file name is derived from the region name:
-        "driver-"+module_name+"_"+region_name+".F90"
+        '''This function creates a stand-alone driver in the same way as
+        the ``get_driver_as_string()`` function, and then writes this source
+        code to a file. The file name is derived from the region name:
+        "driver-"+module_name+"-"+local_name+".F90"
+        Each inlined module and the driver program are line-wrapped and
+        written separately, so the whole source code is never stored in a
+        single string.
+
+        If this creator was constructed with ``share_common``, the required
+        modules are not inlined into the driver. Instead, any module not yet
+        recorded in its ``emitted_modules`` is appended to the file
+        "driver-common.F90" (in dependency order), which then needs to be
+        compiled before the drivers. This avoids repeating the (often large)
+        infrastructure modules in each driver file.
 
         :param nodes: a list of nodes containing the body of the driver
             routine.
@@ -513,11 +641,51 @@ class LFRicExtractDriverCreator(BaseDriverCreator):
         '''
         if self._region_name is not None:
             region_name = self._region_name
-        code = self.get_driver_as_string(nodes, read_write_info, prefix,
-                                         postfix, region_name, writer=writer)
-        fll = FortLineLength()
-        code = fll.process(code)
+        parts = self._get_driver_parts(nodes, read_write_info, prefix,
+                                       postfix, region_name, writer)
+        if self._share_common:
+            common_file = os.path.abspath(self._COMMON_FILE_NAME)
+            emitted = self._emitted_modules.get(common_file)
+            if emitted is None or not os.path.exists(common_file):
+                # Nothing was recorded as written to this file, so
+                # overwrite any file left from a previous run.
+                emitted = set()
+                self._emitted_modules[common_file] = emitted
+                mode = "w"
+            else:
+                mode = "a"
+            new_modules = [code for name, code in parts
+                           if name is not None and name not in emitted]
+            if new_modules or mode == "w":
+                self._write_wrapped(common_file, new_modules, mode)
+            emitted.update(name for name, _ in parts if name is not None)
+            parts = [code for name, code in parts if name is None]
+        else:
+            parts = [code for _, code in parts]
+
         module_name, local_name = region_name
-        with open(f"driver-{module_name}-{local_name}.F90", "w",
-                  encoding='utf-8') as out:
-            out.write(code)
+        self._write_wrapped(f"driver-{module_name}-{local_name}.F90", parts)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _write_wrapped(filename: str, parts: List[str], mode: str = "w"):
+        '''Line wraps the given parts of source code and writes them,
+        separated by newlines, to the specified file.
+
+        :param filename: the name of the file to write to.
+        :param parts: the parts of source code to write.
+        :param mode: the mode in which to open the file. If it is "a", the
+            parts are separated from the existing content by a newline.
+
+        '''
+        fll = FortLineLength()
+        with open(filename, mode, encoding='utf-8') as out:
+            # Line wrapping handles each line independently, so wrapping
+            # and writing one line at a time gives the same result as
+            # wrapping the joined parts, without creating a wrapped copy.
+            separator = "\n" if mode == "a" else ""
+            for part in parts:
+                for line in part.split("\n"):
+                    out.write(separator)
+                    out.write(fll.process_line(line))
+                    separator = "\n"
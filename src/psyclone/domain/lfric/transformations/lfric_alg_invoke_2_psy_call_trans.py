@@ -202,8 +202,10 @@ class LFRicAlgInvoke2PSyCallTrans(AlgInvoke2PSyCallTrans):
         # arguments) and finally all qr arguments.
 
         # The processed (lowered) argument list for scalar, field and
-        # operator arguments.
+        # operator arguments, together with an index of the references
+        # it contains (see _add_arg).
         arguments = []
+        arg_keys = {}
         # The processed (lowered) argument lists for any stencil
         # arguments (separated into stencil size and direction
         # arguments).
@@ -227,7 +229,7 @@ class LFRicAlgInvoke2PSyCallTrans(AlgInvoke2PSyCallTrans):
             for meta_arg in kernel_metadata.meta_args:
                 if not check_args:
                     arg = kern_call.children[arg_idx]
-                    self._add_arg(arg, arguments)
+                    self._add_arg(arg, arguments, arg_keys)
                 if type(meta_arg) in [
                         FieldArgMetadata, FieldVectorArgMetadata,
                         InterGridArgMetadata, InterGridVectorArgMetadata]:
@@ -69,6 +69,10 @@ class LFRicExtractTrans(ExtractTrans):
 
     def __init__(self):
         super().__init__(ExtractNode)
+        # For each common file of drivers created with the 'share_common'
+        # option, the names of the modules already written to it. This is
+        # shared by all drivers created using this transformation.
+        self._emitted_modules = {}
 
     def validate(self, node_list, options=None):
         ''' Perform LFRic API specific validation checks before applying
@@ -124,8 +128,14 @@ class LFRicExtractTrans(ExtractTrans):
         :param bool options["create_driver"]: whether or not to create a \
             driver program at code-generation time. If set, the driver will \
             be created in the current working directory with the name \
-            "driver-MODULE-REGION.f90" where MODULE and REGION will be the \
+            "driver-MODULE-REGION.F90" where MODULE and REGION will be the \
             corresponding values for this region. Defaults to False.
+        :param bool options["share_common"]: if a driver is created, \
+            whether the modules it requires are written to a file \
+            "driver-common.F90" shared by all drivers (each module only \
+            once) instead of being inlined into the driver. All drivers \
+            sharing this file must be created using the same instance of \
+            this transformation. Defaults to False.
         :param Tuple[str,str] options["region_name"]: an optional name to \
             use for this PSyData area, provided as a 2-tuple containing a \
             location name followed by a local name. The pair of strings \
@@ -145,4 +155,7 @@ class LFRicExtractTrans(ExtractTrans):
         new_node = nodes[0].ancestor(ExtractNode)
         if my_options.get("create_driver", False):
             region_name = my_options.get("region_name", None)
-            new_node._driver_creator = LFRicExtractDriverCreator(region_name)
+            new_node._driver_creator = LFRicExtractDriverCreator(
+                region_name,
+                share_common=my_options.get("share_common", False),
+                emitted_modules=self._emitted_modules)
@@ -67,6 +67,9 @@ class RaisePSyIR2LFRicAlgTrans(RaisePSyIR2AlgTrans):
         call_name = None
         calls = []
         table = call.scope.symbol_table
+        # Kernel type symbols found so far in this invoke, indexed by their
+        # lower-cased name, as the same kernel is often called repeatedly.
+        type_symbols = {}
 
         factory = LFRicBuiltinFunctorFactory.get()
 
@@ -96,8 +99,11 @@ class RaisePSyIR2LFRicAlgTrans(RaisePSyIR2AlgTrans):
                     except KeyError:
                         # No match for a builtin so create a user-defined
                         # kernel.
-                        type_symbol = RaisePSyIR2AlgTrans._get_symbol(
-                            call, fp2_node)
+                        type_symbol = type_symbols.get(name.lower())
+                        if type_symbol is None:
+                            type_symbol = RaisePSyIR2AlgTrans._get_symbol(
+                                table, fp2_node)
+                            type_symbols[name.lower()] = type_symbol
                         self._specialise_symbol(type_symbol)
                         calls.append(LFRicKernelFunctor.create(type_symbol,
                                                                args))
@@ -157,43 +157,55 @@ class FortLineLength():
         :rtype: str
 
         '''
-        fortran_out = ""
-        for line in fortran_in.split('\n'):
-            if len(line) > self._line_length:
-                line_type = self._get_line_type(line)
-
-                c_start = self._cont_start[line_type]
-                c_end = self._cont_end[line_type]
-                key_list = self._key_lists[line_type]
-
-                try:
-                    break_point = find_break_point(
-                        line, self._line_length-len(c_end), key_list)
-                except InternalError:
-                    # Couldn't find a valid point to break the line.
-                    # Remove indentation and try again.
-                    line = line.lstrip()
-                    if len(line) < self._line_length:
-                        fortran_out += line + "\n"
-                        continue
-                    break_point = find_break_point(
-                        line, self._line_length-len(c_end), key_list)
-
-                fortran_out += line[:break_point] + c_end + "\n"
-                line = line[break_point:]
-                while len(line) + len(c_start) > self._line_length:
-                    break_point = find_break_point(
-                        line, self._line_length-len(c_end)-len(c_start),
-                        key_list)
-                    fortran_out += c_start + line[:break_point] + c_end + "\n"
-                    line = line[break_point:]
-                if line:
-                    fortran_out += c_start + line + "\n"
-            else:
-                fortran_out += line + "\n"
-
-        # We add an extra newline so remove it when we return
-        return fortran_out[:-1]
+        return "\n".join(self.process_line(line)
+                         for line in fortran_in.split('\n'))
+
+    def process_line(self, line):
+        ''' Line wraps a single line of unlimited line-length Fortran
+        code. This allows code to be wrapped (and e.g. written to a file)
+        one line at a time, without creating a wrapped copy of the whole
+        source.
+
+        :param str line: a single line of Fortran code (without a
+            trailing newline).
+
+        :returns: the line wrapped over as many lines as required, which
+            are separated (but not terminated) by newlines.
+        :rtype: str
+
+        '''
+        if len(line) <= self._line_length:
+            return line
+
+        line_type = self._get_line_type(line)
+
+        c_start = self._cont_start[line_type]
+        c_end = self._cont_end[line_type]
+        key_list = self._key_lists[line_type]
+
+        try:
+            break_point = find_break_point(
+                line, self._line_length-len(c_end), key_list)
+        except InternalError:
+            # Couldn't find a valid point to break the line.
+            # Remove indentation and try again.
+            line = line.lstrip()
+            if len(line) < self._line_length:
+                return line
+            break_point = find_break_point(
+                line, self._line_length-len(c_end), key_list)
+
+        wrapped_lines = [line[:break_point] + c_end]
+        line = line[break_point:]
+        while len(line) + len(c_start) > self._line_length:
+            break_point = find_break_point(
+                line, self._line_length-len(c_end)-len(c_start),
+                key_list)
+            wrapped_lines.append(c_start + line[:break_point] + c_end)
+            line = line[break_point:]
+        if line:
+            wrapped_lines.append(c_start + line)
+        return "\n".join(wrapped_lines)
 
     def _get_line_type(self, line):
         ''' Classes lines into diffrent types. This is required as
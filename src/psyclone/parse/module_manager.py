@@ -39,7 +39,7 @@ which module is contained in which file (including full location). '''
 
 import copy
 from difflib import SequenceMatcher
-from typing import Dict, Iterable, List, Set, Union, OrderedDict
+from typing import Dict, Iterable, List, Set, Tuple, Union, OrderedDict
 import os
 import re
 
@@ -142,6 +142,12 @@ class ModuleManager:
         self._modules: OrderedDict[str, ModuleInfo] = \
             OrderedDict()
 
+        # For modules in files that require preprocessing, this stores
+        # the number of visited files after all search paths have been
+        # searched, and the ModuleInfo found. As long as no new files
+        # are visited, searching again would find the same module.
+        self._completed_searches: Dict[str, Tuple[int, ModuleInfo]] = {}
+
         self._ignore_modules = set()
 
         # Setup the regex used to find Fortran modules. Have to be careful not
@@ -443,6 +449,12 @@ class ModuleManager:
         mod_info: ModuleInfo = self._modules.get(mod_lower, None)
         if mod_info and mod_info.filename.endswith(".f90"):
             return mod_info
+        # A module that requires pre-processing only needs to be searched
+        # for again if new files might contain a better match.
+        if (mod_info and not self._remaining_search_paths and
+                self._completed_searches.get(mod_lower) ==
+                (len(self._visited_files), mod_info)):
+            return mod_info
         old_mod_info = mod_info
         # Are any of the files that we've already seen a good match?
         mod_info = self._find_module_in_files(mod_lower,
@@ -464,6 +476,8 @@ class ModuleManager:
                 return mod_info
 
         if old_mod_info:
+            self._completed_searches[mod_lower] = (len(self._visited_files),
+                                                   old_mod_info)
             return old_mod_info
 
         raise FileNotFoundError(f"Could not find source file for module "
@@ -64,6 +64,20 @@ from psyclone.psyir.symbols import (
 INNER_PRODUCT_TOLERANCE = 1500.0
 
 
+def _vector_dims(datatype):
+    '''
+    :param datatype: the type of a field vector (or of an array holding
+        a value for each of its components).
+    :type datatype: :py:class:`psyclone.psyir.symbols.ArrayType`
+
+    :returns: the indices of the components of the field vector.
+    :rtype: range
+
+    '''
+    shape = datatype.shape[0]
+    return range(int(shape.lower.value), int(shape.upper.value)+1)
+
+
 def _compute_lfric_inner_products(prog, scalars, field_sums, sum_sym):
     '''
     Adds PSyIR to a supplied Routine to compute the sum of the inner products
@@ -85,46 +99,41 @@ def _compute_lfric_inner_products(prog, scalars, field_sums, sum_sym):
     idef_sym = table.add_lfric_precision_symbol("i_def")
     idef_type = ScalarType(ScalarType.Intrinsic.INTEGER, idef_sym)
 
-    # Initialise the sum to zero: sum = 0.0
-    prog.addchild(Assignment.create(Reference(sum_sym),
-                                    Literal("0.0", sum_sym.datatype)))
+    # Collect all of the terms to be summed.
+    terms = []
     for scalar in scalars:
         # Compute the product of the pair of scalars: scalar[0]*scalar[1]
         # (unless they are boolean).
         if scalar[0].datatype.intrinsic == ScalarType.Intrinsic.BOOLEAN:
             continue
-        prod = BinaryOperation.create(BinaryOperation.Operator.MUL,
-                                      Reference(scalar[0]),
-                                      Reference(scalar[1]))
-        # Add this product to the sum:
-        #     sum = sum + scalar[0]*scalar[1]
-        prog.addchild(
-                Assignment.create(
-                    Reference(sum_sym),
-                    BinaryOperation.create(BinaryOperation.Operator.ADD,
-                                           Reference(sum_sym), prod)))
+        terms.append(BinaryOperation.create(BinaryOperation.Operator.MUL,
+                                            Reference(scalar[0]),
+                                            Reference(scalar[1])))
     for sym in field_sums:
         if sym.is_scalar:
-            # Add this result of a field inner product to the sum:
-            #     sum = sum + field_sum
-            prog.addchild(
-                    Assignment.create(
-                        Reference(sum_sym),
-                        BinaryOperation.create(BinaryOperation.Operator.ADD,
-                                               Reference(sum_sym),
-                                               Reference(sym))))
+            # The result of a field inner product.
+            terms.append(Reference(sym))
         else:
             # For a field vector we have an array of inner-product values that
             # must be summed.
-            for dim in range(int(sym.datatype.shape[0].lower.value),
-                             int(sym.datatype.shape[0].upper.value)+1):
-                # sum = sum + field_sum(dim)
-                add_op = BinaryOperation.create(
-                    BinaryOperation.Operator.ADD,
-                    Reference(sum_sym),
-                    ArrayReference.create(sym,
-                                          [Literal(str(dim), idef_type)]))
-                prog.addchild(Assignment.create(Reference(sum_sym), add_op))
+            for dim in _vector_dims(sym.datatype):
+                terms.append(ArrayReference.create(
+                    sym, [Literal(str(dim), idef_type)]))
+
+    if not terms:
+        # sum = 0.0
+        prog.addchild(Assignment.create(Reference(sum_sym),
+                                        Literal("0.0", sum_sym.datatype)))
+        return
+
+    # Compute the sum in a single assignment: sum = term1 + term2 + ...
+    # The terms are added from left to right, which gives the same result
+    # as accumulating them one by one into a sum initialised to zero.
+    expr = terms[0]
+    for term in terms[1:]:
+        expr = BinaryOperation.create(BinaryOperation.Operator.ADD,
+                                      expr, term)
+    prog.addchild(Assignment.create(Reference(sum_sym), expr))
 
 
 def _compute_field_inner_products(routine, field_pairs):
@@ -213,8 +222,7 @@ def _compute_field_inner_products(routine, field_pairs):
             ip_sym = table.new_symbol(inner_prod_name,
                                       symbol_type=DataSymbol,
                                       datatype=dtype)
-            for dim in range(int(sym1.datatype.shape[0].lower.value),
-                             int(sym1.datatype.shape[0].upper.value)+1):
+            for dim in _vector_dims(sym1.datatype):
                 lit = Literal(str(dim), idef_type)
                 # Zero the inner product for this component pair.
                 routine.addchild(Assignment.create(
@@ -283,8 +291,7 @@ def _init_fields_random(fields, input_symbols, table):
         elif isinstance(sym.datatype, ArrayType):
             # Initialise each member of the field vector with pseudo-random
             # numbers.
-            for dim in range(int(sym.datatype.shape[0].lower.value),
-                             int(sym.datatype.shape[0].upper.value)+1):
+            for dim in _vector_dims(sym.datatype):
                 lit = Literal(str(dim), idef_type)
                 # Initialise this component with pseudo-random numbers.
                 kernel_list.append(
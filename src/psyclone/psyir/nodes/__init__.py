@@ -93,12 +93,14 @@ from psyclone.psyir.nodes.omp_directives import (
     OMPStandaloneDirective, OMPRegionDirective, OMPTargetDirective,
     OMPLoopDirective, OMPDeclareTargetDirective,
     OMPTeamsDistributeParallelDoDirective, OMPAtomicDirective,
-    OMPSimdDirective, OMPTeamsLoopDirective, OMPBarrierDirective)
+    OMPSimdDirective, OMPTeamsLoopDirective, OMPBarrierDirective,
+    OMPTileDirective)
 from psyclone.psyir.nodes.clause import Clause, OperandClause
 from psyclone.psyir.nodes.omp_clauses import (
     OMPGrainsizeClause, OMPNogroupClause, OMPNowaitClause, OMPNumTasksClause,
     OMPPrivateClause, OMPDefaultClause, OMPReductionClause, OMPScheduleClause,
-    OMPFirstprivateClause, OMPSharedClause, OMPDependClause)
+    OMPFirstprivateClause, OMPLastprivateClause, OMPSharedClause,
+    OMPDependClause)
 from psyclone.psyir.nodes.omp_task_directive import OMPTaskDirective
 from psyclone.psyir.nodes.while_loop import WhileLoop
 
@@ -187,6 +189,7 @@ __all__ = [
         'OMPSimdDirective',
         'OMPTeamsDistributeParallelDoDirective',
         'OMPTeamsLoopDirective',
+        'OMPTileDirective',
         # OMP Clause Nodes
         'OMPGrainsizeClause',
         'OMPNogroupClause',
@@ -197,6 +200,7 @@ __all__ = [
         'OMPReductionClause',
         'OMPScheduleClause',
         'OMPFirstprivateClause',
+        'OMPLastprivateClause',
         'OMPSharedClause',
         'OMPDependClause'
         ]
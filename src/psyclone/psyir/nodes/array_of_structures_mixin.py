@@ -134,9 +134,9 @@ class ArrayOfStructuresMixin(ArrayMixin,  StructureAccessorMixin,
             lists of indices)
 
         '''
-        sub_sig, indices = self.children[0].get_signature_and_indices()
-        sig = Signature(self.name)
-        return (Signature(sig, sub_sig), [list(self.indices)]+indices)
+        components, indices = self._get_member_components_and_indices()
+        return (Signature.from_components([self.name] + components),
+                [list(self.indices)] + indices)
 
 
 # For AutoAPI documentation generation
@@ -133,7 +133,7 @@ class Member(Node):
             since it is not an array access.
         :rtype: tuple[:py:class:`psyclone.core.Signature`, List[List[int]]]
         '''
-        return (Signature(self.name), [[]])
+        return (Signature.intern(self.name), [[]])
 
     def get_base_and_depth(self):
         '''
@@ -283,6 +283,73 @@ class OMPFirstprivateClause(Clause):
         return isinstance(child, Reference)
 
 
+class OMPLastprivateClause(Clause):
+    '''
+    OpenMP lastprivate clause. This is used to declare variables as
+    private to an OpenMP region, with the value from the sequentially last
+    iteration being assigned to the original variable after the region.
+    '''
+    _children_valid_format = "Reference*"
+
+    @staticmethod
+    def create(symbols):
+        ''' Create an OMPLastprivateClause containing a Reference to each of
+        the provided symbols as children.
+
+        :param symbols: List of symbols to reference in the lastprivate \
+            clause.
+        :type symbols: List[:py:class:`psyclone.psyir.symbols.Symbol`]
+
+        :returns: A OMPLastprivateClause referencing the provided symbols.
+        :rtype: py:class:`psyclone.psyir.nodes.OMPLastprivateClause`
+
+        :raises TypeError: If the symbols argument is not a List that \
+            contains only PSyIR Symbols.
+
+        '''
+        if not isinstance(symbols, list):
+            raise TypeError(
+                f"OMPLastprivateClause expected the 'symbols' argument to be "
+                f"a list, but found '{type(symbols).__name__}' instead.")
+        for symbol in symbols:
+            if not isinstance(symbol, Symbol):
+                raise TypeError(
+                    f"OMPLastprivateClause expected all the items in the "
+                    f"'symbols' list to be PSyIR Symbols, but found a "
+                    f"'{type(symbol).__name__}'.")
+
+        references = [Reference(symbol) for symbol in symbols]
+        return OMPLastprivateClause(children=references)
+
+    @property
+    def _clause_string(self):
+        '''
+        :returns: the string that represents this clause in OpenMP (i.e.\
+                "lastprivate"). Returns an empty string to avoid generation\
+                of code if this clause has no children.
+        :rtype: str
+        '''
+        if len(self.children) > 0:
+            return "lastprivate"
+        return ""
+
+    @staticmethod
+    def _validate_child(position, child):
+        '''
+        Decides whether a given child and position are valid for this node.
+        Any number of Reference nodes are allowed.
+
+        :param int position: the position to be validated.
+        :param child: a child to be validated.
+        :type child: :py:class:`psyclone.psyir.nodes.Node`
+
+        :return: whether the given child and position are valid for this node.
+        :rtype: bool
+
+        '''
+        return isinstance(child, Reference)
+
+
 class OMPDefaultClause(Clause):
     '''
     OpenMP Default clause. Used to determine the default declaration for
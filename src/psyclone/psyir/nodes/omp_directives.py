@@ -47,6 +47,7 @@ import abc
 import itertools
 import sympy
 import logging
+from typing import List, Optional, Tuple
 
 from psyclone.configuration import Config
 from psyclone.core import AccessType
@@ -68,7 +69,7 @@ from psyclone.psyir.nodes.operation import BinaryOperation
 from psyclone.psyir.nodes.omp_clauses import OMPGrainsizeClause, \
     OMPNowaitClause, OMPNogroupClause, OMPNumTasksClause, OMPPrivateClause, \
     OMPDefaultClause, OMPReductionClause, OMPScheduleClause, \
-    OMPFirstprivateClause, OMPDependClause
+    OMPFirstprivateClause, OMPLastprivateClause, OMPDependClause
 from psyclone.psyir.nodes.ranges import Range
 from psyclone.psyir.nodes.reference import Reference
 from psyclone.psyir.nodes.routine import Routine
@@ -76,7 +77,7 @@ from psyclone.psyir.nodes.schedule import Schedule
 from psyclone.psyir.nodes.structure_reference import StructureReference
 from psyclone.psyir.symbols import (
     INTEGER_TYPE, ScalarType, DataSymbol, ImportInterface, ContainerSymbol,
-    RoutineSymbol)
+    RoutineSymbol, AutomaticInterface)
 
 # OMP_OPERATOR_MAPPING is used to determine the operator to use in the
 # reduction clause of an OpenMP directive.
@@ -1864,6 +1865,17 @@ class OMPDoDirective(OMPRegionDirective, DataSharingAttributeMixin):
         '''
         if self._collapse:
             cursor = self.dir_body
+            if (len(cursor.children) == 1 and
+                    isinstance(cursor.children[0], OMPTileDirective)):
+                # The collapse applies to the loops generated by the tile
+                # construct, which has one tile loop per tiled dimension.
+                num_tiled = len(cursor.children[0].sizes)
+                if self._collapse > num_tiled:
+                    raise GenerationError(
+                        f"{type(self).__name__} has a collapse="
+                        f"{self._collapse} but its associated "
+                        f"OMPTileDirective only tiles {num_tiled} loops.")
+                return
             for depth in range(self._collapse):
                 if (len(cursor.children) != 1 or
                         not isinstance(cursor.children[0], Loop)):
@@ -1889,7 +1901,7 @@ class OMPDoDirective(OMPRegionDirective, DataSharingAttributeMixin):
                 f"loop but this Node has {len(self.dir_body.children)} "
                 f"children: {self.dir_body.children}")
 
-        if not isinstance(self.dir_body[0], Loop):
+        if not isinstance(self.dir_body[0], (Loop, OMPTileDirective)):
             raise GenerationError(
                 f"An {type(self).__name__} can only be applied to a loop but "
                 f"this Node has a child of type "
@@ -2407,18 +2419,175 @@ class OMPAtomicDirective(OMPRegionDirective):
                 f"valid OpenMP Atomic statement.")
 
 
-class OMPSimdDirective(OMPRegionDirective):
+class OMPSimdDirective(OMPRegionDirective, DataSharingAttributeMixin):
     '''
     OpenMP directive to inform that the associated loop can be vectorised.
+    When lowered, the scalars written in each iteration of the loop are
+    declared private (or lastprivate if they may be used after the loop).
+
+    :param aligned: optional names of the arrays whose data is guaranteed to
+        be aligned (to 'alignment' bytes) for the associated loop.
+    :param alignment: optional alignment, in bytes, of the aligned arrays.
+    :param safelen: optional maximum distance between two iterations that
+        can be executed concurrently.
+    :param kwargs: additional keyword arguments provided to the PSyIR node.
+    :type kwargs: unwrapped dict.
+
+    :raises TypeError: if aligned is not a list of str.
+    :raises TypeError: if alignment or safelen is not a positive int.
+    :raises ValueError: if an alignment is provided without aligned arrays.
 
     '''
+    _children_valid_format = ("Schedule, [OMPPrivateClause, "
+                              "OMPLastprivateClause]")
+
+    def __init__(self, aligned: Optional[List[str]] = None,
+                 alignment: Optional[int] = None,
+                 safelen: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+        if aligned is not None and (
+                not isinstance(aligned, (list, tuple)) or
+                not all(isinstance(name, str) for name in aligned)):
+            raise TypeError(
+                f"The OMPSimdDirective 'aligned' argument must be a list of "
+                f"str but found '{aligned}'.")
+        for name, value in [("alignment", alignment), ("safelen", safelen)]:
+            if value is not None and (not isinstance(value, int) or
+                                      value < 1):
+                raise TypeError(
+                    f"The OMPSimdDirective '{name}' argument must be a "
+                    f"positive int but found '{value}'.")
+        if alignment is not None and not aligned:
+            raise ValueError(
+                "The OMPSimdDirective 'alignment' argument can only be "
+                "provided together with 'aligned' arrays.")
+        self._aligned = list(aligned) if aligned else []
+        self._alignment = alignment
+        self._safelen = safelen
+
+    def __eq__(self, other):
+        '''
+        Checks whether two nodes are equal. Two OMPSimdDirective nodes are
+        equal if they have the same clauses and the inherited equality is
+        true.
+
+        :param object other: the object to check equality to.
+
+        :returns: whether other is equal to self.
+        :rtype: bool
+        '''
+        is_eq = super().__eq__(other)
+        is_eq = is_eq and self.aligned == other.aligned
+        is_eq = is_eq and self.alignment == other.alignment
+        is_eq = is_eq and self.safelen == other.safelen
+
+        return is_eq
+
+    @property
+    def aligned(self) -> List[str]:
+        '''
+        :returns: the names of the arrays declared as aligned.
+        '''
+        return self._aligned
+
+    @property
+    def alignment(self) -> Optional[int]:
+        '''
+        :returns: the alignment, in bytes, of the aligned arrays (if any).
+        '''
+        return self._alignment
+
+    @property
+    def safelen(self) -> Optional[int]:
+        '''
+        :returns: the safelen of the associated loop (if any).
+        '''
+        return self._safelen
+
+    @staticmethod
+    def _validate_child(position, child):
+        '''
+        :param int position: the position to be validated.
+        :param child: a child to be validated.
+        :type child: :py:class:`psyclone.psyir.nodes.Node`
+
+        :return: whether the given child and position are valid for this node.
+        :rtype: bool
+
+        '''
+        if position == 0 and isinstance(child, Schedule):
+            return True
+        if position == 1 and isinstance(child, OMPPrivateClause):
+            return True
+        if position == 2 and isinstance(child, OMPLastprivateClause):
+            return True
+        return False
+
+    def lower_to_language_level(self):
+        '''
+        In-place construction of the private and lastprivate clauses. The
+        loop variable of the associated loop is predetermined by OpenMP and
+        is not listed. The other scalars written in the loop are private,
+        unless they are not local to the routine or are referenced after
+        the loop, in which case they are lastprivate.
+
+        :returns: the lowered version of this node.
+        :rtype: :py:class:`psyclone.psyir.node.Node`
+
+        :raises GenerationError: if a scalar would need to be firstprivate,
+            which is not allowed on an OpenMP simd construct.
+
+        '''
+        self._children = self._children[:1]
+        for child in self.children:
+            child.lower_to_language_level()
+
+        private, fprivate, need_sync = self.infer_sharing_attributes()
+        if fprivate:
+            raise GenerationError(
+                f"The OMPSimdDirective cannot be lowered because the scalars "
+                f"{sorted(sym.name for sym in fprivate)} would need to be "
+                f"firstprivate, which is not allowed on an OpenMP simd "
+                f"construct.")
+        if need_sync:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Lowering '%s' detected a possible race condition for "
+                "symbols %s. Make sure these are false WaW dependencies.",
+                type(self).__name__, sorted(sym.name for sym in need_sync))
+
+        if self.dir_body.children and isinstance(self.dir_body[0], Loop):
+            private.discard(self.dir_body[0].variable)
+        following = {ref.symbol for ref in
+                     self.following(include_children=False)
+                     if isinstance(ref, Reference)}
+        lastprivate = {sym for sym in private
+                       if sym in following or
+                       not isinstance(sym.interface, AutomaticInterface)}
+        private -= lastprivate
+
+        # Order alphabetically to make generation reproducible
+        self.addchild(OMPPrivateClause.create(
+            sorted(private, key=lambda x: x.name)))
+        self.addchild(OMPLastprivateClause.create(
+            sorted(lastprivate, key=lambda x: x.name)))
+        return self
+
     def begin_string(self):
         '''
         :returns: the opening string statement of this directive.
         :rtype: str
 
         '''
-        return "omp simd"
+        result = "omp simd"
+        if self._aligned:
+            result += f" aligned({','.join(self._aligned)}"
+            if self._alignment:
+                result += f":{self._alignment}"
+            result += ")"
+        if self._safelen:
+            result += f" safelen({self._safelen})"
+        return result
 
     def end_string(self):
         '''
@@ -2443,10 +2612,118 @@ class OMPSimdDirective(OMPRegionDirective):
                 f" associated loop, but found: '{self.debug_string()}'")
 
 
+class OMPTileDirective(OMPRegionDirective):
+    '''
+    OpenMP (5.1) directive to tile the associated, perfectly-nested loops.
+    The tiles are traversed by new loops that are created by the compiler
+    and which can themselves be associated with an enclosing worksharing
+    directive (e.g. with a collapse clause).
+
+    :param sizes: the size of the tile for each of the outermost loops of
+        the associated loop nest.
+    :param kwargs: additional keyword arguments provided to the PSyIR node.
+    :type kwargs: unwrapped dict.
+
+    '''
+    def __init__(self, sizes: Tuple[int, ...] = (32, 32), **kwargs):
+        super().__init__(**kwargs)
+        self._sizes = None
+        self.sizes = sizes  # Use setter with error checking
+
+    def __eq__(self, other):
+        '''
+        Checks whether two nodes are equal. Two OMPTileDirective nodes are
+        equal if they have the same tile sizes and the inherited equality
+        is true.
+
+        :param object other: the object to check equality to.
+
+        :returns: whether other is equal to self.
+        :rtype: bool
+        '''
+        is_eq = super().__eq__(other)
+        is_eq = is_eq and self.sizes == other.sizes
+
+        return is_eq
+
+    @property
+    def sizes(self) -> Tuple[int, ...]:
+        '''
+        :returns: the size of the tile for each tiled loop.
+        '''
+        return self._sizes
+
+    @sizes.setter
+    def sizes(self, value: Tuple[int, ...]):
+        '''
+        :param value: the size of the tile for each tiled loop.
+
+        :raises TypeError: if the value is not a tuple or list of positive
+            integers.
+        '''
+        if (not isinstance(value, (tuple, list)) or not value or
+                not all(isinstance(size, int) and size > 0
+                        for size in value)):
+            raise TypeError(
+                f"The OMPTileDirective sizes must be a non-empty tuple of "
+                f"positive integers, but value '{value}' has been given.")
+        self._sizes = tuple(value)
+
+    def node_str(self, colour=True):
+        ''' Returns the name of this node with (optional) control codes
+        to generate coloured output in a terminal that supports it.
+
+        :param bool colour: whether or not to include colour control codes.
+
+        :returns: description of this node, possibly coloured.
+        :rtype: str
+        '''
+        return (f"{self.coloured_name(colour)}"
+                f"[sizes={','.join(str(size) for size in self._sizes)}]")
+
+    def begin_string(self):
+        '''
+        :returns: the opening string statement of this directive.
+        :rtype: str
+
+        '''
+        return f"omp tile sizes({','.join(str(size) for size in self._sizes)})"
+
+    def end_string(self):
+        '''
+        :returns: the ending string statement of this directive.
+        :rtype: str
+
+        '''
+        return "omp end tile"
+
+    def validate_global_constraints(self):
+        ''' Perform validation of those global constraints that can only be
+        done at code-generation time.
+
+        :raises GenerationError: if the OMPTileDirective is not associated
+            with a perfectly-nested loop nest of at least as many loops as
+            there are tile sizes.
+
+        '''
+        cursor = self.dir_body
+        for depth in range(len(self._sizes)):
+            if (len(cursor.children) != 1 or
+                    not isinstance(cursor.children[0], Loop)):
+                raise GenerationError(
+                    f"The OMP TILE directive must be associated with "
+                    f"{len(self._sizes)} perfectly-nested loops but the "
+                    f"nested body at depth {depth} of "
+                    f"'{self.debug_string()}' is not a single loop.")
+            cursor = cursor.children[0].loop_body
+        super().validate_global_constraints()
+
+
 # For automatic API documentation generation
 __all__ = ["OMPRegionDirective", "OMPParallelDirective", "OMPSingleDirective",
            "OMPMasterDirective", "OMPDoDirective", "OMPParallelDoDirective",
            "OMPSerialDirective", "OMPTaskloopDirective", "OMPTargetDirective",
            "OMPTaskwaitDirective", "OMPDirective", "OMPStandaloneDirective",
            "OMPLoopDirective", "OMPDeclareTargetDirective",
-           "OMPAtomicDirective", "OMPSimdDirective", "OMPBarrierDirective"]
+           "OMPAtomicDirective", "OMPSimdDirective", "OMPBarrierDirective",
+           "OMPTileDirective"]
@@ -199,7 +199,7 @@ class Reference(DataNode):
         :rtype: tuple(:py:class:`psyclone.core.Signature`, list of \
             list of indices)
         '''
-        return (Signature(self.name), [[]])
+        return (Signature.intern(self.name), [[]])
 
     def reference_accesses(self) -> VariablesAccessMap:
         '''
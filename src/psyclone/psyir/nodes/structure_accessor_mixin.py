@@ -38,6 +38,7 @@
 ''' This module contains the implementation of the StructureAccessor Mixin. '''
 
 import abc
+from psyclone.psyir.nodes.array_mixin import ArrayMixin
 from psyclone.psyir.nodes.member import Member
 from psyclone.errors import InternalError
 
@@ -63,3 +64,28 @@ class StructureAccessorMixin(metaclass=abc.ABCMeta):
                 f"a first child that must be a (sub-class of) Member, but "
                 f"found: {self.children}")
         return self.children[0]
+
+    def _get_member_components_and_indices(self):
+        '''
+        Walks down the chain of members of this structure access and
+        collects the name and the indices of each of them.
+
+        :returns: the names of the members of this structure access
+            (outermost first) and a list of the indices used for each of
+            them (an empty list if a member is not an array access).
+        :rtype: Tuple[List[str],
+                      List[List[:py:class:`psyclone.psyir.nodes.Node`]]]
+
+        '''
+        components = []
+        indices = []
+        cursor = self.member
+        while True:
+            components.append(cursor.name)
+            if isinstance(cursor, ArrayMixin):
+                indices.append(list(cursor.indices))
+            else:
+                indices.append([])
+            if not isinstance(cursor, StructureAccessorMixin):
+                return components, indices
+            cursor = cursor.member
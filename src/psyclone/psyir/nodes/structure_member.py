@@ -111,8 +111,9 @@ class StructureMember(Member, StructureAccessorMixin):
         :rtype: tuple(:py:class:`psyclone.core.Signature`, list of \
             list of indices)
         '''
-        sub_sig, indices = self.children[0].get_signature_and_indices()
-        return (Signature(self.name, sub_sig), [[]]+indices)
+        components, indices = self._get_member_components_and_indices()
+        return (Signature.from_components([self.name] + components),
+                [[]] + indices)
 
 
 # For Sphinx AutoAPI documentation generation
@@ -247,12 +247,11 @@ class StructureReference(Reference, StructureAccessorMixin):
                       List[List[:py:class:`psyclone.psyir.nodes.Node`]]]
 
         '''
-        # Get the signature of self:
-        my_sig, my_index = super().get_signature_and_indices()
-        # Then the sub-signature of the member, and indices used:
-        sub_sig, indices = self.children[0].get_signature_and_indices()
-        # Combine signature and indices
-        return (Signature(my_sig, sub_sig), my_index + indices)
+        # Collect the components and indices of all members in one pass
+        # and create the signature from all components at once:
+        components, indices = self._get_member_components_and_indices()
+        return (Signature.from_components([self.name] + components),
+                [[]] + indices)
 
     @property
     def datatype(self):
@@ -233,15 +233,22 @@ class DataSymbol(TypedSymbol):
                     f"'{type(self.datatype).__name__}'.")
 
             if isinstance(new_value, Node):
-                for node in new_value.walk(Node):
-                    if not isinstance(node, (Literal, Operation, Reference,
-                                             CodeBlock, IntrinsicCall)):
+                # Traverse the expression depth-first (in the same order as
+                # walk()) so that we stop at the first invalid node without
+                # first building a list of the whole subtree.
+                allowed_types = (Literal, Operation, Reference, CodeBlock,
+                                 IntrinsicCall)
+                stack = [new_value]
+                while stack:
+                    node = stack.pop()
+                    if not isinstance(node, allowed_types):
                         raise ValueError(
                             f"Error setting initial value for symbol "
                             f"'{self.name}'. PSyIR static expressions can only"
                             f" contain PSyIR Literal, Operation, Reference,"
                             f" IntrinsicCall or CodeBlock nodes but found: "
                             f"{node}")
+                    stack.extend(reversed(node.children))
                 new_initial_value = new_value
             else:
                 # No need to check that self.datatype has an intrinsic
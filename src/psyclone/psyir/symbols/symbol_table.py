@@ -1046,37 +1046,36 @@ class SymbolTable():
                 f"Expected the name argument to the lookup() method to be "
                 f"a str but found '{type(name).__name__}'.")
 
-        try:
-            symbol = self.get_symbols(scope_limit)[self._normalize(name)]
-            if visibility:
-                if not isinstance(visibility, list):
-                    vis_list = [visibility]
-                else:
-                    vis_list = visibility
-                if symbol.visibility not in vis_list:
-                    vis_names = []
-                    # Take care here in case the 'visibility' argument
-                    # is of the wrong type
-                    for vis in vis_list:
-                        if not isinstance(vis, Symbol.Visibility):
-                            raise TypeError(
-                                f"the 'visibility' argument to lookup() must "
-                                f"be an instance (or list of instances) of "
-                                f"Symbol.Visibility but got "
-                                f"'{type(vis).__name__}' when searching for "
-                                f"symbol '{name}'")
-                        vis_names.append(vis.name)
-                    raise SymbolError(
-                        f"Symbol '{name}' exists in the Symbol Table but has "
-                        f"visibility '{symbol.visibility.name}' which does not"
-                        f" match with the requested visibility: {vis_names}")
-            return symbol
-        except KeyError as err:
+        symbol = self.get_symbols(scope_limit).get(self._normalize(name))
+        if symbol is None:
             if otherwise is DEFAULT_SENTINEL:
                 # No 'otherwise' value supplied so we raise an exception.
                 raise KeyError(f"Could not find '{name}' in the Symbol "
-                               f"Table.") from err
+                               f"Table.")
             return otherwise
+        if visibility:
+            if not isinstance(visibility, list):
+                vis_list = [visibility]
+            else:
+                vis_list = visibility
+            if symbol.visibility not in vis_list:
+                vis_names = []
+                # Take care here in case the 'visibility' argument
+                # is of the wrong type
+                for vis in vis_list:
+                    if not isinstance(vis, Symbol.Visibility):
+                        raise TypeError(
+                            f"the 'visibility' argument to lookup() must "
+                            f"be an instance (or list of instances) of "
+                            f"Symbol.Visibility but got "
+                            f"'{type(vis).__name__}' when searching for "
+                            f"symbol '{name}'")
+                    vis_names.append(vis.name)
+                raise SymbolError(
+                    f"Symbol '{name}' exists in the Symbol Table but has "
+                    f"visibility '{symbol.visibility.name}' which does not"
+                    f" match with the requested visibility: {vis_names}")
+        return symbol
 
     def lookup_with_tag(self, tag, scope_limit=None):
         '''Look up a symbol by its tag. The lookup can be limited by
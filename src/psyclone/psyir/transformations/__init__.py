@@ -95,9 +95,11 @@ from psyclone.psyir.transformations.value_range_check_trans import (
 from psyclone.psyir.transformations.omp_loop_trans import OMPLoopTrans
 from psyclone.psyir.transformations.omp_minimise_sync_trans import \
     OMPMinimiseSyncTrans
+from psyclone.psyir.transformations.omp_simd_trans import OMPSimdTrans
 from psyclone.psyir.transformations.omp_target_trans import OMPTargetTrans
 from psyclone.psyir.transformations.omp_taskwait_trans import OMPTaskwaitTrans
 from psyclone.psyir.transformations.omp_task_trans import OMPTaskTrans
+from psyclone.psyir.transformations.omp_tile_trans import OMPTileTrans
 from psyclone.psyir.transformations.parallel_loop_trans import \
     ParallelLoopTrans
 from psyclone.psyir.transformations.intrinsics.product2loop_trans import \
@@ -154,9 +156,11 @@ __all__ = [
     "Minval2LoopTrans",
     "OMPLoopTrans",
     "OMPMinimiseSyncTrans",
+    "OMPSimdTrans",
     "OMPTargetTrans",
     "OMPTaskTrans",
     "OMPTaskwaitTrans",
+    "OMPTileTrans",
     "ParallelLoopTrans",
     "Product2LoopTrans",
     "ProfileTrans",
@@ -0,0 +1,214 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, Science and Technology Facilities Council.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# Author: J. Elsey
+
+
+''' This module provides the OMPSimdTrans PSyIR transformation. '''
+
+from psyclone.core import AccessType
+from psyclone.psyir.nodes import (
+    CodeBlock, IfBlock, Loop, OMPSimdDirective, Reference, WhileLoop)
+from psyclone.psyir.symbols import ArrayType
+from psyclone.psyir.tools import DependencyTools
+from psyclone.psyir.transformations.loop_trans import LoopTrans
+from psyclone.psyir.transformations.transformation_error import \
+    TransformationError
+
+
+class OMPSimdTrans(LoopTrans):
+    '''
+    Adds an OpenMP simd directive to a loop to inform the compiler that it
+    can be vectorised. Optionally, the arrays that are known to be aligned
+    and the maximum safe vector length can be provided. The scalars written
+    in the loop are declared private (or lastprivate) on the directive when
+    it is lowered. For example:
+
+    >>> from psyclone.psyir.frontend.fortran import FortranReader
+    >>> from psyclone.psyir.backend.fortran import FortranWriter
+    >>> from psyclone.psyir.nodes import Loop
+    >>> from psyclone.psyir.transformations import OMPSimdTrans
+    >>>
+    >>> tree = FortranReader().psyir_from_source("""
+    ...     subroutine my_subroutine()
+    ...         real, dimension(64) :: A
+    ...         integer :: i
+    ...         do i = 1, 64
+    ...             A(i) = 0.0
+    ...         end do
+    ...     end subroutine
+    ...     """)
+    >>> OMPSimdTrans().apply(tree.walk(Loop)[0],
+    ...                      {"aligned": ["a"], "alignment": 64,
+    ...                       "safelen": 8})
+    >>> print(FortranWriter()(tree))
+    subroutine my_subroutine()
+      real, dimension(64) :: a
+      integer :: i
+    <BLANKLINE>
+      !$omp simd aligned(a:64) safelen(8)
+      do i = 1, 64, 1
+        a(i) = 0.0
+      enddo
+      !$omp end simd
+    <BLANKLINE>
+    end subroutine my_subroutine
+    <BLANKLINE>
+
+    '''
+    excluded_node_types = (CodeBlock, )
+
+    def __str__(self):
+        return "Adds an OpenMP simd directive to a loop"
+
+    def validate(self, node, options=None):
+        # pylint: disable=signature-differs
+        '''
+        Check that the supplied loop can be vectorised, that the scalars
+        written in it can be privatised and that the arrays declared as
+        aligned are arrays accessed in the loop.
+
+        :param node: the loop to vectorise.
+        :type node: :py:class:`psyclone.psyir.nodes.Loop`
+        :param options: a dictionary with options for transformations.
+        :type options: Optional[Dict[str, Any]]
+        :param List[str] options["aligned"]: the names of the arrays whose
+            data is guaranteed to be aligned.
+        :param int options["alignment"]: the alignment, in bytes, of the
+            aligned arrays.
+        :param int options["safelen"]: the maximum distance between two
+            iterations that can be executed concurrently.
+        :param bool options["force"]: skip the dependency analysis of the
+            loop.
+
+        :raises TransformationError: if the options are not valid for an
+            OMPSimdDirective.
+        :raises TransformationError: if an aligned array is not an array
+            accessed in the loop.
+        :raises TransformationError: if a scalar is only conditionally
+            written in the loop.
+        :raises TransformationError: if the loop has a loop-carried
+            dependency.
+
+        '''
+        super().validate(node, options=options)
+        if not options:
+            options = {}
+        try:
+            OMPSimdDirective(aligned=options.get("aligned"),
+                             alignment=options.get("alignment"),
+                             safelen=options.get("safelen"))
+        except (TypeError, ValueError) as err:
+            raise TransformationError(
+                f"Error in {self.name} transformation: {err}") from err
+
+        arrays = {ref.symbol.name.lower() for ref in node.walk(Reference)
+                  if ref.is_array or
+                  isinstance(getattr(ref.symbol, "datatype", None),
+                             ArrayType)}
+        for name in options.get("aligned") or []:
+            if name.lower() not in arrays:
+                raise TransformationError(
+                    f"Error in {self.name} transformation. The aligned "
+                    f"array '{name}' is not an array accessed in the loop "
+                    f"over '{node.variable.name}'.")
+
+        # The scalars written in the loop are private to each SIMD lane.
+        # A scalar that is first written under a condition would keep its
+        # value from before the loop in the iterations where the write does
+        # not happen, which needs a firstprivate clause. This is not allowed
+        # on an OpenMP simd construct.
+        var_accesses = node.loop_body.reference_accesses()
+        for signature in var_accesses.all_signatures:
+            var_info = var_accesses[signature]
+            if (not var_info.has_data_access() or var_info.is_array() or
+                    not var_info.is_written()):
+                continue
+            first = var_info.all_accesses[0]
+            if first.access_type != AccessType.WRITE:
+                continue
+            loop_ancestor = first.node.ancestor((Loop, WhileLoop),
+                                                include_self=True)
+            if first.node.ancestor(IfBlock, limit=loop_ancestor,
+                                   include_self=True):
+                raise TransformationError(
+                    f"Error in {self.name} transformation. The scalar "
+                    f"'{signature}' is only conditionally written in the "
+                    f"loop over '{node.variable.name}', so it would need to "
+                    f"be firstprivate, which is not allowed on an OpenMP "
+                    f"simd construct.")
+
+        if options.get("force", False):
+            return
+        dep_tools = DependencyTools()
+        if not dep_tools.can_loop_be_parallelised(node):
+            messages = "\n".join(str(msg) for msg in
+                                 dep_tools.get_all_messages())
+            raise TransformationError(
+                f"Error in {self.name} transformation. The loop over "
+                f"'{node.variable.name}' cannot be vectorised because it "
+                f"has loop-carried dependencies:\n{messages}")
+
+    def apply(self, node, options=None):
+        # pylint: disable=arguments-renamed
+        '''
+        Enclose the supplied loop in an OMPSimdDirective.
+
+        :param node: the loop to vectorise.
+        :type node: :py:class:`psyclone.psyir.nodes.Loop`
+        :param options: a dictionary with options for transformations.
+        :type options: Optional[Dict[str, Any]]
+        :param List[str] options["aligned"]: the names of the arrays whose
+            data is guaranteed to be aligned.
+        :param int options["alignment"]: the alignment, in bytes, of the
+            aligned arrays.
+        :param int options["safelen"]: the maximum distance between two
+            iterations that can be executed concurrently.
+        :param bool options["force"]: skip the dependency analysis of the
+            loop.
+
+        '''
+        self.validate(node, options)
+        if not options:
+            options = {}
+
+        parent = node.parent
+        position = node.position
+        directive = OMPSimdDirective(aligned=options.get("aligned"),
+                                     alignment=options.get("alignment"),
+                                     safelen=options.get("safelen"),
+                                     children=[node.detach()])
+        parent.children.insert(position, directive)
+
+
+# For AutoAPI documentation generation
+__all__ = ["OMPSimdTrans"]
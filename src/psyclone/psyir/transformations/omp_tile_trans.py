@@ -0,0 +1,221 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, Science and Technology Facilities Council.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# Author: J. Elsey
+
+''' This module provides the OMPTileTrans PSyIR transformation. '''
+
+from psyclone.psyir.nodes import (
+    CodeBlock, Loop, OMPDoDirective, OMPTileDirective, Reference)
+from psyclone.psyir.tools import DependencyTools
+from psyclone.psyir.transformations.loop_trans import LoopTrans
+from psyclone.psyir.transformations.transformation_error import \
+    TransformationError
+
+
+class OMPTileTrans(LoopTrans):
+    '''
+    Adds an OpenMP (5.1) tile directive to a perfectly-nested loop nest. The
+    compiler then creates the loops iterating over the tiles, which can be
+    parallelised by an enclosing worksharing directive with a collapse
+    clause. For example:
+
+    >>> from psyclone.psyir.frontend.fortran import FortranReader
+    >>> from psyclone.psyir.backend.fortran import FortranWriter
+    >>> from psyclone.psyir.nodes import Loop
+    >>> from psyclone.psyir.transformations import OMPTileTrans
+    >>>
+    >>> tree = FortranReader().psyir_from_source("""
+    ...     subroutine my_subroutine()
+    ...         integer, dimension(10, 10) :: A
+    ...         integer :: i
+    ...         integer :: j
+    ...         do i = 1, 10
+    ...             do j = 1, 10
+    ...                 A(i, j) = 0
+    ...             end do
+    ...         end do
+    ...     end subroutine
+    ...     """)
+    >>> OMPTileTrans().apply(tree.walk(Loop)[0], {"tile_sizes": (4, 4)})
+    >>> print(FortranWriter()(tree))
+    subroutine my_subroutine()
+      integer, dimension(10,10) :: a
+      integer :: i
+      integer :: j
+    <BLANKLINE>
+      !$omp tile sizes(4,4)
+      do i = 1, 10, 1
+        do j = 1, 10, 1
+          a(i,j) = 0
+        enddo
+      enddo
+      !$omp end tile
+    <BLANKLINE>
+    end subroutine my_subroutine
+    <BLANKLINE>
+
+    '''
+    excluded_node_types = (CodeBlock, )
+
+    def __str__(self):
+        return "Adds an OpenMP tile directive to a nest of loops"
+
+    @staticmethod
+    def _get_tile_sizes(options):
+        '''
+        :param options: a dictionary with options for transformations.
+        :type options: Optional[Dict[str, Any]]
+
+        :returns: the requested tile sizes.
+        :rtype: Tuple[int, ...]
+
+        :raises TransformationError: if the tile sizes are not a non-empty
+            tuple or list of positive integers.
+        '''
+        sizes = options.get("tile_sizes", (32, 32)) if options else (32, 32)
+        if (not isinstance(sizes, (tuple, list)) or not sizes or
+                not all(isinstance(size, int) and size > 0
+                        for size in sizes)):
+            raise TransformationError(
+                f"The OMPTileTrans 'tile_sizes' option must be a non-empty "
+                f"tuple of positive integers but found '{sizes}'.")
+        return tuple(sizes)
+
+    def validate(self, node, options=None):
+        # pylint: disable=signature-differs
+        '''
+        Check that the supplied loop is the outermost of a perfectly-nested,
+        rectangular loop nest with at least as many loops as tile sizes,
+        that all these loops can be reordered (i.e. each of them can be
+        parallelised) and that an enclosing worksharing directive does not
+        collapse more loops than are tiled.
+
+        :param node: the outermost loop of the nest to tile.
+        :type node: :py:class:`psyclone.psyir.nodes.Loop`
+        :param options: a dictionary with options for transformations.
+        :type options: Optional[Dict[str, Any]]
+        :param options["tile_sizes"]: the size of the tile for each loop
+            of the nest, starting with the outermost. Defaults to (32, 32).
+        :type options["tile_sizes"]: Tuple[int, ...]
+        :param bool options["force"]: skip the dependency analysis of the
+            tiled loops.
+
+        :raises TransformationError: if the loop is associated with an
+            OMPDoDirective that collapses more loops than there are tile
+            sizes.
+        :raises TransformationError: if the loops are not perfectly nested.
+        :raises TransformationError: if the bounds of an inner loop depend
+            on the variable of an enclosing loop of the nest.
+        :raises TransformationError: if any loop of the nest has a
+            loop-carried dependency.
+
+        '''
+        super().validate(node, options=options)
+        sizes = self._get_tile_sizes(options)
+        force = options.get("force", False) if options else False
+
+        # The collapse clause of an enclosing worksharing directive applies
+        # to the loops generated by the tile construct, one per tile size.
+        directive = node.parent.parent if node.parent else None
+        if (isinstance(directive, OMPDoDirective) and directive.collapse and
+                directive.collapse > len(sizes)):
+            raise TransformationError(
+                f"Error in {self.name} transformation. The loop over "
+                f"'{node.variable.name}' is associated with an "
+                f"{type(directive).__name__} with collapse="
+                f"{directive.collapse}, which is more than the "
+                f"{len(sizes)} tiled loops.")
+
+        loops = [node]
+        for depth in range(1, len(sizes)):
+            body = loops[-1].loop_body
+            if len(body.children) != 1 or not isinstance(body[0], Loop):
+                raise TransformationError(
+                    f"Error in {self.name} transformation. The {len(sizes)} "
+                    f"tiled loops must be perfectly nested, but the body of "
+                    f"the loop at depth {depth - 1} is not a single loop.")
+            loops.append(body[0])
+
+        # The tiled iteration space must be rectangular.
+        loop_vars = {loop.variable for loop in loops}
+        for loop in loops[1:]:
+            for expr in (loop.start_expr, loop.stop_expr, loop.step_expr):
+                for ref in expr.walk(Reference):
+                    if ref.symbol in loop_vars:
+                        raise TransformationError(
+                            f"Error in {self.name} transformation. The bounds "
+                            f"of the loop over '{loop.variable.name}' depend "
+                            f"on the variable '{ref.symbol.name}' of an "
+                            f"enclosing loop of the tiled nest.")
+
+        if force:
+            return
+        # Tiling reorders the iterations of all loops in the nest, this is
+        # only guaranteed to be safe if each of them could be parallelised.
+        dep_tools = DependencyTools()
+        for loop in loops:
+            if not dep_tools.can_loop_be_parallelised(loop):
+                messages = "\n".join(str(msg) for msg in
+                                     dep_tools.get_all_messages())
+                raise TransformationError(
+                    f"Error in {self.name} transformation. The loop over "
+                    f"'{loop.variable.name}' cannot be tiled because it "
+                    f"has loop-carried dependencies:\n{messages}")
+
+    def apply(self, node, options=None):
+        # pylint: disable=arguments-renamed
+        '''
+        Enclose the supplied loop nest in an OMPTileDirective.
+
+        :param node: the outermost loop of the nest to tile.
+        :type node: :py:class:`psyclone.psyir.nodes.Loop`
+        :param options: a dictionary with options for transformations.
+        :type options: Optional[Dict[str, Any]]
+        :param options["tile_sizes"]: the size of the tile for each loop
+            of the nest, starting with the outermost. Defaults to (32, 32).
+        :type options["tile_sizes"]: Tuple[int, ...]
+        :param bool options["force"]: skip the dependency analysis of the
+            tiled loops.
+
+        '''
+        self.validate(node, options)
+
+        parent = node.parent
+        position = node.position
+        directive = OMPTileDirective(sizes=self._get_tile_sizes(options),
+                                     children=[node.detach()])
+        parent.children.insert(position, directive)
+
+
+# For AutoAPI documentation generation
+__all__ = ["OMPTileTrans"]
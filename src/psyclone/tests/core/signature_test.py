@@ -36,9 +36,12 @@
 
 '''This module tests the Signature class.'''
 
+import sys
+
 import pytest
 
 from psyclone.core import ComponentIndices, Signature
+from psyclone.core.signature import ScalarSignature
 from psyclone.errors import InternalError
 from psyclone.psyir.backend.c import CWriter
 from psyclone.psyir.backend.fortran import FortranWriter
@@ -74,6 +77,11 @@ def test_signature():
     assert sig[0] == "a"
     assert sig[1] == "b"
 
+    # Subclasses of the supported types are accepted as well:
+    class MyStr(str):
+        '''A simple subclass of str.'''
+    assert Signature(MyStr("a%b")) == sig
+
 
 def test_signature_errors():
     '''Tests error handling of Signature class.
@@ -238,3 +246,125 @@ def test_output_languages():
     assert sig.to_language(comp) == "a(1)%b%c(i,j)"
     assert sig.to_language(comp, f_writer) == "a(1)%b%c(i,j)"
     assert sig.to_language(comp, c_writer) == "a[1].b.c[i + j * cLEN1]"
+
+
+def test_signature_hash_and_intern():
+    '''Test that the hash of a signature is cached, and that interned
+    signatures are shared between callers.'''
+    sig = Signature(("a", "b"))
+    assert hash(sig) == hash("a%b")
+    # Signatures use __slots__, so no attributes can be added.
+    with pytest.raises(AttributeError):
+        sig.new_attribute = 1
+
+    sig_a = Signature.intern("a")
+    assert sig_a == Signature("a")
+    assert Signature.intern("a") is sig_a
+    # Lists are converted to tuples to be usable as a key:
+    sig_ab = Signature.intern(["a", "b"])
+    assert sig_ab == sig
+    assert Signature.intern(("a", "b")) is sig_ab
+    assert Signature.intern("a", Signature("b")) == sig
+
+
+def test_signature_joined_storage():
+    '''Test that a signature is stored as a single interned string and
+    that the tuple of components is only created when required.'''
+    sig = Signature("a%b")
+    # pylint: disable=protected-access
+    assert sig._components is None
+    assert sig._joined is sys.intern("a%b")
+    assert str(sig) is sig._joined
+    assert repr(sig) == "Signature(a%b)"
+    assert sig.var_name == "a"
+    assert sig.is_structure
+    assert sig._components is None
+    assert sig.components == ("a", "b")
+    assert sig.components is sig._components
+    # A tuple argument is used as the components directly
+    comps = ("a", "b")
+    assert Signature(comps)._components is comps
+    assert Signature("c", sig).components == ("c", "a", "b")
+    # An empty signature has no components
+    assert len(sig[2:]) == 0
+
+
+def test_signature_empty_and_copy():
+    '''Test that signatures that compare equal have the same components,
+    independent of how they were created.'''
+    empty = Signature(())
+    for sig in [Signature([]), Signature(""), Signature(("",)),
+                Signature(empty), Signature(Signature([])),
+                Signature.from_components([]), Signature.intern("")]:
+        assert sig == empty
+        assert len(sig) == 0
+        assert sig.components == ()
+        assert not sig.is_structure
+    # An empty signature does not add a component when combined:
+    assert Signature((), Signature("b")).components == ("b",)
+
+    # A copy shares the components of the original signature:
+    sig = Signature(("a", "b"))
+    # pylint: disable=protected-access
+    assert Signature(sig)._components is sig._components
+    assert Signature(sig).components == ("a", "b")
+    assert len(Signature(Signature("a%b"))) == 2
+    # A list is stored as a tuple:
+    assert Signature(["a", "b"])._components == ("a", "b")
+
+    # Components containing a '%' are split in the same way as a string,
+    # whether or not a sub-signature is added:
+    assert Signature(("a%b",)).components == ("a", "b")
+    assert len(Signature(("a%b",))) == 2
+    assert Signature(("a%b", "c")) == Signature("a%b%c")
+    assert Signature(("a%b",), Signature("c")).components == ("a", "b", "c")
+    assert Signature.from_components(["a%b"]).components == ("a", "b")
+
+
+def test_signature_eq_fast_path():
+    '''Test the equality fast paths of a signature.'''
+    sig = Signature(("a", "b"))
+    # pylint: disable=comparison-with-itself
+    assert sig == sig
+    assert sig.__eq__("a%b") is NotImplemented
+    assert sig == Signature("a%b")
+    assert sig != Signature(("a", "c"))
+
+
+def test_signature_from_components():
+    '''Test that a signature can be created from all its components.'''
+    sig = Signature.from_components(iter(["a", "b", "c"]))
+    assert isinstance(sig, Signature)
+    assert sig == Signature("a%b%c")
+    assert sig.components == ("a", "b", "c")
+    assert hash(sig) == hash(Signature(("a", "b", "c")))
+    assert str(sig) == "a%b%c"
+
+
+def test_scalar_signature():
+    '''Test that interning the name of a variable creates a ScalarSignature
+    that behaves like the equivalent Signature.'''
+    sig = Signature.intern("a")
+    assert isinstance(sig, ScalarSignature)
+    assert not sig.is_structure
+    assert len(sig) == 1
+    assert sig.var_name == "a"
+    assert sig.components == ("a",)
+    assert sig[0] == "a"
+    assert str(sig) == "a"
+    assert repr(sig) == "Signature(a)"
+    assert sig == Signature("a")
+    assert Signature("a") == sig
+    assert hash(sig) == hash(Signature("a"))
+    assert sig != Signature("a%b")
+    assert sig < Signature("b")
+    # Only the name of a single variable is accepted
+    for name in ["a%b", ""]:
+        with pytest.raises(InternalError) as err:
+            _ = ScalarSignature(name)
+        assert (f"A ScalarSignature requires the name of a single variable, "
+                f"but got '{name}'." in str(err.value))
+    # Structure accesses are not scalar signatures
+    assert not isinstance(Signature.intern("a%b"), ScalarSignature)
+    assert not isinstance(Signature.intern("a", Signature("b")),
+                          ScalarSignature)
@@ -263,6 +263,29 @@ def test_aic_defroutinerootname():
     assert call._def_routine_root_name() == "invoke_1"
 
 
+def test_aic_defroutinerootname_cache():
+    '''Check that the routine root name derived from the name of an
+    invoke call is cached and recomputed if the name changes.
+
+    '''
+    routine = RoutineSymbol("hello")
+    call = AlgorithmInvokeCall(routine, 3, name="a_description")
+    assert call._root_name_cache is None
+    assert call._def_routine_root_name() == "invoke_a_description"
+    assert call._root_name_cache == ("a_description",
+                                     "invoke_a_description")
+    # The cached value is returned
+    call._root_name_cache = ("a_description", "invoke_cached")
+    assert call._def_routine_root_name() == "invoke_cached"
+    # A new name is processed
+    call._name = "another"
+    assert call._def_routine_root_name() == "invoke_another"
+    # Invoke calls without a name are not cached
+    call._name = None
+    assert call._def_routine_root_name() == "invoke_3"
+    assert call._root_name_cache == ("another", "invoke_another")
+
+
 def test_aic_defroutineroot_name_error():
     '''Check that the _def_routine_root_name() internal method raises the
     expected exception if the supplied name is invalid.
@@ -289,6 +312,14 @@ def test_aic_defroutineroot_name_error():
                 f"(with any spaces replaced by underscores) but found "
                 f"'{name}'." in str(info.value))
 
+    # A name that is empty once any quotes are removed
+    call._name = "' '"
+    with pytest.raises(TypeError) as info:
+        _ = call._def_routine_root_name()
+    assert ("name of an invoke must be a string containing a valid name "
+            "(with any spaces replaced by underscores) but found ''."
+            in str(info.value))
+
 
 def test_aic_createpsylayersymbolrootnames():
     '''Check that the create_psylayer_symbol_root_names method behaves in
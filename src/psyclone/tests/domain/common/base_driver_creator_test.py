@@ -40,8 +40,10 @@
 import pytest
 
 from psyclone.domain.common import BaseDriverCreator
-from psyclone.psyir.nodes import Literal, Routine
-from psyclone.psyir.symbols import DataSymbol, INTEGER_TYPE, RoutineSymbol
+from psyclone.psyir.nodes import Call, Literal, Routine
+from psyclone.psyir.symbols import (
+    ArrayType, CHARACTER_TYPE, ContainerSymbol, DataSymbol, ImportInterface,
+    INTEGER_TYPE, RoutineSymbol, UnsupportedFortranType)
 
 
 def test_basic_driver_add_call(fortran_writer):
@@ -84,3 +86,173 @@ def test_lfric_driver_add_result_tests(fortran_writer):
   call compare('a1', a1, a1_orig)
   call compare_summary()"""
     assert expected in out
+
+
+def test_add_read_call_routine_symbols(fortran_writer):
+    '''Tests that add_read_call stores the RoutineSymbols of the read
+    methods in the supplied dictionary and reuses them for later calls.
+    '''
+    program = Routine.create("routine", is_program=True)
+    symtab = program.symbol_table
+    scalar = symtab.new_symbol("a", symbol_type=DataSymbol,
+                               datatype=INTEGER_TYPE)
+    array = symtab.new_symbol("b", symbol_type=DataSymbol,
+                              datatype=ArrayType(INTEGER_TYPE, [3]))
+    read_var = "psy_data%ReadVariable"
+    routine_symbols = {}
+    for sym in [scalar, array, scalar]:
+        BaseDriverCreator.add_read_call(
+            program, Literal(sym.name, CHARACTER_TYPE), sym, read_var,
+            routine_symbols)
+    assert sorted(routine_symbols) == [read_var, read_var + "NonAlloc"]
+    calls = program.walk(Call)
+    assert calls[0].routine.symbol is routine_symbols[read_var]
+    assert calls[2].routine.symbol is routine_symbols[read_var]
+    assert (calls[1].routine.symbol is
+            routine_symbols[read_var + "NonAlloc"])
+    assert symtab.lookup(read_var) is routine_symbols[read_var]
+
+    out = fortran_writer(program)
+    assert "call psy_data%ReadVariable('a', a)" in out
+    assert "call psy_data%ReadVariableNonAlloc('b', b)" in out
+
+    # An existing symbol of the wrong type is still detected.
+    symtab.find_or_create_tag("test")
+    with pytest.raises(TypeError) as err:
+        BaseDriverCreator.add_read_call(
+            program, Literal("a", CHARACTER_TYPE), scalar, "test", {})
+    assert ("Error creating call to 'test' - existing symbol is of type "
+            "'Symbol', not a 'RoutineSymbol'" in str(err.value))
+
+
+def test_create_output_var_code_index():
+    '''Tests that _create_output_var_code uses the supplied snapshots of
+    the symbols and tags if they contain the variable, and falls back to
+    the symbol table otherwise.
+    '''
+    program = Routine.create("routine", is_program=True)
+    symtab = program.symbol_table
+    a_sym = symtab.new_symbol("a", symbol_type=DataSymbol,
+                              datatype=INTEGER_TYPE)
+    b_sym = symtab.new_symbol("b", tag="b@my_mod", symbol_type=DataSymbol,
+                              datatype=INTEGER_TYPE)
+
+    # No index supplied, or the name is not in the index.
+    sym, post_sym = BaseDriverCreator._create_output_var_code(
+        "a", program, "psy_data%ReadVariable", "_post")
+    assert sym is a_sym
+    assert post_sym.name == "a_post"
+    sym, _ = BaseDriverCreator._create_output_var_code(
+        "A", program, "psy_data%ReadVariable", "_post1", sym_index={})
+    assert sym is a_sym
+    sym, _ = BaseDriverCreator._create_output_var_code(
+        "b", program, "psy_data%ReadVariable", "_post",
+        module_name="my_mod", tag_index={})
+    assert sym is b_sym
+
+    # The snapshots are used when they contain the variable.
+    other = DataSymbol("a", INTEGER_TYPE)
+    sym, _ = BaseDriverCreator._create_output_var_code(
+        "A", program, "psy_data%ReadVariable", "_post2",
+        sym_index={"a": other})
+    assert sym is other
+    sym, _ = BaseDriverCreator._create_output_var_code(
+        "b", program, "psy_data%ReadVariable", "_post3",
+        module_name="my_mod", tag_index={"b@my_mod": other})
+    assert sym is other
+
+
+def test_create_output_var_code_post_name():
+    '''Tests that _create_output_var_code uses the symbol snapshot to
+    check if the post name is unused, and adds the post symbols to it.
+    '''
+    program = Routine.create("routine", is_program=True)
+    symtab = program.symbol_table
+    a_sym = symtab.new_symbol("a", symbol_type=DataSymbol,
+                              datatype=INTEGER_TYPE)
+    symtab.new_symbol("b", symbol_type=DataSymbol, datatype=INTEGER_TYPE)
+    # Create a name clash for the post variable of b:
+    symtab.new_symbol("b_post", symbol_type=DataSymbol,
+                      datatype=INTEGER_TYPE)
+    sym_index = symtab.get_symbols()
+    _, post_sym = BaseDriverCreator._create_output_var_code(
+        "a", program, "psy_data%ReadVariable", "_post", sym_index=sym_index)
+    assert post_sym.name == "a_post"
+    assert post_sym.datatype is a_sym.datatype
+    assert symtab.lookup("a_post") is post_sym
+    assert sym_index["a_post"] is post_sym
+
+    _, post_sym = BaseDriverCreator._create_output_var_code(
+        "b", program, "psy_data%ReadVariable", "_post", sym_index=sym_index)
+    assert post_sym.name == "b_post_1"
+    assert sym_index["b_post_1"] is post_sym
+
+
+def test_create_output_var_code_datatype():
+    '''Tests that _create_output_var_code shares supported datatypes with
+    the original symbol, and renames the symbol in a copy of an
+    unsupported declaration without changing other words that contain
+    the name.
+    '''
+    program = Routine.create("routine", is_program=True)
+    symtab = program.symbol_table
+    array_type = ArrayType(INTEGER_TYPE, [10])
+    symtab.new_symbol("a", symbol_type=DataSymbol, datatype=array_type)
+    unsupported = UnsupportedFortranType(
+        "real(kind=r_def), pointer :: r(:) => null()")
+    symtab.new_symbol("r", symbol_type=DataSymbol, datatype=unsupported)
+
+    _, post_sym = BaseDriverCreator._create_output_var_code(
+        "a", program, "psy_data%ReadVariable", "_post")
+    assert post_sym.datatype is array_type
+
+    _, post_sym = BaseDriverCreator._create_output_var_code(
+        "r", program, "psy_data%ReadVariable", "_post")
+    assert post_sym.datatype is not unsupported
+    assert (post_sym.datatype.declaration ==
+            "real(kind=r_def), pointer :: r_post(:) => null()")
+    # The original declaration is unchanged.
+    assert (unsupported.declaration ==
+            "real(kind=r_def), pointer :: r(:) => null()")
+
+
+def test_import_modules_repeated_calls(fortran_writer):
+    '''Tests that import_modules adds a single import for a routine that
+    is called several times.
+    '''
+    program = Routine.create("routine", is_program=True)
+    container = ContainerSymbol("my_mod")
+    routine = RoutineSymbol("my_sub", interface=ImportInterface(container))
+    for _ in range(3):
+        program.addchild(Call.create(routine, []))
+
+    BaseDriverCreator.import_modules(program)
+    symtab = program.symbol_table
+    assert ([sym.name for sym in symtab.symbols] ==
+            ["routine", "my_mod", "my_sub"])
+    new_routine = symtab.lookup("my_sub")
+    assert new_routine is not routine
+    assert new_routine.interface.container_symbol is symtab.lookup("my_mod")
+    assert "use my_mod, only : my_sub" in fortran_writer(program)
+
+
+def test_import_modules_calls():
+    '''Tests that import_modules only handles the supplied calls if
+    a list of calls is specified.
+    '''
+    program = Routine.create("routine", is_program=True)
+    container = ContainerSymbol("my_mod")
+    routine1 = RoutineSymbol("my_sub1", interface=ImportInterface(container))
+    routine2 = RoutineSymbol("my_sub2", interface=ImportInterface(container))
+    call1 = Call.create(routine1, [])
+    program.addchild(call1)
+    program.addchild(Call.create(routine2, []))
+
+    BaseDriverCreator.import_modules(program, [call1])
+    symtab = program.symbol_table
+    assert ([sym.name for sym in symtab.symbols] ==
+            ["routine", "my_mod", "my_sub1"])
+
+    # An empty list does not add anything:
+    BaseDriverCreator.import_modules(program, [])
+    assert "my_sub2" not in symtab
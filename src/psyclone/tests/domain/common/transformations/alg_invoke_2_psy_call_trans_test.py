@@ -40,6 +40,7 @@ transformation.
 '''
 import pytest
 
+from psyclone.core import SymbolicMaths
 from psyclone.errors import InternalError
 from psyclone.domain.common.algorithm import AlgorithmInvokeCall, KernelFunctor
 from psyclone.domain.common.transformations import AlgTrans
@@ -48,10 +49,10 @@ from psyclone.domain.gocean.transformations import GOceanAlgInvoke2PSyCallTrans
 from psyclone.psyir.frontend.fortran import FortranReader
 from psyclone.psyir.nodes import (
     Call, Loop, Literal, Container, Reference, ArrayReference, BinaryOperation,
-    CodeBlock, UnaryOperation)
+    CodeBlock, StructureReference, UnaryOperation)
 from psyclone.psyir.symbols import (
     RoutineSymbol, DataSymbol, INTEGER_TYPE, REAL_TYPE, ArrayType,
-    DataTypeSymbol)
+    DataTypeSymbol, UnresolvedType)
 from psyclone.psyir.transformations import TransformationError
 
 
@@ -486,7 +487,7 @@ def test_ai2psycall_apply_invoke_symbols_scope(fortran_reader):
     assert "invoke" not in loop.scope.symbol_table._symbols
 
 
-def test_ai2psycall_add_arg():
+def test_ai2psycall_add_arg(monkeypatch):
     '''Test the _add_arg() utility method.'''
 
     # Invalid argument exception (not a Node)
@@ -541,11 +542,89 @@ def test_ai2psycall_add_arg():
         Reference(DataSymbol(name, REAL_TYPE)), args)
     assert len(args) == 2
 
+    # array reference, symbolically equal to an existing arg, not added
+    name = "hello2"
+    symbol = DataSymbol(name, ArrayType(REAL_TYPE, [10]))
+    index = BinaryOperation.create(
+        BinaryOperation.Operator.SUB, Literal("2", INTEGER_TYPE),
+        Literal("1", INTEGER_TYPE))
+    AlgInvoke2PSyCallTrans._add_arg(
+        ArrayReference.create(symbol, [index]), args)
+    assert len(args) == 2
+
+    # array reference with a different index (arg added)
+    AlgInvoke2PSyCallTrans._add_arg(
+        ArrayReference.create(symbol, [Literal("2", INTEGER_TYPE)]), args)
+    assert len(args) == 3
+    del args[2]
+
     # codeblock arg
     AlgInvoke2PSyCallTrans._add_arg(CodeBlock([], None), args)
     assert len(args) == 3
     assert isinstance(args[2], CodeBlock)
 
+    # A reference to a different variable or structure component is never
+    # compared symbolically
+    def fail(*_):
+        raise AssertionError("Unexpected symbolic comparison.")
+    monkeypatch.setattr(SymbolicMaths, "equal", fail)
+    AlgInvoke2PSyCallTrans._add_arg(
+        Reference(DataSymbol("hello3", REAL_TYPE)), args)
+    assert len(args) == 4
+    self_symbol = DataSymbol("self", UnresolvedType())
+    AlgInvoke2PSyCallTrans._add_arg(
+        StructureReference.create(self_symbol, ["a"]), args)
+    AlgInvoke2PSyCallTrans._add_arg(
+        StructureReference.create(self_symbol, ["b"]), args)
+    assert len(args) == 6
+    # An identical reference is not compared symbolically either
+    AlgInvoke2PSyCallTrans._add_arg(
+        StructureReference.create(DataSymbol("self", UnresolvedType()), ["a"]),
+        args)
+    assert len(args) == 6
+
+
+def test_ai2psycall_add_arg_keys():
+    '''Test the _add_arg() utility method when an index of the existing
+    arguments is supplied.'''
+    args = []
+    arg_keys = {}
+    symbol = DataSymbol("hello", ArrayType(REAL_TYPE, [10]))
+    # Literals and CodeBlocks are not indexed
+    AlgInvoke2PSyCallTrans._add_arg(Literal("1.0", REAL_TYPE), args, arg_keys)
+    AlgInvoke2PSyCallTrans._add_arg(CodeBlock([], None), args, arg_keys)
+    assert len(args) == 1
+    assert not arg_keys
+    AlgInvoke2PSyCallTrans._add_arg(ArrayReference.create(
+        symbol, [Literal("1", INTEGER_TYPE)]), args, arg_keys)
+    AlgInvoke2PSyCallTrans._add_arg(ArrayReference.create(
+        symbol, [Literal("2", INTEGER_TYPE)]), args, arg_keys)
+    assert len(args) == 3
+    assert list(arg_keys.keys()) == ["hello"]
+    assert arg_keys["hello"] == args[1:]
+    # A symbolically-equivalent reference is found through the index
+    index = BinaryOperation.create(
+        BinaryOperation.Operator.SUB, Literal("3", INTEGER_TYPE),
+        Literal("1", INTEGER_TYPE))
+    AlgInvoke2PSyCallTrans._add_arg(
+        ArrayReference.create(symbol, [index]), args, arg_keys)
+    assert len(args) == 3
+    # The index (rather than the argument list) is searched
+    arg_keys["hello"] = []
+    AlgInvoke2PSyCallTrans._add_arg(ArrayReference.create(
+        symbol, [Literal("1", INTEGER_TYPE)]), args, arg_keys)
+    assert len(args) == 4
+    assert arg_keys["hello"] == [args[3]]
+
+
+def test_ai2psycall_arg_key():
+    '''Test the _arg_key() utility method.'''
+    symbol = DataSymbol("Self", UnresolvedType())
+    assert AlgInvoke2PSyCallTrans._arg_key(Reference(symbol)) == "self"
+    assert AlgInvoke2PSyCallTrans._arg_key(
+        StructureReference.create(symbol, ["A", ("b", [Literal(
+            "1", INTEGER_TYPE)])])) == "self%a%b"
+
 
 def test_ai2psycall_remove_imported_symbols(fortran_reader):
     '''Check that the remove_imported_symbols() method removes the kernel
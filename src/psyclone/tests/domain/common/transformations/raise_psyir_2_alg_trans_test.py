@@ -131,7 +131,8 @@ def test_parse_args_get_symbol(fortran_reader):
     # Check expected output from get_symbol when no symbol exists
     with pytest.raises(KeyError):
         _ = code_block.scope.symbol_table.lookup("kern")
-    symbol = RaisePSyIR2AlgTrans._get_symbol(code_block,
+    symbol_table = code_block.scope.symbol_table
+    symbol = RaisePSyIR2AlgTrans._get_symbol(symbol_table,
                                              code_block._fp2_nodes[0])
     assert isinstance(symbol, DataTypeSymbol)
     assert symbol.name == "kern"
@@ -139,7 +140,7 @@ def test_parse_args_get_symbol(fortran_reader):
     assert symbol2 is symbol
 
     # Check expected output from get_symbol when symbol already exists
-    symbol3 = RaisePSyIR2AlgTrans._get_symbol(code_block,
+    symbol3 = RaisePSyIR2AlgTrans._get_symbol(symbol_table,
                                               code_block._fp2_nodes[0])
     assert symbol3 is symbol
 
@@ -438,6 +439,42 @@ def test_apply_codeblocks(fortran_reader):
     check_literal(invoke.arguments[1], "kern", "1.0")
 
 
+def test_apply_codeblocks_symbol_cache(fortran_reader, monkeypatch):
+    '''Test that the symbol for a kernel that is called more than once
+    within an invoke is only looked up once and is shared by all of the
+    resulting KernelFunctors.
+
+    '''
+    code = (
+        "subroutine alg()\n"
+        "  use kern_mod\n"
+        "  call invoke(kern(0.0), KERN(1.0), kern2(2.0), kern(3.0))\n"
+        "end subroutine alg\n")
+
+    psyir = fortran_reader.psyir_from_source(code)
+    subroutine = psyir.children[0]
+
+    looked_up = []
+    get_symbol = RaisePSyIR2AlgTrans._get_symbol
+
+    def counting_get_symbol(symbol_table, fp2_node):
+        looked_up.append(fp2_node.children[0].string)
+        return get_symbol(symbol_table, fp2_node)
+
+    monkeypatch.setattr(RaisePSyIR2AlgTrans, "_get_symbol",
+                        staticmethod(counting_get_symbol))
+    invoke_trans = RaisePSyIR2AlgTrans()
+    invoke_trans.apply(subroutine[0], 0)
+
+    assert looked_up == ["kern", "kern2"]
+    invoke = subroutine.children[0]
+    assert len(invoke.arguments) == 4
+    assert invoke.arguments[0].symbol is invoke.arguments[1].symbol
+    assert invoke.arguments[0].symbol is invoke.arguments[3].symbol
+    assert invoke.arguments[2].symbol.name == "kern2"
+    assert isinstance(invoke.arguments[0].symbol, DataTypeSymbol)
+
+
 def test_apply_mixed(fortran_reader):
     '''Test that an invoke with a mixture of code block and array
     reference arguments is transformed into PSyclone-specific
@@ -118,6 +118,17 @@ def test_get_nargs():
     assert CommonArgMetadata.get_nargs(fparser2_tree) == 3
 
 
+def test_extract_args():
+    '''Test that the _extract_args method in the CommonArgMetadata class
+    works as expected.
+
+    '''
+    fparser_tree = CommonArgMetadata.create_fparser2(
+        "arg_type(GH_FIELD, GH_REAL, GH_READ)", Fortran2003.Part_Ref)
+    args = CommonArgMetadata._extract_args(fparser_tree)
+    assert args == ("GH_FIELD", "GH_REAL", "GH_READ")
+
+
 def test_get_arg():
     '''Test that the get_arg method in the CommonArgMetadata class works
     as expected.
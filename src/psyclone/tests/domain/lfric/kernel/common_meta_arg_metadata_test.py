@@ -43,6 +43,7 @@ from fparser.two import Fortran2003
 
 from psyclone.domain.lfric.kernel import (
     CommonMetaArgMetadata, ScalarArgMetadata)
+from psyclone.domain.lfric.kernel.common_metadata import MetadataValueError
 from psyclone.errors import InternalError
 
 
@@ -124,6 +125,11 @@ def test_init():
     dummy = CheckArg("datatype", "access")
     assert dummy._datatype == "datatype"
     assert dummy._access == "access"
+    # The datatype and access values are interned so are shared
+    # between instances.
+    other = CheckArg("".join(["DATA", "TYPE"]), "".join(["ACC", "ESS"]))
+    assert other._datatype is dummy._datatype
+    assert other._access is dummy._access
 
 
 def test_create_from_fparser2():
@@ -182,19 +188,35 @@ def test_check_first_arg():
         "arg_type(sluglike)", Fortran2003.Part_Ref)
     CheckArg.check_first_arg(fparser2_tree)
 
+    class CheckArgUpper(CheckArg):
+        '''A utility class with an upper-case form.'''
+        form = "SlugLike"
+
+    # The lower-case form is computed when the subclass is created and
+    # the comparison is case insensitive.
+    assert CheckArgUpper._form_lower == "sluglike"
+    CheckArgUpper.check_first_arg(fparser2_tree)
+
 
 def test_check_remaining_args():
     '''Check that the check_remaining_args method in the CommonMetaArgMetadata
     class works as expected.
 
     '''
+    # An instance of the class is returned if the arguments are valid.
+    obj = CheckArg.check_remaining_args("dummy", "datatype", "access")
+    assert isinstance(obj, CheckArg)
+    assert obj.datatype == "datatype"
+    assert obj.access == "access"
+
     class DummyArg(CheckArg):
         '''Utility class used to test the abstract CommonMetaArgMetadata class
         (via the CheckArg class).
 
-        :param str message: the message to use for an exception.
+        :param str name: the name of the metadata property to use for \
+            an exception.
 
-        :raises ValueError: when instantiated.
+        :raises MetadataValueError: when instantiated.
 
         '''
         datatype_arg_index = 1
@@ -203,26 +225,30 @@ def test_check_remaining_args():
         mesh_arg_index = 4
         function_space_to_arg_index = 5
         function_space_from_arg_index = 6
+        stencil_arg_index = 7
+        vector_length_arg_index = 8
 
-        def __init__(self, message):
+        def __init__(self, name):
             super().__init__("datatype", "access")
-            raise ValueError(message)
-
-    for index, message in [(1, "datatype descriptor error"),
-                           (2, "access descriptor error"),
-                           (3, "function space error"),
-                           (4, "mesh_arg error"),
-                           (5, "function_space_to error"),
-                           (6, "function_space_from error")]:
+            raise MetadataValueError(f"{name} error", name)
+
+    for index, name in [(1, "datatype descriptor"),
+                        (2, "access descriptor"),
+                        (3, "function space"),
+                        (4, "mesh_arg"),
+                        (5, "function_space_to"),
+                        (6, "function_space_from"),
+                        (7, "stencil"),
+                        (8, "vector length")]:
         with pytest.raises(ValueError) as info:
-            DummyArg.check_remaining_args("dummy", message)
-            assert (f"At argument index '{index}' for metadata 'dummy'. "
-                    f"{message}")
+            DummyArg.check_remaining_args("dummy", name)
+        assert (f"At argument index '{index}' for metadata 'dummy'. "
+                f"{name} error" in str(info.value))
 
     with pytest.raises(InternalError) as info:
-        DummyArg.check_remaining_args("dummy", "Unrecognised error")
-    assert ("Unexpected error message found 'Unrecognised error'"
-            in str(info.value))
+        DummyArg.check_remaining_args("dummy", "unrecognised")
+    assert ("Unexpected metadata property 'unrecognised' found in error "
+            "'unrecognised error'" in str(info.value))
 
 
 def test_check_nargs():
@@ -252,6 +278,14 @@ def test_get_vector_length():
             "'form*vector_length' but found 'GH_FIELD'."
             in str(info.value))
 
+    fparser_tree = CheckArg.create_fparser2(
+        "arg_type(GH_FIELD*3*2, GH_REAL, GH_READ, W0)", Fortran2003.Part_Ref)
+    with pytest.raises(TypeError) as info:
+        _ = CheckArg.get_vector_length(fparser_tree)
+    assert ("The vector length metadata should be in the form "
+            "'form*vector_length' but found 'GH_FIELD * 3 * 2'."
+            in str(info.value))
+
     fparser_tree = CheckArg.create_fparser2(
         "arg_type(GH_FIELD*3, GH_REAL, GH_READ, W0)", Fortran2003.Part_Ref)
     vector_length = CheckArg.get_vector_length(fparser_tree)
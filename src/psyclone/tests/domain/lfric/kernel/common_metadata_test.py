@@ -39,9 +39,12 @@
 import pytest
 
 from fparser.two import Fortran2003
+from fparser.two.parser import ParserFactory
 
+from psyclone.configuration import Config
 from psyclone.domain.lfric.kernel import (
     CommonMetadata, MetaMeshArgMetadata, LFRicKernelMetadata)
+from psyclone.domain.lfric.kernel.common_metadata import MetadataValueError
 
 
 def test_init():
@@ -89,11 +92,13 @@ def test_validate_scalar_value():
         CommonMetadata.validate_scalar_value(None, None, None)
     assert ("The 'None' value should be of type str, but found 'NoneType'."
             in str(info.value))
-    with pytest.raises(ValueError) as info:
+    with pytest.raises(MetadataValueError) as info:
         CommonMetadata.validate_scalar_value(
             "invalid", ["value1", "value2"], "my_metadata")
     assert ("The 'my_metadata' metadata should be a recognised value (one of "
             "['value1', 'value2']) but found 'invalid'." in str(info.value))
+    assert info.value.name == "my_metadata"
+    assert isinstance(info.value, ValueError)
     CommonMetadata.validate_scalar_value(
             "Value2", ["value1", "value2"], "")
 
@@ -120,6 +125,40 @@ def test_create_fparser2():
             "but found 'hello'." in str(info.value))
 
 
+def test_setup_fparser2(monkeypatch):
+    '''Test that the _setup_fparser2 method only creates the fparser2
+    parser when the required class hierarchy is not already in place.
+
+    '''
+    calls = []
+    create = ParserFactory.create
+
+    def counting_create(self, std=None):
+        calls.append(std)
+        return create(self, std=std)
+
+    monkeypatch.setattr(ParserFactory, "create", counting_create)
+    ParserFactory().create(std="f2008")
+    calls.clear()
+    # The parser is set up once and then re-used.
+    CommonMetadata._setup_fparser2("f2003")
+    CommonMetadata._setup_fparser2("f2003")
+    assert calls == ["f2003"]
+    # The parser is set up again for a different standard.
+    CommonMetadata._setup_fparser2("f2008")
+    assert calls == ["f2003", "f2008"]
+    # The parser is set up again if it has been created elsewhere.
+    std = Config.get().fortran_standard
+    ParserFactory().create(std=std)
+    calls.clear()
+    CommonMetadata._setup_fparser2(std)
+    assert calls == [std]
+    result = CommonMetadata.create_fparser2(
+        "arg_type(GH_FIELD, GH_REAL, GH_READ)", Fortran2003.Part_Ref)
+    assert isinstance(result, Fortran2003.Part_Ref)
+    assert calls == [std]
+
+
 def test_create_from_fortran_string():
     '''Test the create_from_fortran_string() method. Test with an example
     subclass (MetaMeshArgMetadata).
@@ -130,3 +169,39 @@ def test_create_from_fortran_string():
         "mesh_data_type(adjacent_face)")
     assert isinstance(meta, MetaMeshArgMetadata)
     assert meta.mesh == "adjacent_face"
+
+
+def test_create_fparser2_cached():
+    '''Test that the _create_fparser2_cached method returns the same tree
+    for the same metadata and that create_from_fortran_string makes
+    use of it.
+
+    '''
+    CommonMetadata._create_fparser2_cached.cache_clear()
+    std = Config.get().fortran_standard
+    other_std = "f2003" if std == "f2008" else "f2008"
+    fortran_string = "mesh_data_type(adjacent_face)"
+    encoding = Fortran2003.Part_Ref
+    tree = CommonMetadata._create_fparser2_cached(
+        fortran_string, encoding, std)
+    assert isinstance(tree, encoding)
+    assert CommonMetadata._create_fparser2_cached(
+        fortran_string, encoding, std) is tree
+    # A different Fortran standard gives a different tree.
+    assert CommonMetadata._create_fparser2_cached(
+        fortran_string, encoding, other_std) is not tree
+    info = CommonMetadata._create_fparser2_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+    meta1 = MetaMeshArgMetadata.create_from_fortran_string(fortran_string)
+    meta2 = MetaMeshArgMetadata.create_from_fortran_string(fortran_string)
+    assert meta1 is not meta2
+    assert meta1.mesh == meta2.mesh == "adjacent_face"
+    assert CommonMetadata._create_fparser2_cached.cache_info().hits >= 2
+
+    # Errors are not cached.
+    with pytest.raises(ValueError) as info:
+        _ = CommonMetadata._create_fparser2_cached("#!$%", encoding, std)
+    assert ("Expected kernel metadata to be a Fortran Part_Ref, but found "
+            "'#!$%'." in str(info.value))
+    CommonMetadata._create_fparser2_cached.cache_clear()
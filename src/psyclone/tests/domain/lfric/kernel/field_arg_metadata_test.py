@@ -59,6 +59,18 @@ def test_create(datatype, access, function_space):
     assert field_arg._stencil is None
 
 
+def test_slots():
+    '''Test that FieldArgMetadata (and the classes it inherits from)
+    use __slots__, so instances have no __dict__ and no attributes can
+    be added.
+
+    '''
+    field_arg = FieldArgMetadata("GH_REAL", "GH_READ", "W0")
+    assert not hasattr(field_arg, "__dict__")
+    with pytest.raises(AttributeError):
+        field_arg.new_attribute = 1
+
+
 def test_create_stencil():
     '''Test that an instance of FieldArgMetadata can be created
     successfully with optional stencil metadata.
@@ -114,6 +126,21 @@ def test_get_metadata(metadata, expected_stencil):
     assert stencil == expected_stencil
 
 
+def test_create_from_fparser2_invalid_stencil():
+    '''Test that an invalid stencil type is reported with its argument
+    index by the create_from_fparser2 method.
+
+    '''
+    fparser2_tree = FieldArgMetadata.create_fparser2(
+        "arg_type(GH_FIELD, GH_REAL, GH_READ, W0, STENCIL(invalid))",
+        Fortran2003.Part_Ref)
+    with pytest.raises(ValueError) as info:
+        _ = FieldArgMetadata.create_from_fparser2(fparser2_tree)
+    assert ("At argument index '4' for metadata 'arg_type(GH_FIELD, GH_REAL, "
+            "GH_READ, W0, STENCIL(invalid))'. The 'stencil' metadata should "
+            "be a recognised value" in str(info.value))
+
+
 def test_get_stencil():
     '''Check that the get_stencil method behaves as expected.'''
 
@@ -114,6 +114,20 @@ def test_get_metadata():
     assert stencil is None
 
 
+def test_create_from_fparser2_invalid_vector_length():
+    '''Test that an invalid vector length is reported with its argument
+    index by the create_from_fparser2 method.
+
+    '''
+    fparser2_tree = FieldVectorArgMetadata.create_fparser2(
+        "arg_type(GH_FIELD*x, GH_REAL, GH_READ, W0)", Fortran2003.Part_Ref)
+    with pytest.raises(ValueError) as info:
+        _ = FieldVectorArgMetadata.create_from_fparser2(fparser2_tree)
+    assert ("At argument index '0' for metadata 'arg_type(GH_FIELD * x, "
+            "GH_REAL, GH_READ, W0)'. The vector size should be a string "
+            "containing an integer, but found 'x'." in str(info.value))
+
+
 @pytest.mark.parametrize("fortran_string", [
     "arg_type(GH_FIELD*3, GH_REAL, GH_READ, W0)",
     "arg_type(GH_FIELD*3, GH_REAL, GH_READ, W0, STENCIL(Y1D))"])
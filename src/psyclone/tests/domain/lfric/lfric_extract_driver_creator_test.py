@@ -46,8 +46,9 @@ from psyclone.line_length import FortLineLength
 from psyclone.parse import ModuleManager
 from psyclone.psyir.backend.visitor import VisitorError
 from psyclone.psyir.nodes import (
-    Literal, Routine, Schedule, Call, StructureReference)
-from psyclone.psyir.symbols import INTEGER_TYPE
+    Literal, Loop, Reference, Routine, Schedule, Call, StructureReference)
+from psyclone.psyir.symbols import (
+    DataSymbol, DataTypeSymbol, INTEGER_TYPE, IntrinsicSymbol, UnresolvedType)
 from psyclone.tests.utilities import Compile, get_base_path, get_invoke
 
 
@@ -122,6 +123,132 @@ def test_lfric_driver_add_call(fortran_writer):
     assert "call my_sub_2(1)" in out
 
 
+# ----------------------------------------------------------------------------
+def test_lfric_driver_command_line_handler_cache(fortran_writer,
+                                                 monkeypatch):
+    '''Tests that the parsed command line handling code is cached, and that
+    each driver gets its own copy using the symbols and region name of that
+    driver.
+    '''
+    cache = {}
+    monkeypatch.setattr(LFRicExtractDriverCreator, "_statement_cache",
+                        cache)
+    driver_creator = LFRicExtractDriverCreator()
+    psy_data_type = DataTypeSymbol("psy_data_type", UnresolvedType())
+    psy_data = DataSymbol("psy_data", psy_data_type)
+
+    outputs = []
+    for region in ["region1", "region2"]:
+        program = Routine.create("routine", is_program=True)
+        driver_creator._add_command_line_handler(program, psy_data,
+                                                 "mod", region)
+        symbol_table = program.symbol_table
+        assert "get_command_argument" in symbol_table
+        for ref in program.walk(Reference):
+            if not isinstance(ref.symbol, IntrinsicSymbol):
+                assert ref.symbol is symbol_table.lookup(ref.symbol.name)
+        loop = program.walk(Loop)[0]
+        assert loop.variable is symbol_table.lookup("psydata_i")
+        outputs.append(fortran_writer(program.children[0]) +
+                       fortran_writer(program.children[1]))
+    assert len(cache) == 2
+    assert "OpenReadModuleRegion('mod', 'region1')" in outputs[0]
+    assert (outputs[0].replace("region1", "region2") == outputs[1])
+
+    # A name clash results in different names and new cache entries:
+    program = Routine.create("routine", is_program=True)
+    program.symbol_table.new_symbol("psydata_filename")
+    driver_creator._add_command_line_handler(program, psy_data,
+                                             "mod", "region")
+    assert len(cache) == 4
+    assert ("psydata_filename_1 = psydata_arg" in
+            fortran_writer(program.children[0]))
+    assert ("call psy_data%OpenReadFileName(psydata_filename_1)" in
+            fortran_writer(program.children[1]))
+
+
+# ----------------------------------------------------------------------------
+@pytest.mark.usefixtures("change_into_tmpdir")
+def test_lfric_driver_write_driver_parts(monkeypatch):
+    '''Tests that get_driver_as_string joins the parts of the driver, and
+    that write_driver wraps and writes each part so that the result is the
+    same as wrapping the whole driver.
+    '''
+    long_line = "call my_sub(" + ", ".join(f"arg{i}" for i in range(40)) + ")"
+    parts = [("a_mod", "module a_mod\nend module a_mod"),
+             (None, f"program test\n{long_line}\nend program test")]
+    monkeypatch.setattr(LFRicExtractDriverCreator, "_get_driver_parts",
+                        lambda *args: parts)
+    driver_creator = LFRicExtractDriverCreator()
+    code = driver_creator.get_driver_as_string(None, None, "", "",
+                                               ("mod", "region"))
+    assert code == "\n".join(code for _, code in parts)
+
+    driver_creator.write_driver(None, None, "", "", ("mod", "region"))
+    with open("driver-mod-region.F90", "r", encoding='utf-8') as my_file:
+        driver = my_file.read()
+    assert driver == FortLineLength().process(code)
+    assert long_line not in driver
+
+
+# ----------------------------------------------------------------------------
+@pytest.mark.usefixtures("change_into_tmpdir")
+def test_lfric_driver_write_driver_share_common(monkeypatch):
+    '''Tests that write_driver with `share_common` writes each required
+    module only once into the common file, and not into the drivers.
+    '''
+    parts = [("a_mod", "module a_mod\nend module a_mod"),
+             (None, "program test1\nend program test1")]
+    monkeypatch.setattr(LFRicExtractDriverCreator, "_get_driver_parts",
+                        lambda *args: parts)
+    # Make sure any old file is overwritten:
+    with open("driver-common.F90", "w", encoding='utf-8') as my_file:
+        my_file.write("module old_mod\nend module old_mod")
+
+    emitted_modules = {}
+    driver_creator = LFRicExtractDriverCreator(
+        share_common=True, emitted_modules=emitted_modules)
+    driver_creator.write_driver(None, None, "", "", ("mod", "region1"))
+    with open("driver-common.F90", "r", encoding='utf-8') as my_file:
+        assert my_file.read() == "module a_mod\nend module a_mod"
+    with open("driver-mod-region1.F90", "r", encoding='utf-8') as my_file:
+        assert my_file.read() == "program test1\nend program test1"
+
+    common_file = os.path.abspath("driver-common.F90")
+    assert emitted_modules == {common_file: {"a_mod"}}
+
+    # The second driver, created by a creator sharing the emitted
+    # modules, only adds the new module to the common file
+    parts = [("a_mod", "module a_mod\nend module a_mod"),
+             ("b_mod", "module b_mod\nend module b_mod"),
+             (None, "program test2\nend program test2")]
+    driver_creator = LFRicExtractDriverCreator(
+        share_common=True, emitted_modules=emitted_modules)
+    driver_creator.write_driver(None, None, "", "", ("mod", "region2"))
+    with open("driver-common.F90", "r", encoding='utf-8') as my_file:
+        assert my_file.read() == ("module a_mod\nend module a_mod\n"
+                                  "module b_mod\nend module b_mod")
+    with open("driver-mod-region2.F90", "r", encoding='utf-8') as my_file:
+        assert my_file.read() == "program test2\nend program test2"
+
+    assert emitted_modules == {common_file: {"a_mod", "b_mod"}}
+
+    # A creator that does not share the record overwrites the common file
+    driver_creator = LFRicExtractDriverCreator(share_common=True)
+    driver_creator.write_driver(None, None, "", "", ("mod", "region2"))
+    with open("driver-common.F90", "r", encoding='utf-8') as my_file:
+        assert my_file.read() == ("module a_mod\nend module a_mod\n"
+                                  "module b_mod\nend module b_mod")
+    # pylint: disable=protected-access
+    assert driver_creator._emitted_modules == emitted_modules
+
+    # Without share_common, all modules are still inlined:
+    driver_creator = LFRicExtractDriverCreator()
+    driver_creator.write_driver(None, None, "", "", ("mod", "region3"))
+    with open("driver-mod-region3.F90", "r", encoding='utf-8') as my_file:
+        assert my_file.read() == "\n".join(code for _, code in parts)
+
+
 # ----------------------------------------------------------------------------
 def test_lfric_driver_import_modules():
     '''Tests that adding a call detects errors as expected.
@@ -231,6 +358,12 @@ def test_lfric_driver_simple_test():
     # be allocated as part of reading in its value):
     assert "ALLOCATE(x_ptr_vector," not in driver
 
+    # Pointers are declared as allocatable in the driver, other unsupported
+    # declarations are not modified:
+    assert ("real(kind=r_def), allocatable, dimension(:) :: m1_data "
+            in driver)
+    assert "character(:), allocatable :: psydata_filename" in driver
+
     # Check that all module dependencies have been inlined:
     for mod in ["read_kernel_data_mod", "constants_mod", "kernel_mod",
                 "argument_mod", "log_mod", "fs_continuity_mod",
@@ -244,6 +377,37 @@ def test_lfric_driver_simple_test():
     build.compile_file("driver-field-test.F90")
 
 
+@pytest.mark.usefixtures("change_into_tmpdir", "init_module_manager")
+def test_lfric_driver_share_common():
+    '''Test that the `share_common` option of the transformation writes
+    the required modules once into a common file instead of inlining them
+    into each driver.'''
+
+    psy, invoke = get_invoke("1.2_multi_invoke.f90", API,
+                             dist_mem=False, idx=0)
+
+    extract = LFRicExtractTrans()
+    for idx, loop in enumerate(invoke.schedule.children):
+        extract.apply(loop,
+                      options={"create_driver": True,
+                               "share_common": True,
+                               "region_name": ("field", f"test{idx}")})
+    _ = psy.gen
+
+    with open("driver-common.F90", "r", encoding='utf-8') as my_file:
+        common = my_file.read()
+    for mod in ["read_kernel_data_mod", "constants_mod", "testkern_mod"]:
+        assert common.count(f"end module {mod}") == 1
+
+    for idx in range(2):
+        with open(f"driver-field-test{idx}.F90", "r",
+                  encoding='utf-8') as my_file:
+            driver = my_file.read()
+        assert "end module" not in driver
+        assert "use read_kernel_data_mod" in driver
+        assert "end program field_test" in driver
+
+
 @pytest.mark.usefixtures("change_into_tmpdir", "init_module_manager")
 def test_lfric_driver_dm_test():
     '''Test the full pipeline with DM:  '''
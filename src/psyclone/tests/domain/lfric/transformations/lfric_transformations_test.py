@@ -7358,6 +7358,25 @@ def test_kern_const_anyspace_anydspace_apply(capsys):
         "value 2.\n")
 
 
+def test_kern_const_function_spaces_apply(capsys):
+    ''' Check that the number of dofs of generic function spaces is set
+    when their concrete function space is provided for the call.
+
+    '''
+    kernel = create_kernel("1.5.3_single_invoke_write_any_anyd_space.f90")
+
+    kctrans = LFRicKernelConstTrans()
+
+    kctrans.apply(kernel, {"element_order_h": 0, "element_order_v": 0,
+                           "function_spaces": {"ANY_SPACE_1": "W0"}})
+    result, _ = capsys.readouterr()
+    assert (
+        "    Modified ndf_aspc1, arg position 9, function space w0, "
+        "value 8.\n" in result)
+    assert ("    Skipped dofs, arg position 18, function space "
+            "any_discontinuous_space_1\n" in result)
+
+
 def test_kern_const_anyw2_apply(capsys):
     '''Check that we generate the expected output from the apply method
     when a function space is specified as any_w2_space (as these are
@@ -7619,6 +7638,15 @@ def test_kern_const_invalid():
             "element_order_v must also be set") \
         in str(excinfo.value)
 
+    # Function spaces not a mapping from generic to concrete spaces
+    for function_spaces in [["w0"], {"w3": "w0"}, {"any_space_1": "w9"}]:
+        with pytest.raises(TransformationError) as excinfo:
+            kctrans.apply(kernel, {"number_of_layers": 20,
+                                   "function_spaces": function_spaces})
+        assert ("The function_spaces argument must be a dict mapping "
+                "generic function spaces to one of ['w3', 'w2', "
+                in str(excinfo.value))
+
 
 def test_kern_const_invalid_dofs(monkeypatch):
     '''Check that we generate the expected exception when an unexpected
@@ -444,6 +444,19 @@ def test_length():
         "provided on input"
 
 
+def test_process_line():
+    ''' Tests that the process_line method wraps a single line in the
+    same way as the process method. '''
+    fll = FortLineLength(line_length=30)
+    assert fll.process_line("  a = b") == "  a = b"
+    line = "  my_variable = another_variable + yet_another_variable"
+    result = fll.process_line(line)
+    assert result == fll.process(line)
+    assert result == ("  my_variable = &\n"
+                      "&another_variable + &\n"
+                      "&yet_another_variable")
+
+
 def test_long_line_continuator():
     '''Tests that an input algorithm file with long lines of a type not
        recognised by FortLineLength (assignments in this case), which
@@ -121,6 +121,43 @@ def test_mod_manager_precedence_preprocessed():
     assert mod_info.filename == "d1/a_mod.f90"
 
 
+# ----------------------------------------------------------------------------
+@pytest.mark.usefixtures("change_into_tmpdir", "clear_module_manager_instance",
+                         "mod_man_test_setup_directories")
+def test_mod_manager_preprocessed_search_completed(monkeypatch):
+    '''Make sure that a module in a file that requires preprocessing is
+    not searched for again once all search paths have been searched,
+    unless new files have been visited since.
+
+    '''
+    mod_man = ModuleManager.get()
+    mod_man.add_search_path("d1")
+    mod_info = mod_man.get_module_info("b_mod")
+    assert mod_info.filename == "d1/d3/b_mod.F90"
+    assert not mod_man._remaining_search_paths
+    # The module was found while adding new files, so the search of the
+    # visited files is only completed when it is requested again:
+    assert "b_mod" not in mod_man._completed_searches
+    mod_info = mod_man.get_module_info("b_mod")
+    assert mod_man._completed_searches["b_mod"] == \
+        (len(mod_man._visited_files), mod_info)
+
+    # The search is complete, so the files are not searched again:
+    def no_search(_name, _file_list):
+        raise AssertionError("Files should not be searched")
+    monkeypatch.setattr(mod_man, "_find_module_in_files", no_search)
+    assert mod_man.get_module_info("b_mod") is mod_info
+    monkeypatch.undo()
+
+    # A new search path results in a new search, which can find a file
+    # that does not require preprocessing:
+    os.makedirs("d5")
+    with open(os.path.join("d5", "b_mod.f90"), "w", encoding="utf-8") as f_out:
+        f_out.write("module b_mod\nend module b_mod")
+    mod_man.add_search_path("d5")
+    assert mod_man.get_module_info("b_mod").filename == "d5/b_mod.f90"
+
+
 # ----------------------------------------------------------------------------
 @pytest.mark.usefixtures("change_into_tmpdir", "clear_module_manager_instance",
                          "mod_man_test_setup_directories")
@@ -54,6 +54,7 @@ from psyclone.psyad.domain.lfric.lfric_adjoint_harness import (
     _init_operators_random,
     _init_scalar_value,
     _validate_geom_arg,
+    _vector_dims,
     _lfric_create_real_comparison,
     generate_lfric_adjoint_harness)
 from psyclone.psyir import nodes
@@ -63,6 +64,15 @@ from psyclone.psyir.symbols import (DataSymbol, REAL_TYPE, BOOLEAN_TYPE,
                                     ImportInterface, ScalarType, SymbolTable)
 
 
+# _vector_dims
+
+def test_vector_dims():
+    '''Test that _vector_dims returns the indices of the components of a
+    field vector.'''
+    assert _vector_dims(ArrayType(REAL_TYPE, [3])) == range(1, 4)
+    assert _vector_dims(ArrayType(REAL_TYPE, [(2, 5)])) == range(2, 6)
+
+
 # _compute_lfric_inner_products
 
 def test_compute_inner_products_scalars(fortran_writer):
@@ -82,9 +92,16 @@ def test_compute_inner_products_scalars(fortran_writer):
         prog, [(sym1, sym1), (sym1, sym2), (sym3, sym3)], [], sum_sym)
     gen = fortran_writer(prog)
     # The resulting code should not include var3 since it is boolean.
-    assert ("  my_sum = 0.0\n"
-            "  my_sum = my_sum + var1 * var1\n"
-            "  my_sum = my_sum + var1 * var2\n\n"
+    assert ("  my_sum = var1 * var1 + var1 * var2\n\n"
+            "end program" in gen)
+    # Without any (non-boolean) terms the sum is just initialised to zero.
+    table = LFRicSymbolTable()
+    prog = nodes.Routine.create("test_prog", table, [], is_program=True)
+    table.add(sum_sym)
+    table.add(sym3)
+    _compute_lfric_inner_products(prog, [(sym3, sym3)], [], sum_sym)
+    gen = fortran_writer(prog)
+    assert ("  my_sum = 0.0\n\n"
             "end program" in gen)
 
 
@@ -105,12 +122,8 @@ def test_compute_inner_products_fields(fortran_writer):
                             datatype=atype)
     _compute_lfric_inner_products(prog, [], [sym1, sym2, sym3], sum_sym)
     gen = fortran_writer(prog)
-    assert ("  my_sum = 0.0\n"
-            "  my_sum = my_sum + ip1\n"
-            "  my_sum = my_sum + ip2\n"
-            "  my_sum = my_sum + ip3(1_i_def)\n"
-            "  my_sum = my_sum + ip3(2_i_def)\n"
-            "  my_sum = my_sum + ip3(3_i_def)\n" in gen)
+    assert ("  my_sum = ip1 + ip2 + ip3(1_i_def) + ip3(2_i_def) + "
+            "ip3(3_i_def)\n" in gen)
 
 
 # _compute_field_inner_products
@@ -606,9 +619,7 @@ def test_generate_lfric_adjoint_harness(fortran_reader, fortran_writer):
             "field), testkern_type(ascalar, field), x_innerproduct_x("
             "field_inner_prod, field))\n" in gen)
     # Compute and store the sum of all inner products.
-    assert ("    inner1 = 0.0_r_def\n"
-            "    inner1 = inner1 + ascalar * ascalar\n"
-            "    inner1 = inner1 + field_inner_prod\n"
+    assert ("    inner1 = ascalar * ascalar + field_inner_prod\n"
             "    field_field_input_inner_prod = 0.0_r_def\n" in gen)
     # Run the adjoint of the kernel and compute the inner products of its
     # outputs with the inputs to the TL kernel.
@@ -616,9 +627,8 @@ def test_generate_lfric_adjoint_harness(fortran_reader, fortran_writer):
             "x_innerproduct_y(field_field_input_inner_prod, field, "
             "field_input))"
             in gen)
-    assert ("    inner2 = 0.0_r_def\n"
-            "    inner2 = inner2 + ascalar * ascalar_input\n"
-            "    inner2 = inner2 + field_field_input_inner_prod\n" in gen)
+    assert ("    inner2 = ascalar * ascalar_input + "
+            "field_field_input_inner_prod\n" in gen)
 
 
 def test_generate_lfric_adj_test_quadrature(fortran_reader):
@@ -42,7 +42,7 @@ from psyclone.psyir.nodes.node import colored
 from psyclone.psyir.nodes.omp_clauses import OMPGrainsizeClause, \
     OMPNowaitClause, OMPNogroupClause, OMPNumTasksClause, OMPSharedClause, \
     OMPDependClause, OMPPrivateClause, OMPFirstprivateClause, \
-    OMPDefaultClause, OMPScheduleClause
+    OMPLastprivateClause, OMPDefaultClause, OMPScheduleClause
 from psyclone.psyir.nodes.literal import Literal
 from psyclone.psyir.nodes.reference import Reference
 from psyclone.psyir.symbols import DataSymbol, INTEGER_TYPE
@@ -144,9 +144,11 @@ def test_shared_clause():
 
 @pytest.mark.parametrize("testclass, string",
                          [(OMPPrivateClause, "private"),
-                          (OMPFirstprivateClause, "firstprivate")])
+                          (OMPFirstprivateClause, "firstprivate"),
+                          (OMPLastprivateClause, "lastprivate")])
 def test_private_and_firstprivate_clause(testclass, string):
-    ''' Test the OMPPrivateClause and OMPFirstprivateClause functionality. '''
+    ''' Test the OMPPrivateClause, OMPFirstprivateClause and
+    OMPLastprivateClause functionality. '''
     private = testclass()
     assert private.clause_string == ""
     tmp = DataSymbol("tmp", INTEGER_TYPE)
@@ -157,11 +159,12 @@ def test_private_and_firstprivate_clause(testclass, string):
 
 @pytest.mark.parametrize("testclass, string",
                          [(OMPPrivateClause, "OMPPrivateClause"),
-                          (OMPFirstprivateClause, "OMPFirstprivateClause")])
+                          (OMPFirstprivateClause, "OMPFirstprivateClause"),
+                          (OMPLastprivateClause, "OMPLastprivateClause")])
 def test_private_clause_create(testclass, string):
-    ''' Test that OMPPrivateClause and OMPFirstprivateClause create methods
-    accept a list of symbols and add children with references containing
-    those symbols. '''
+    ''' Test that OMPPrivateClause, OMPFirstprivateClause and
+    OMPLastprivateClause create methods accept a list of symbols and add
+    children with references containing those symbols. '''
 
     symbol1 = DataSymbol("a", INTEGER_TYPE)
     symbol2 = DataSymbol("b", INTEGER_TYPE)
@@ -59,7 +59,8 @@ from psyclone.psyir.nodes import (
     OMPPrivateClause, OMPDefaultClause, OMPReductionClause,
     OMPScheduleClause, OMPTeamsDistributeParallelDoDirective,
     OMPAtomicDirective, OMPFirstprivateClause, OMPSimdDirective,
-    StructureReference, IfBlock, OMPTeamsLoopDirective, OMPBarrierDirective)
+    StructureReference, IfBlock, OMPTeamsLoopDirective, OMPBarrierDirective,
+    OMPTileDirective, OMPLastprivateClause)
 from psyclone.psyir.symbols import (
     DataSymbol, INTEGER_TYPE, SymbolTable, ArrayType, RoutineSymbol,
     REAL_SINGLE_TYPE, INTEGER_SINGLE_TYPE, Symbol, StructureType,
@@ -1699,6 +1700,160 @@ def test_omp_simd_strings():
     assert atomic.end_string() == "omp end simd"
 
 
+def test_omp_simd_clauses():
+    ''' Test the OMPSimdDirective aligned, alignment and safelen
+    arguments. '''
+    simd = OMPSimdDirective(aligned=["a", "b"], alignment=64, safelen=8)
+    assert simd.aligned == ["a", "b"]
+    assert simd.alignment == 64
+    assert simd.safelen == 8
+    assert simd.begin_string() == "omp simd aligned(a,b:64) safelen(8)"
+    assert OMPSimdDirective(aligned=["a"]).begin_string() == \
+        "omp simd aligned(a)"
+    assert simd == OMPSimdDirective(aligned=["a", "b"], alignment=64,
+                                    safelen=8)
+    assert simd != OMPSimdDirective(aligned=["a", "b"], alignment=64)
+
+    with pytest.raises(TypeError) as err:
+        OMPSimdDirective(aligned="a")
+    assert ("The OMPSimdDirective 'aligned' argument must be a list of str "
+            "but found 'a'." in str(err.value))
+    with pytest.raises(TypeError) as err:
+        OMPSimdDirective(safelen=0)
+    assert ("The OMPSimdDirective 'safelen' argument must be a positive int "
+            "but found '0'." in str(err.value))
+    with pytest.raises(ValueError) as err:
+        OMPSimdDirective(alignment=64)
+    assert ("The OMPSimdDirective 'alignment' argument can only be provided "
+            "together with 'aligned' arrays." in str(err.value))
+
+
+def test_omp_simd_lowering(fortran_reader, caplog):
+    ''' Test that lowering an OMPSimdDirective adds its private and
+    lastprivate clauses, and that it fails if a scalar would need to be
+    firstprivate. '''
+    assert OMPSimdDirective._validate_child(0, Schedule())
+    assert OMPSimdDirective._validate_child(1, OMPPrivateClause())
+    assert OMPSimdDirective._validate_child(2, OMPLastprivateClause())
+    assert not OMPSimdDirective._validate_child(1, OMPLastprivateClause())
+    assert not OMPSimdDirective._validate_child(3, OMPPrivateClause())
+
+    tree = fortran_reader.psyir_from_source('''
+    subroutine my_subroutine()
+        real, dimension(10) :: a
+        real :: tmp, last, cond, acc
+        integer :: k
+        do k = 1, 10
+            tmp = k * 2.0
+            last = tmp
+            a(k) = last
+        end do
+        a(1) = last
+        do k = 1, 10
+            if (k > 5) then
+                cond = a(k)
+            end if
+            a(k) = cond
+        end do
+        do k = 1, 10
+            a(k) = acc
+            acc = a(k)
+        end do
+    end subroutine
+    ''')
+    loops = tree.walk(Loop)
+    directives = []
+    for loop in loops:
+        directive = OMPSimdDirective()
+        loop.replace_with(directive)
+        directive.dir_body.addchild(loop)
+        directives.append(directive)
+
+    lowered = directives[0].lower_to_language_level()
+    assert isinstance(lowered.clauses[0], OMPPrivateClause)
+    assert [ref.name for ref in lowered.clauses[0].children] == ["tmp"]
+    assert isinstance(lowered.clauses[1], OMPLastprivateClause)
+    assert [ref.name for ref in lowered.clauses[1].children] == ["last"]
+    # Lowering again recomputes the clauses
+    assert len(directives[0].lower_to_language_level().children) == 3
+
+    with pytest.raises(GenerationError) as err:
+        directives[1].lower_to_language_level()
+    assert ("The OMPSimdDirective cannot be lowered because the scalars "
+            "['cond'] would need to be firstprivate, which is not allowed on "
+            "an OpenMP simd construct." in str(err.value))
+
+    with caplog.at_level(logging.WARNING):
+        directives[2].lower_to_language_level()
+    assert ("Lowering 'OMPSimdDirective' detected a possible race condition "
+            "for symbols ['acc']." in caplog.text)
+
+
+def test_omp_tile_directive(fortran_reader, fortran_writer):
+    ''' Test the OMPTileDirective constructor, strings, equality and
+    global constraints. '''
+    tile = OMPTileDirective()
+    assert tile.sizes == (32, 32)
+    tile = OMPTileDirective(sizes=[4, 8])
+    assert tile.sizes == (4, 8)
+    assert tile.begin_string() == "omp tile sizes(4,8)"
+    assert tile.end_string() == "omp end tile"
+    assert tile.node_str(colour=False) == "OMPTileDirective[sizes=4,8]"
+    assert tile == OMPTileDirective(sizes=(4, 8))
+    assert tile != OMPTileDirective(sizes=(4, 4))
+
+    for value in [(), (1, 0), "a", (2.0,)]:
+        with pytest.raises(TypeError) as err:
+            tile.sizes = value
+        assert ("The OMPTileDirective sizes must be a non-empty tuple of "
+                "positive integers" in str(err.value))
+
+    code = '''
+    subroutine my_subroutine()
+        integer, dimension(10, 10) :: A
+        integer :: i, j
+        do i = 1, 10
+            A(i,1) = 3
+            do j = 1, 10
+                A(i,j) = 3
+            end do
+        end do
+    end subroutine
+    '''
+    tree = fortran_reader.psyir_from_source(code)
+    loop = tree.walk(Loop)[0]
+    position = loop.position
+    routine = loop.parent
+    tile = OMPTileDirective(sizes=(4, 4), children=[loop.detach()])
+    routine.children.insert(position, tile)
+    # The loops are not perfectly nested
+    with pytest.raises(GenerationError) as err:
+        tile.validate_global_constraints()
+    assert ("The OMP TILE directive must be associated with 2 "
+            "perfectly-nested loops but the nested body at depth 1 of"
+            in str(err.value))
+    loop.loop_body[0].detach()
+    tile.validate_global_constraints()
+
+    # A collapsed loop directive can be associated with the tile construct.
+    pdo = OMPParallelDoDirective(collapse=2)
+    routine.children.insert(position, pdo)
+    pdo.dir_body.addchild(tile.detach())
+    pdo.validate_global_constraints()
+    pdo.collapse = 3
+    with pytest.raises(GenerationError) as err:
+        pdo.validate_global_constraints()
+    assert ("OMPParallelDoDirective has a collapse=3 but its associated "
+            "OMPTileDirective only tiles 2 loops." in str(err.value))
+    pdo.collapse = 2
+    code = fortran_writer(tree)
+    assert ("  !$omp parallel do collapse(2) default(shared) private(i,j)\n"
+            "  !$omp tile sizes(4,4)\n"
+            "  do i = 1, 10, 1\n" in code)
+    assert ("  !$omp end tile\n"
+            "  !$omp end parallel do\n" in code)
+
+
 def test_omp_simd_validate_global_constraints(fortran_reader):
     ''' Test the OMPSimdDirective can check the globals constraints to
     validate that the directive is correctly formed.'''
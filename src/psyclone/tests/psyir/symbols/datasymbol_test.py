@@ -49,10 +49,10 @@ from psyclone.psyir.symbols import (
     ImportInterface, ArgumentInterface, StaticInterface, UnresolvedInterface,
     ScalarType, ArrayType, REAL_SINGLE_TYPE, REAL_DOUBLE_TYPE, REAL4_TYPE,
     REAL8_TYPE, INTEGER_SINGLE_TYPE, INTEGER_DOUBLE_TYPE, INTEGER4_TYPE,
-    BOOLEAN_TYPE, CHARACTER_TYPE, SymbolTable, UnresolvedType,
-    UnsupportedFortranType)
-from psyclone.psyir.nodes import (BinaryOperation, CodeBlock, IntrinsicCall,
-                                  Literal, Reference, Return)
+    BOOLEAN_TYPE, CHARACTER_TYPE, RoutineSymbol, SymbolTable,
+    UnresolvedType, UnsupportedFortranType)
+from psyclone.psyir.nodes import (BinaryOperation, Call, CodeBlock,
+                                  IntrinsicCall, Literal, Reference, Return)
 
 
 def test_datasymbol_initialisation():
@@ -288,6 +288,20 @@ def test_datasymbol_initial_value_setter_invalid():
             "expressions can only contain PSyIR Literal, Operation, Reference,"
             " IntrinsicCall or CodeBlock nodes but found:" in str(error.value))
 
+    # An invalid node nested within an otherwise valid expression is found
+    ct_expr = BinaryOperation.create(
+        BinaryOperation.Operator.ADD,
+        Literal("1", INTEGER_SINGLE_TYPE),
+        BinaryOperation.create(
+            BinaryOperation.Operator.MUL,
+            Literal("2", INTEGER_SINGLE_TYPE),
+            Call.create(RoutineSymbol("my_func"))))
+    with pytest.raises(ValueError) as error:
+        _ = DataSymbol('a', INTEGER_SINGLE_TYPE, initial_value=ct_expr)
+    assert ("PSyIR static expressions can only contain PSyIR Literal, "
+            "Operation, Reference, IntrinsicCall or CodeBlock nodes but "
+            "found: Call[name='my_func']" in str(error.value))
+
     with pytest.raises(ValueError) as error:
         DataSymbol('a', INTEGER_SINGLE_TYPE, interface=ArgumentInterface(),
                    initial_value=9)
@@ -0,0 +1,167 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2018-2025, Science and Technology Facilities Council.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# ----------------------------------------------------------------------------
+# Author: J. Elsey
+
+''' Tests for the OMPSimdTrans transformation. '''
+
+import pytest
+from psyclone.psyir.nodes import Loop, OMPSimdDirective
+from psyclone.psyir.transformations import OMPSimdTrans, TransformationError
+
+
+CODE = '''
+subroutine my_subroutine()
+    real, dimension(10) :: A, B
+    real :: s
+    integer :: i
+    do i = 1, 10
+        A(i) = B(i) * s
+    end do
+    do i = 2, 10
+        A(i) = A(i - 1)
+    end do
+end subroutine
+'''
+
+
+def test_ompsimdtrans(fortran_reader, fortran_writer):
+    ''' Test that OMPSimdTrans encloses the loop in a directive. '''
+    tree = fortran_reader.psyir_from_source(CODE)
+    loop = tree.walk(Loop)[0]
+    trans = OMPSimdTrans()
+    assert str(trans) == "Adds an OpenMP simd directive to a loop"
+    trans.apply(loop, {"aligned": ["a", "B"], "alignment": 64,
+                       "safelen": 8})
+    directive = loop.parent.parent
+    assert isinstance(directive, OMPSimdDirective)
+    assert directive.position == 0
+    assert ("  !$omp simd aligned(a,B:64) safelen(8)\n"
+            "  do i = 1, 10, 1\n" in fortran_writer(tree))
+
+    # No clauses by default, and also if the clause options are None
+    loop = tree.walk(Loop)[1]
+    trans.apply(loop, {"force": True, "aligned": None, "alignment": None,
+                       "safelen": None})
+    assert loop.parent.parent.begin_string() == "omp simd"
+
+
+def test_ompsimdtrans_validate(fortran_reader):
+    ''' Test the validation of OMPSimdTrans. '''
+    tree = fortran_reader.psyir_from_source(CODE)
+    loops = tree.walk(Loop)
+    trans = OMPSimdTrans()
+
+    with pytest.raises(TransformationError) as err:
+        trans.validate(loops[0], {"safelen": -1})
+    assert ("The OMPSimdDirective 'safelen' argument must be a positive "
+            "int but found '-1'." in str(err.value))
+
+    with pytest.raises(TransformationError) as err:
+        trans.validate(loops[0], {"aligned": ["s"]})
+    assert ("The aligned array 's' is not an array accessed in the loop "
+            "over 'i'." in str(err.value))
+
+    # An explicit None means no arrays are aligned
+    trans.validate(loops[0], {"aligned": None})
+
+    # Loop-carried dependency
+    with pytest.raises(TransformationError) as err:
+        trans.validate(loops[1])
+    assert ("The loop over 'i' cannot be vectorised because it has "
+            "loop-carried dependencies" in str(err.value))
+    # Unless the dependency analysis is skipped
+    trans.validate(loops[1], {"force": True})
+
+
+def test_ompsimdtrans_scalar_private(fortran_reader, fortran_writer):
+    ''' Test that the scalars written in the vectorised loop are declared
+    private, or lastprivate if they are used after the loop or are not
+    local to the routine. '''
+    tree = fortran_reader.psyir_from_source('''
+    subroutine my_subroutine(a, b, res)
+        real, dimension(10) :: a, b
+        real :: res, tmp
+        integer :: k, ik
+        do k = 1, 9
+            ik = k + 1
+            a(k) = b(ik)
+        end do
+        do k = 1, 9
+            tmp = b(k) * 2.0
+            res = tmp
+            a(k) = res
+        end do
+        a(1) = tmp
+    end subroutine
+    ''')
+    loops = tree.walk(Loop)
+    trans = OMPSimdTrans()
+    trans.apply(loops[0])
+    trans.apply(loops[1])
+    output = fortran_writer(tree)
+    assert ("  !$omp simd private(ik)\n"
+            "  do k = 1, 9, 1\n"
+            "    ik = k + 1\n" in output)
+    assert ("  !$omp simd lastprivate(res,tmp)\n"
+            "  do k = 1, 9, 1\n" in output)
+
+
+def test_ompsimdtrans_validate_conditional_scalar(fortran_reader):
+    ''' Test that OMPSimdTrans rejects a loop with a scalar that is only
+    conditionally written, as it would need to be firstprivate. '''
+    tree = fortran_reader.psyir_from_source('''
+    subroutine my_subroutine()
+        real, dimension(10) :: a, b
+        real :: tmp
+        integer :: k
+        tmp = 0.0
+        do k = 1, 10
+            if (b(k) > 0.0) then
+                tmp = b(k)
+            end if
+            a(k) = tmp
+        end do
+    end subroutine
+    ''')
+    loop = tree.walk(Loop)[0]
+    trans = OMPSimdTrans()
+    with pytest.raises(TransformationError) as err:
+        trans.validate(loop)
+    assert ("The scalar 'tmp' is only conditionally written in the loop over "
+            "'k', so it would need to be firstprivate, which is not allowed "
+            "on an OpenMP simd construct." in str(err.value))
+    # Skipping the dependency analysis does not skip this check
+    with pytest.raises(TransformationError) as err:
+        trans.validate(loop, {"force": True})
+    assert "The scalar 'tmp' is only conditionally written" in str(err.value)
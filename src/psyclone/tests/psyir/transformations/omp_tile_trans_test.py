@@ -0,0 +1,140 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2018-2025, Science and Technology Facilities Council.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# ----------------------------------------------------------------------------
+# Author: J. Elsey
+
+''' Tests for the OMPTileTrans transformation. '''
+
+import pytest
+from psyclone.psyir.nodes import Loop, OMPTileDirective
+from psyclone.psyir.transformations import (
+    OMPLoopTrans, OMPTileTrans, TransformationError)
+
+
+CODE = '''
+subroutine my_subroutine(n)
+    integer, intent(in) :: n
+    integer, dimension(10, 10, 10) :: A, B
+    integer :: i, j, k
+    do k = 1, 10
+        do j = 1, 10
+            do i = 1, 10
+                A(i, j, k) = B(i, j, k)
+            end do
+        end do
+    end do
+    do k = 1, 10
+        do j = 1, k
+            A(1, j, k) = 0
+        end do
+    end do
+    do k = 2, 10
+        do j = 1, 10
+            A(1, j, k) = A(1, j, k - 1)
+        end do
+    end do
+end subroutine
+'''
+
+
+def test_omptiletrans(fortran_reader, fortran_writer):
+    ''' Test that OMPTileTrans encloses the loop nest in a directive. '''
+    tree = fortran_reader.psyir_from_source(CODE)
+    loop = tree.walk(Loop)[0]
+    trans = OMPTileTrans()
+    assert str(trans) == "Adds an OpenMP tile directive to a nest of loops"
+    trans.apply(loop, {"tile_sizes": (2, 4, 8)})
+    directive = loop.parent.parent
+    assert isinstance(directive, OMPTileDirective)
+    assert directive.sizes == (2, 4, 8)
+    assert directive.position == 0
+    assert ("  !$omp tile sizes(2,4,8)\n"
+            "  do k = 1, 10, 1\n" in fortran_writer(tree))
+
+    # The default is to tile the outermost two loops
+    tree = fortran_reader.psyir_from_source(CODE)
+    loop = tree.walk(Loop)[1]
+    trans.apply(loop)
+    assert loop.parent.parent.sizes == (32, 32)
+
+
+def test_omptiletrans_validate(fortran_reader):
+    ''' Test the validation of OMPTileTrans. '''
+    tree = fortran_reader.psyir_from_source(CODE)
+    loops = tree.walk(Loop)
+    trans = OMPTileTrans()
+
+    with pytest.raises(TransformationError) as err:
+        trans.validate(loops[0], {"tile_sizes": (2, 0)})
+    assert ("The OMPTileTrans 'tile_sizes' option must be a non-empty tuple "
+            "of positive integers but found '(2, 0)'." in str(err.value))
+
+    with pytest.raises(TransformationError) as err:
+        trans.validate(loops[0], {"tile_sizes": (2, 2, 2, 2)})
+    assert ("The 4 tiled loops must be perfectly nested, but the body of "
+            "the loop at depth 2 is not a single loop." in str(err.value))
+
+    # Triangular iteration space
+    with pytest.raises(TransformationError) as err:
+        trans.validate(loops[3])
+    assert ("The bounds of the loop over 'j' depend on the variable 'k' of "
+            "an enclosing loop of the tiled nest." in str(err.value))
+
+    # Loop-carried dependency
+    with pytest.raises(TransformationError) as err:
+        trans.validate(loops[5])
+    assert ("The loop over 'k' cannot be tiled because it has loop-carried "
+            "dependencies" in str(err.value))
+    # Unless the dependency analysis is skipped
+    trans.validate(loops[5], {"force": True})
+
+
+def test_omptiletrans_validate_collapse(fortran_reader, fortran_writer):
+    ''' Test that OMPTileTrans rejects a loop nest whose worksharing
+    directive collapses more loops than there are tile sizes. '''
+    tree = fortran_reader.psyir_from_source(CODE)
+    loop = tree.walk(Loop)[0]
+    OMPLoopTrans(omp_directive="paralleldo").apply(loop, {"collapse": 2})
+    trans = OMPTileTrans()
+    with pytest.raises(TransformationError) as err:
+        trans.apply(loop, {"tile_sizes": (8,)})
+    assert ("The loop over 'k' is associated with an OMPParallelDoDirective "
+            "with collapse=2, which is more than the 1 tiled loops."
+            in str(err.value))
+    assert not tree.walk(OMPTileDirective)
+
+    # As many tile sizes as collapsed loops is fine
+    trans.apply(loop, {"tile_sizes": (8, 32)})
+    output = fortran_writer(tree)
+    assert "!$omp parallel do collapse(2) default(shared)" in output
+    assert "!$omp tile sizes(8,32)\n  do k = 1, 10, 1\n" in output
@@ -1782,6 +1782,13 @@ class LFRicKernelConstTrans(Transformation):
         :param bool options["quadrature"]: whether the number of quadrature
             points values are set as constants in the kernel (True) or not
             (False). The default is False.
+        :param options["function_spaces"]: the concrete function space of
+            any generic (any_space_*, any_discontinuous_space_* or any_w2)
+            function space of the kernel, for this particular call. This
+            allows the number of dofs of these function spaces to be set as
+            constants, specialising the kernel for this call. Generic
+            function spaces that are not in this mapping are skipped.
+        :type options["function_spaces"]: Dict[str, str]
 
         '''
         # --------------------------------------------------------------------
@@ -1853,6 +1860,9 @@ class LFRicKernelConstTrans(Transformation):
         quadrature = options.get("quadrature", False)
         element_order_h = options.get("element_order_h", None)
         element_order_v = options.get("element_order_v", None)
+        function_spaces = {
+            name.lower(): space.lower() for name, space in
+            options.get("function_spaces", {}).items()}
         kernel = node
 
         arg_list_info = KernCallArgList(kernel)
@@ -1890,28 +1900,32 @@ class LFRicKernelConstTrans(Transformation):
         if (element_order_h is not None) and (element_order_h is not None):
             # Modify the symbol table for degrees of freedom here.
             for info in arg_list_info.ndf_positions:
-                if (info.function_space.lower() in
+                # Replace a generic function space by the concrete one
+                # provided for this call (if any)
+                function_space = function_spaces.get(
+                    info.function_space.lower(), info.function_space)
+                if (function_space.lower() in
                         (const.VALID_ANY_SPACE_NAMES +
                          const.VALID_ANY_DISCONTINUOUS_SPACE_NAMES +
                          ["any_w2"])):
                     # skip any_space_*, any_discontinuous_space_* and any_w2
                     print(f"    Skipped dofs, arg position {info.position}, "
-                          f"function space {info.function_space}")
+                          f"function space {function_space}")
                 else:
                     try:
                         ndofs = LFRicKernelConstTrans. \
                                 space_to_dofs[
-                                    info.function_space](element_order_h,
-                                                         element_order_v)
+                                    function_space](element_order_h,
+                                                    element_order_v)
                     except KeyError as err:
                         raise InternalError(
                             f"Error in LFRicKernelConstTrans "
                             f"transformation. Unsupported function space "
-                            f"'{info.function_space}' found. Expecting one of "
+                            f"'{function_space}' found. Expecting one of "
                             f"""{LFRicKernelConstTrans.
                                  space_to_dofs.keys()}.""") from err
                     make_constant(symbol_table, info.position, ndofs,
-                                  function_space=info.function_space)
+                                  function_space=function_space)
 
         # Flag that the kernel has been modified
         kernel.modified = True
@@ -1932,6 +1946,9 @@ class LFRicKernelConstTrans(Transformation):
         :param int options["number_of_layers"]: the number of layers to use.
         :param bool options["quadrature"]: whether quadrature dimension sizes \
             should or shouldn't be set as constants in a kernel.
+        :param options["function_spaces"]: the concrete function space of
+            generic function spaces of the kernel.
+        :type options["function_spaces"]: Dict[str, str]
 
         :raises TransformationError: if the node argument is not a \
             lFRic kernel, the cellshape argument is not set to \
@@ -1942,6 +1959,8 @@ class LFRicKernelConstTrans(Transformation):
             set (as the transformation would then do nothing), or the \
             quadrature argument is True but the element order is not \
             provided (as the former needs the latter).
+        :raises TransformationError: if the function_spaces argument is not
+            a mapping from generic to supported concrete function spaces.
 
         '''
         if not isinstance(node, LFRicKern):
@@ -2008,6 +2027,23 @@ class LFRicKernelConstTrans(Transformation):
                 "element_order_v must also be set (as the values of the "
                 "former are derived from the latter.")
 
+        function_spaces = options.get("function_spaces", {})
+        const = LFRicConstants()
+        generic_spaces = (const.VALID_ANY_SPACE_NAMES +
+                          const.VALID_ANY_DISCONTINUOUS_SPACE_NAMES +
+                          ["any_w2"])
+        if not isinstance(function_spaces, dict) or not all(
+                isinstance(name, str) and isinstance(space, str) and
+                name.lower() in generic_spaces and
+                space.lower() in LFRicKernelConstTrans.space_to_dofs
+                for name, space in function_spaces.items()):
+            raise TransformationError(
+                f"Error in LFRicKernelConstTrans transformation. The "
+                f"function_spaces argument must be a dict mapping generic "
+                f"function spaces to one of "
+                f"{list(LFRicKernelConstTrans.space_to_dofs.keys())} but "
+                f"found '{function_spaces}'.")
+
 
 class ACCEnterDataTrans(Transformation):
     '''